@@ -0,0 +1,56 @@
+# File: benchmarks/startup.py
+# Compares the cold start of the headless core package with launching the game.
+# Every measurement runs in a fresh interpreter, so nothing is already imported.
+#
+#   python benchmarks/startup.py [--runs 10]
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+
+SOURCES_DIR = Path(__file__).resolve().parent.parent / "sources"
+
+CASES = {
+    # Baseline interpreter start, subtracted from the other cases
+    "python": "pass",
+    # Importing the rules must never pull in pygame
+    "import core": "import sys, core; assert 'pygame' not in sys.modules, 'core imported pygame'",
+    # Launching main.py up to the first drawn frame (window, assets, fonts). No journal
+    # and no replay: those would time file recovery and write into the real saves folder
+    "launch main.py": "import main; main.Game(journal_path=None, replay_path=None).draw()",
+}
+
+
+def time_case(code, runs):
+    """Returns the run times in ms of `python -c code` started inside sources/."""
+    env = dict(os.environ, SDL_VIDEODRIVER="dummy", SDL_AUDIODRIVER="dummy",
+               PYGAME_HIDE_SUPPORT_PROMPT="1")
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", code], cwd=SOURCES_DIR, env=env,
+                       check=True, stdout=subprocess.DEVNULL)
+        times.append((time.perf_counter() - start) * 1000)
+    return times
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Cold start of the core package vs. launching the game.")
+    parser.add_argument("--runs", type=int, default=10, help="fresh interpreters per case")
+    args = parser.parse_args()
+
+    results = {name: time_case(code, args.runs) for name, code in CASES.items()}
+    baseline = statistics.median(results["python"])
+
+    print(f"{'case':<16}{'median ms':>12}{'min ms':>10}{'minus python':>14}")
+    for name, times in results.items():
+        median = statistics.median(times)
+        print(f"{name:<16}{median:>12.1f}{min(times):>10.1f}{median - baseline:>14.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,275 @@
+# File: benchmarks/suite.py
+# Times the rules, rendering and simulation hot paths and compares them with a
+# stored baseline. Results are written as JSON; the exit status is 1 when any
+# benchmark regressed by more than the threshold, so CI can fail on slowdowns.
+#
+#   python benchmarks/suite.py                      run, compare with baseline.json
+#   python benchmarks/suite.py --save-baseline      run and store the new baseline
+#   python benchmarks/suite.py --threshold 0.1 --output results.json --only draw
+import argparse
+import json
+import os
+import platform
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Everything runs headless: no window, no sound device
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+BENCH_DIR = Path(__file__).resolve().parent
+sys.path.insert(0, str(BENCH_DIR.parent / "sources"))
+
+import pygame
+import assets
+from board import Board
+from chess import ChessManager
+from core import Player
+from dice_policy import load_policy
+import main as game_main
+from simulator import simulate_games
+
+
+BASELINE_PATH = BENCH_DIR / "baseline.json"
+DEFAULT_THRESHOLD = 0.20
+
+
+def best_time(function, number, repeat=5):
+    """Best seconds per call of function() over repeat rounds of number calls."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            function()
+        best = min(best, (time.perf_counter() - start) / number)
+    return best
+
+
+# --- Benchmarks ---
+# Each returns (value, unit, higher_is_better)
+
+def bench_player_move():
+    player = Player(0, "Bench")
+    rolls = [random.Random(1).randint(1, 6) for _ in range(1000)]
+
+    def play():
+        for roll in rolls:
+            player.move(roll)
+            if player.position == 100:
+                player.position = 0
+    return best_time(play, 20) / len(rolls) * 1e9, "ns/call", False
+
+
+def bench_apply_snakes_ladders(board):
+    tiles = range(1, 100)
+
+    def lookup():
+        for tile in tiles:
+            board.apply_snakes_ladders(tile)
+    return best_time(lookup, 200) / len(tiles) * 1e9, "ns/call", False
+
+
+def bench_best_roll():
+    """Choice-of-dice bot: one lookup in the solved policy (solved or loaded before timing)."""
+    policy = load_policy()
+    rng = random.Random(1)
+    turns = [(rng.randint(0, 99), rng.randint(1, 6), rng.randint(1, 6)) for _ in range(1000)]
+
+    def lookup():
+        for position, first, second in turns:
+            policy.best_roll(position, first, second)
+    return best_time(lookup, 20) / len(turns) * 1e9, "ns/call", False
+
+
+def bench_get_tile_center(board):
+    tiles = range(0, 101)
+
+    def centers():
+        for tile in tiles:
+            board.get_tile_center(tile)
+    return best_time(centers, 200) / len(tiles) * 1e9, "ns/call", False
+
+
+def _frame_time(game, full, frames=100, repeat=5):
+    """Best mean ms of one Game.draw, with a move (not timed) between frames."""
+    renderer = game.renderer
+    if full:
+        game.renderer = None
+    best = float("inf")
+    for _ in range(repeat):
+        total = 0.0
+        for _ in range(frames):
+            if game.game_state != 'running':
+                game.reset_game()
+            game.handle_move(game.dice.roll())
+            start = time.perf_counter()
+            game.draw()
+            total += time.perf_counter() - start
+        best = min(best, total / frames)
+    game.renderer = renderer
+    return best * 1000
+
+
+def bench_draw_full(game):
+    return _frame_time(game, True), "ms/frame", False
+
+
+def bench_draw_dirty(game):
+    return _frame_time(game, False), "ms/frame", False
+
+
+def bench_draw_dirty_crowd(crowd):
+    """A dirty-rect frame of a 200-player table (fanned stacks, compact panel rows)."""
+    crowd.renderer.invalidate() # The other game drew on the shared display
+    return _frame_time(crowd, False), "ms/frame", False
+
+
+def _load_assets():
+    Board()
+    ChessManager(assets.load_atlas())
+
+
+def bench_assets_cold():
+    """Board and ChessManager with an empty asset cache (decode, smoothscale, write)."""
+    saved = assets.CACHE_DIR
+    times = []
+    try:
+        for _ in range(3):
+            with tempfile.TemporaryDirectory() as cache_dir:
+                assets.CACHE_DIR = Path(cache_dir)
+                start = time.perf_counter()
+                _load_assets()
+                times.append(time.perf_counter() - start)
+    finally:
+        assets.CACHE_DIR = saved
+    return min(times) * 1000, "ms", False
+
+
+def bench_assets_warm():
+    """Board and ChessManager when the on-disk cache is valid."""
+    saved = assets.CACHE_DIR
+    try:
+        with tempfile.TemporaryDirectory() as cache_dir:
+            assets.CACHE_DIR = Path(cache_dir)
+            _load_assets()
+            return best_time(_load_assets, 5) * 1000, "ms", False
+    finally:
+        assets.CACHE_DIR = saved
+
+
+def bench_autoplay_games(game, games=200):
+    """End-to-end games through Game.handle_move (rules, win chances), drawing only each end."""
+    start = time.perf_counter()
+    game.autoplay(games)
+    return games / (time.perf_counter() - start), "games/s", True
+
+
+def bench_simulator_games(games=200_000):
+    start = time.perf_counter()
+    simulate_games(games, 4, seed=1)
+    return games / (time.perf_counter() - start), "games/s", True
+
+
+def run_benchmarks(only=None):
+    pygame.init()
+    game = game_main.Game(bots=range(4), journal_path=None)
+    game.game_state = 'running'
+    game.animator.enabled = False  # Frames should time drawing, not waiting on animations
+    board = game.board
+    crowd = game_main.Game(bots=range(200), journal_path=None, num_players=200)
+    crowd.game_state = 'running'
+    crowd.animator.enabled = False
+
+    cases = {
+        "player_move": bench_player_move,
+        "apply_snakes_ladders": lambda: bench_apply_snakes_ladders(board),
+        "best_roll": bench_best_roll,
+        "get_tile_center": lambda: bench_get_tile_center(board),
+        "draw_full_frame": lambda: bench_draw_full(game),
+        "draw_dirty_frame": lambda: bench_draw_dirty(game),
+        "draw_dirty_frame_200": lambda: bench_draw_dirty_crowd(crowd),
+        "assets_cold": bench_assets_cold,
+        "assets_warm": bench_assets_warm,
+        "autoplay_games": lambda: bench_autoplay_games(game),
+        "simulator_games": bench_simulator_games,
+    }
+    results = {}
+    for name, case in cases.items():
+        if only and not any(part in name for part in only):
+            continue
+        value, unit, higher_is_better = case()
+        results[name] = {"value": value, "unit": unit, "higher_is_better": higher_is_better}
+        print(f"{name:<22}{value:>14,.3f} {unit}")
+    pygame.quit()
+    return results
+
+
+def compare(results, baseline, threshold):
+    """Returns the names of the benchmarks that are more than threshold worse than baseline."""
+    regressions = []
+    print(f"\n{'benchmark':<22}{'baseline':>14}{'now':>14}{'change':>10}")
+    for name, result in results.items():
+        base = baseline.get(name)
+        if base is None:
+            print(f"{name:<22}{'-':>14}{result['value']:>14,.3f}{'new':>10}")
+            continue
+        # Positive change is always worse: slower time or lower throughput
+        if result["higher_is_better"]:
+            change = base["value"] / result["value"] - 1
+        else:
+            change = result["value"] / base["value"] - 1
+        flag = "  REGRESSION" if change > threshold else ""
+        print(f"{name:<22}{base['value']:>14,.3f}{result['value']:>14,.3f}{change:>+10.1%}{flag}")
+        if flag:
+            regressions.append(name)
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Snakes and Ladders benchmark suite.")
+    parser.add_argument("--output", default=None, help="write the results as JSON to this file")
+    parser.add_argument("--baseline", default=str(BASELINE_PATH), help="baseline JSON to compare with")
+    parser.add_argument("--save-baseline", action="store_true", help="store this run as the baseline")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="allowed slowdown before failing, as a fraction (0.2 = 20%%)")
+    parser.add_argument("--only", nargs="*", default=None, help="run benchmarks whose name contains any of these")
+    args = parser.parse_args()
+
+    results = run_benchmarks(args.only)
+    report = {
+        "python": platform.python_version(),
+        "pygame": pygame.version.ver,
+        "platform": platform.platform(),
+        "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "results": results,
+    }
+    if args.output:
+        Path(args.output).write_text(json.dumps(report, indent=2) + "\n")
+    if args.save_baseline:
+        Path(args.baseline).write_text(json.dumps(report, indent=2) + "\n")
+        print(f"\nbaseline saved to {args.baseline}")
+        return 0
+
+    try:
+        baseline = json.loads(Path(args.baseline).read_text())["results"]
+    except (OSError, ValueError, KeyError):
+        print(f"\nno baseline at {args.baseline}; run with --save-baseline first")
+        return 0
+    regressions = compare(results, baseline, args.threshold)
+    missing = [name for name in results if name not in baseline]
+    if missing:
+        print(f"\nnot in the baseline, so not checked: {', '.join(missing)} (run --save-baseline)")
+    if regressions:
+        print(f"\n{len(regressions)} benchmark(s) regressed by more than {args.threshold:.0%}: "
+              + ", ".join(regressions))
+        return 1
+    print(f"\nno regressions above {args.threshold:.0%}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,185 @@
+# File: animation.py
+# Piece movement animation: tile-by-tile steps, then a slide down a snake or a
+# climb up a ladder. Paths are in board world pixels (the camera maps them to the
+# screen), the snake and ladder waypoints are computed once per board, and the
+# animations advance on a fixed simulation timestep, so a move takes the same
+# time whether the screen renders at 60 FPS or drops frames.
+import math
+import time
+
+from constants import ANIMATION_TIMESTEP_MS, STEP_TICKS, JUMP_PIXELS_PER_TICK, JUMP_MAX_TICKS
+
+
+class BoardPaths:
+    """
+    World pixel centers of the tiles and the waypoints of every snake and ladder of
+    one board. Tile centers are worked out on demand (board.world_center), so only
+    the snakes and ladders are stored, however many tiles the board has.
+    """
+
+    def __init__(self, board):
+        layout = board.layout
+        self.final_tile = layout.final_tile
+        # Integer pixels, so the drawn piece and its dirty rect always agree
+        self.center = board.world_center
+
+        # jump_points[t]: the points a piece passes after landing on t (chains included),
+        # jump_ticks[t]: the tick at which each of those points is reached
+        self.jump_points = {}
+        self.jump_ticks = {}
+        starts = {**layout.snakes, **layout.ladders}
+        for start in starts:
+            points = [self.center(start)]
+            tile = start
+            while tile in starts:
+                tile = starts[tile]
+                points.append(self.center(tile))
+            ticks = [0]
+            for a, b in zip(points, points[1:]):
+                ticks.append(ticks[-1] + min(max(STEP_TICKS, math.ceil(math.dist(a, b) / JUMP_PIXELS_PER_TICK)),
+                                             JUMP_MAX_TICKS))
+            self.jump_points[start] = tuple(points)
+            self.jump_ticks[start] = tuple(ticks)
+
+    def walk_tile(self, from_tile, step):
+        """
+        The tile step tiles into a walk from from_tile. Past the final tile the walk
+        goes back down, as a bounce finish (core/variants.py) counts the steps.
+        """
+        tile = from_tile + step
+        if tile > self.final_tile:
+            tile %= 2 * self.final_tile
+            if tile > self.final_tile:
+                tile = 2 * self.final_tile - tile
+        return tile
+
+    def duration(self, steps, landing):
+        """Number of ticks a move of steps tiles that lands on landing takes."""
+        jump = self.jump_ticks.get(landing)
+        return steps * STEP_TICKS + (jump[-1] if jump else 0)
+
+    def point_at(self, from_tile, steps, landing, tick, out):
+        """Writes the piece position tick ticks into the move into out (a 2-item list)."""
+        step_ticks = steps * STEP_TICKS
+        if tick < step_ticks:
+            step, rest = divmod(tick, STEP_TICKS)
+            a = self.center(self.walk_tile(from_tile, int(step)))
+            b = self.center(self.walk_tile(from_tile, int(step) + 1))
+            fraction = rest / STEP_TICKS
+        else:
+            points = self.jump_points.get(landing)
+            if points is None:
+                out[0], out[1] = self.center(landing)
+                return
+            ticks = self.jump_ticks[landing]
+            tick -= step_ticks
+            segment = 1
+            while segment < len(ticks) - 1 and tick >= ticks[segment]:
+                segment += 1
+            a = points[segment - 1]
+            b = points[segment]
+            fraction = min(1.0, (tick - ticks[segment - 1]) / (ticks[segment] - ticks[segment - 1]))
+        out[0] = int(round(a[0] + (b[0] - a[0]) * fraction))
+        out[1] = int(round(a[1] + (b[1] - a[1]) * fraction))
+
+
+# Paths are built once per board layout and tile geometry, then shared
+_paths_cache = {}
+
+
+def board_paths(board):
+    key = (board.layout, board.procedural, board.columns, board.tile_w, board.tile_h)
+    paths = _paths_cache.get(key)
+    if paths is None:
+        paths = _paths_cache[key] = BoardPaths(board)
+    return paths
+
+
+class PieceAnimator:
+    """
+    One animation slot per piece; every slot can run at the same time.
+    update() advances all slots in whole ANIMATION_TIMESTEP_MS ticks and keeps the
+    remainder for the next frame. All per-piece state lives in lists created
+    here, so a frame only overwrites numbers in place.
+    """
+
+    # A frame that arrives later than this (window dragged, debugger) is not replayed in full
+    MAX_CATCH_UP_MS = 250
+
+    def __init__(self, paths, count, timestep_ms=ANIMATION_TIMESTEP_MS):
+        self.paths = paths
+        self.timestep_ms = timestep_ms
+        self.enabled = True
+        self.active = [False] * count
+        self.points = [[0, 0] for _ in range(count)]
+        self._from = [0] * count
+        self._steps = [0] * count
+        self._landing = [0] * count
+        self._tick = [0] * count
+        self._total = [0] * count
+        self._running = 0
+        self._accumulator = 0.0
+        self._last_time = 0.0
+
+    def start(self, seat, from_tile, landing, steps=None):
+        """
+        Animates seat walking steps tiles from from_tile to landing, then along any
+        snake or ladder. A bounce finish walks up to the final tile and back down to
+        landing; steps defaults to a plain forward walk. landing 0 means the roll
+        did not move the piece (overshoot, waiting for a 6, forfeit).
+        """
+        if steps is None:
+            steps = landing - from_tile
+        if not self.enabled or not landing or steps <= 0:
+            return
+        if self._running == 0:
+            # Idle until now: count time from this moment, not from the last frame
+            self._last_time = time.perf_counter()
+            self._accumulator = 0.0
+        if not self.active[seat]:
+            self.active[seat] = True
+            self._running += 1
+        self._from[seat] = from_tile
+        self._steps[seat] = steps
+        self._landing[seat] = landing
+        self._tick[seat] = 0
+        self._total[seat] = self.paths.duration(steps, landing)
+        self.paths.point_at(from_tile, steps, landing, 0, self.points[seat])
+
+    def busy(self):
+        return self._running > 0
+
+    def update(self):
+        """Advances every running animation by the time since the last update."""
+        if self._running == 0:
+            return
+        now = time.perf_counter()
+        self._accumulator += min((now - self._last_time) * 1000, self.MAX_CATCH_UP_MS)
+        self._last_time = now
+        ticks, self._accumulator = divmod(self._accumulator, self.timestep_ms)
+        ticks = int(ticks)
+        # The leftover fraction of a tick smooths the drawn position between ticks
+        blend = self._accumulator / self.timestep_ms
+
+        for seat in range(len(self.active)):
+            if not self.active[seat]:
+                continue
+            self._tick[seat] += ticks
+            if self._tick[seat] >= self._total[seat]:
+                self.active[seat] = False
+                self._running -= 1
+                continue
+            self.paths.point_at(self._from[seat], self._steps[seat], self._landing[seat], self._tick[seat] + blend,
+                                self.points[seat])
+
+    def finish(self):
+        """Ends every animation at once (pieces jump to their tiles)."""
+        for seat in range(len(self.active)):
+            self.active[seat] = False
+        self._running = 0
+
+    def piece_center(self, seat, tile):
+        """Where seat's piece is, in world pixels: along its animation, or on its tile."""
+        if self.active[seat]:
+            return self.points[seat]
+        return self.paths.center(tile)
@@ -0,0 +1,174 @@
+# File: assets.py
+# Asset pipeline: the chess pieces and the dice graphic are packed into one atlas
+# surface, and the atlas and the scaled board are kept on disk already resized.
+# The cache is keyed by a hash of the source files and the target sizes, so a
+# later launch skips decoding and smoothscale entirely while the cache is valid.
+import hashlib
+import json
+import os
+from pathlib import Path
+
+import pygame
+from constants import BOARD_SIZE, CHESS_SIZE, CHESS_COUNT, DICE_SIZE
+
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+ASSETS_DIR = BASE_DIR / "assets"
+CACHE_DIR = BASE_DIR / "cache"
+
+# Bump when the cache layout changes so old files are rebuilt
+CACHE_VERSION = 1
+
+BOARD_FILE = "borad.jpg"
+DICE_FILE = "dice.jpg"
+CHESS_FILES = [f"chess{i}.png" for i in range(1, CHESS_COUNT + 1)]
+
+# Colors used when a chess piece image cannot be loaded
+FALLBACK_COLORS = [(255, 0, 0), (0, 0, 255), (0, 255, 0), (255, 255, 0)]
+
+
+class SpriteAtlas:
+    """One surface holding every sprite, plus the sub-rect of each named sprite."""
+
+    def __init__(self, surface, regions):
+        self.surface = surface
+        self.regions = regions
+
+    def draw(self, screen, name, center):
+        """Blits the named sprite centered on the given position."""
+        area = self.regions[name]
+        screen.blit(self.surface, area.move(center[0] - area.centerx, center[1] - area.centery), area)
+
+    def subsurface(self, name):
+        return self.surface.subsurface(self.regions[name])
+
+
+def cache_key(paths, sizes):
+    """Hash of the source file contents plus the sizes they are scaled to."""
+    digest = hashlib.sha1(f"v{CACHE_VERSION}".encode())
+    for path in paths:
+        digest.update(path.name.encode())
+        digest.update(path.read_bytes())
+    digest.update(repr(sizes).encode())
+    return digest.hexdigest()
+
+
+def _read_cache(name, key, format):
+    """Returns (surface, meta) from the cache, or None when missing or stale."""
+    meta_path = CACHE_DIR / f"{name}.json"
+    try:
+        meta = json.loads(meta_path.read_text())
+        if meta.get("key") != key:
+            return None
+        pixels = (CACHE_DIR / f"{name}.raw").read_bytes()
+        surface = pygame.image.frombuffer(pixels, tuple(meta["size"]), format)
+    except (OSError, ValueError, KeyError, pygame.error):
+        return None
+    return surface, meta
+
+
+def _write_cache(name, key, surface, format, **extra):
+    """Stores the raw pixels; a read-only install just runs without a cache."""
+    meta = {"key": key, "size": list(surface.get_size()), **extra}
+    try:
+        CACHE_DIR.mkdir(exist_ok=True)
+        raw_path = CACHE_DIR / f"{name}.raw"
+        tmp_path = raw_path.with_suffix(".tmp")
+        tmp_path.write_bytes(pygame.image.tostring(surface, format))
+        os.replace(tmp_path, raw_path)
+        # The meta file is written last, so a half-written cache never validates
+        (CACHE_DIR / f"{name}.json").write_text(json.dumps(meta))
+    except OSError as e:
+        print(f"Could not write asset cache: {e}")
+
+
+def _fallback_piece(color):
+    piece = pygame.Surface(CHESS_SIZE, pygame.SRCALPHA)
+    pygame.draw.circle(piece, color,
+                       (CHESS_SIZE[0] // 2, CHESS_SIZE[1] // 2),
+                       CHESS_SIZE[0] // 2 - 5)
+    return piece
+
+
+def _build_atlas():
+    """Decodes and scales every sprite, then packs them left to right."""
+    sprites = []
+    loaded_all = True
+    for i, filename in enumerate(CHESS_FILES):
+        try:
+            image = pygame.image.load(str(ASSETS_DIR / filename)).convert_alpha()
+            sprites.append((f"chess{i + 1}", pygame.transform.smoothscale(image, CHESS_SIZE)))
+        except (FileNotFoundError, pygame.error):
+            loaded_all = False
+            sprites.append((f"chess{i + 1}", _fallback_piece(FALLBACK_COLORS[i % len(FALLBACK_COLORS)])))
+    try:
+        image = pygame.image.load(str(ASSETS_DIR / DICE_FILE)).convert_alpha()
+        sprites.append(("dice", pygame.transform.smoothscale(image, DICE_SIZE)))
+    except (FileNotFoundError, pygame.error):
+        loaded_all = False
+
+    width = sum(sprite.get_width() for _, sprite in sprites)
+    height = max(sprite.get_height() for _, sprite in sprites)
+    surface = pygame.Surface((width, height), pygame.SRCALPHA)
+    regions = {}
+    x = 0
+    for name, sprite in sprites:
+        surface.blit(sprite, (x, 0))
+        regions[name] = pygame.Rect(x, 0, sprite.get_width(), sprite.get_height())
+        x += sprite.get_width()
+    return SpriteAtlas(surface.convert_alpha(), regions), loaded_all
+
+
+def load_atlas():
+    """Returns the sprite atlas, from the on-disk cache when it is still valid."""
+    sources = [ASSETS_DIR / filename for filename in CHESS_FILES + [DICE_FILE]]
+    try:
+        key = cache_key(sources, (CHESS_SIZE, DICE_SIZE))
+    except OSError:
+        key = None
+
+    if key is not None:
+        cached = _read_cache("atlas", key, "RGBA")
+        if cached is not None:
+            surface, meta = cached
+            regions = {name: pygame.Rect(rect) for name, rect in meta["regions"].items()}
+            return SpriteAtlas(surface.convert_alpha(), regions)
+
+    atlas, loaded_all = _build_atlas()
+    # Only cache real artwork, never the fallback circles
+    if key is not None and loaded_all:
+        regions = {name: list(rect) for name, rect in atlas.regions.items()}
+        _write_cache("atlas", key, atlas.surface, "RGBA", regions=regions)
+    return atlas
+
+
+def load_board_image():
+    """Returns the board scaled to BOARD_SIZE, from the on-disk cache when valid."""
+    source = ASSETS_DIR / BOARD_FILE
+    try:
+        key = cache_key([source], BOARD_SIZE)
+    except OSError:
+        key = None
+
+    if key is not None:
+        cached = _read_cache("board", key, "RGB")
+        if cached is not None:
+            return cached[0].convert()
+
+    try:
+        image = pygame.image.load(str(source)).convert()
+        print(f"Successfully loaded board image: {source}")
+    except (FileNotFoundError, pygame.error) as e:
+        # Handle Pygame errors (e.g., file not found or corrupted)
+        print(f"Pygame load error: {e}")
+        print(" Warning: Using temporary background. Check your image path and file.")
+
+        # Create a temporary fallback board (Orange/Brown)
+        image = pygame.Surface(BOARD_SIZE)
+        image.fill((200, 150, 100))
+        return image
+
+    image = pygame.transform.smoothscale(image, BOARD_SIZE)
+    if key is not None:
+        _write_cache("board", key, image, "RGB")
+    return image
@@ -1,110 +1,279 @@
 # File: board.py
+import math
+
 import pygame
 from constants import BOARD_POS, BOARD_SIZE, TILE_COUNT
-from pathlib import Path
 from constants import BOARD_SIZE, BOARD_POS # Duplicated import, but kept as in original
-
-
-BASE_DIR = Path(__file__).resolve().parent.parent
+from constants import TILE_PIXELS, ZOOM_LEVELS, BLACK
+from assets import load_board_image
+from camera import Camera
 
 
 
 # --- Snakes and Ladders Mapping (start -> end) ---
-# Note: These values define the game's movement rules.
-SNAKES = {34:1,25:5,87:57,47:19,91:61,99:69}
-LADDERS ={3:57,6:27,20:70,63:95,68:98,36:95}
+# Layouts live in core/layout.py (loaded from board files) so the headless tools
+# can read them without pygame; CLASSIC is the board the image shows.
+from core import CLASSIC
 
 
+# --- Procedural board look ---
+# Every other board is drawn from a few cached surfaces (a checkerboard one tile
+# larger than the view and the goal tile per tile size, ten digits per font), so
+# drawing costs the same on 100 tiles as on 100,000: only what is in view is blitted.
+TILE_COLORS = ((240, 226, 190), (214, 190, 140), (255, 215, 0))  # light, dark, final tile
+TILE_BORDER = (150, 130, 95)
+VIEW_BACKGROUND = (60, 60, 60)
+LADDER_COLOR = (139, 90, 43)
+SNAKE_COLOR = (200, 40, 40)
+# Smallest tile size, in pixels, that still gets its number and ladder rungs drawn
+DETAIL_MIN_TILE = 24
+# Snakes and ladders are indexed by the bands of rows they cross, so the visible
+# ones are found without looking at the others
+JUMP_BAND_ROWS = 8
 
 
 
 
 # --- Core Class ---
 class Board:
-    def __init__(self):
-        
-        # Using an absolute path to load the image for stability
-        # IMPORTANT: Adjust this path to your actual file location!
-        IMAGE_PATH = BASE_DIR / "assets" / "borad.jpg"
+    def __init__(self, layout=CLASSIC):
         
-        try:
-            # Load the image using the Path object converted to string
-            self.image = pygame.image.load(str(IMAGE_PATH)).convert()
-            print(f"Successfully loaded board image: {IMAGE_PATH}")
-
-
-        except pygame.error as e:
-            # Handle Pygame errors (e.g., file not found or corrupted)
-            print(f"Pygame load error: {e}")
-            print(" Warning: Using temporary background. Check your image path and file.")
-            
-            # Create a temporary fallback board (Orange/Brown)
-            self.image = pygame.Surface(BOARD_SIZE)
-            self.image.fill((200, 150, 100))
-        
-
+        # Snakes, ladders, size and the compiled jump table
+        self.layout = layout
+        self.final_tile = layout.final_tile
 
-        # Initialize board dimensions and scaling
-        self.image = pygame.transform.smoothscale(self.image, BOARD_SIZE)
+        # Initialize board dimensions (the on-screen board view)
         self.x, self.y = BOARD_POS
         self.w, self.h = BOARD_SIZE
-
-
-
-        # Pre-calculate tile dimensions for quick access
-        self.tile_w = self.w / TILE_COUNT
-        self.tile_h = self.h / TILE_COUNT
+        self.view = pygame.Rect(self.x, self.y, self.w, self.h)
+
+        if layout == CLASSIC:
+            # The board image comes pre-scaled to BOARD_SIZE from the asset cache
+            # (decoded and smoothscaled only when the cache is missing or stale).
+            # It shows the classic board, so it is drawn as is and never scrolls.
+            self.image = load_board_image()
+            self.columns = TILE_COUNT
+            self.rows = -(-self.final_tile // TILE_COUNT)
+            self.tile_w = self.w / TILE_COUNT
+            self.tile_h = self.h / self.rows
+            zoom_levels = (1.0,)
+        else:
+            # Any other board is drawn procedurally; huge event boards are laid out
+            # about square, and the camera shows the part around the current player
+            self.image = None
+            self.columns = TILE_COUNT if self.final_tile <= TILE_COUNT * TILE_COUNT \
+                else math.ceil(math.sqrt(self.final_tile))
+            self.rows = -(-self.final_tile // self.columns)
+            self.tile_w = self.tile_h = TILE_PIXELS
+            zoom_levels = ZOOM_LEVELS
+        self.procedural = self.image is None
+
+        # World coordinates are board pixels at zoom 1; the camera maps them to the screen
+        self.camera = Camera(self.view, (self.columns * self.tile_w, self.rows * self.tile_h),
+                             self.tile_w, zoom_levels)
+
+        if self.image is not None:
+            # The picture never scrolls, so its screen centers are worked out once
+            self._screen_centers = [self.camera.to_screen(self.world_center(tile))
+                                    for tile in range(self.final_tile + 1)]
+        else:
+            self._view_surface = pygame.Surface(self.view.size)
+            self._view_key = None
+            self._tile_surfaces = {}   # tile size -> (light, dark, final) surfaces
+            self._pattern = None       # checkerboard at the current tile size
+            self._digits = {}          # tile size -> ten digit surfaces, or None when too small
+            self._jump_bands = self._index_jumps()
 
 
     def draw(self, screen):
-        """Draw the scaled board background image onto the screen."""
-        screen.blit(self.image, (self.x, self.y))
-
-
-    def get_tile_center(self, position):
+        """Draw the scaled board background image, or the visible part of a procedural board."""
+        if self.image is not None:
+            screen.blit(self.image, (self.x, self.y))
+            return
+        key = self.camera.key()
+        if key != self._view_key:
+            self._render_view()
+            self._view_key = key
+        screen.blit(self._view_surface, self.view)
+
+
+    def world_center(self, position):
         """
-        Calculates the center pixel coordinates (x, y) for a given tile number (1-100).
+        Center of a tile in world pixels (integers), so a piece drawn there and its
+        dirty rect always agree.
         --- Logic: All rows proceed Left-to-Right (NO Boustrophedon/Snakes and Ladders zigzag) ---
         """
-        if position < 1 or position > 100:
-            # Return a safe fallback position if input is out of bounds
-            return BOARD_POS 
+        if position < 1 or position > self.final_tile:
+            # Off the board: the image board's top-left corner as before, or
+            # just below tile 1 on a procedural board (where the pieces wait)
+            return (0, 0) if self.image is not None else (0, self.rows * self.tile_h)
 
-        # Calculate tile dimensions (using constants for 10x10 grid)
-        tile_width = BOARD_SIZE[0] / 10
-        tile_height = BOARD_SIZE[1] / 10
+        # 1. Determine the row index (row_index): 0 is the bottom row (1-10 on the classic board)
+        row_index, col_index = divmod(position - 1, self.columns)
 
-        # 1. Determine the row index (row_index): 0 is the bottom row (1-10), 9 is the top row (91-100)
-        row_index = (position - 1) // 10 
-        col_index = (position - 1) % 10
-        
-
-        # 3. Calculate the screen Y index (screen_y_index)
-        screen_y_index = 9 - row_index 
-        
+        # 2. Calculate the world Y index (screen_y_index), 0 is the top row
+        screen_y_index = self.rows - 1 - row_index
 
-        # 4. Calculate the pixel center coordinates
-
-
-        # Center X = Board Start X + (Column Index * Tile Width) + (Half Tile Width)
-        center_x = BOARD_POS[0] + (col_index * tile_width) + (tile_width / 2)
-
-
-        # Center Y = Board Start Y + (Screen Y Index * Tile Height) + (Half Tile Height)
-        center_y = BOARD_POS[1] + (screen_y_index * tile_height) + (tile_height / 2)
-
-        return (center_x, center_y)
+        # 3. Center = (index * tile size) + half a tile, rounded
+        return (int(col_index * self.tile_w + self.tile_w / 2 + 0.5),
+                int(screen_y_index * self.tile_h + self.tile_h / 2 + 0.5))
 
 
+    def to_screen(self, point):
+        """Screen pixel of a world point (where the camera currently shows it)."""
+        return self.camera.to_screen(point)
 
 
+    def get_tile_center(self, position):
+        """
+        Calculates the center pixel coordinates (x, y) on screen for a given tile
+        number (1-final tile); off-board positions give the board's start corner.
+        """
+        if self.image is not None and 0 <= position <= self.final_tile:
+            return self._screen_centers[position]
+        return self.camera.to_screen(self.world_center(position))
 
 
     def apply_snakes_ladders(self, pos):
         """Returns the final position and the jump type after hitting a snake or ladder."""
-        if pos in LADDERS:
-            return LADDERS[pos], 'ladder'
-        if pos in SNAKES:
-            return SNAKES[pos], 'snake'
-        # If no rule applies, the position stays the same, and the type is None
-        return pos, None
\ No newline at end of file
+        # One lookup in the sparse jump table (chains already resolved)
+        return self.layout.apply_snakes_ladders(pos)
+
+
+    # --- Procedural drawing ---
+    def _index_jumps(self):
+        """
+        Every snake and ladder as (start x, y, end x, y in world pixels, colour),
+        listed in each band of JUMP_BAND_ROWS rows it crosses.
+        """
+        bands = {}
+        kinds = [(self.layout.snakes, SNAKE_COLOR), (self.layout.ladders, LADDER_COLOR)]
+        for pairs, color in kinds:
+            for start, end in pairs.items():
+                jump = self.world_center(start) + self.world_center(end) + (color,)
+                rows = sorted(self.rows - 1 - (tile - 1) // self.columns for tile in (start, end))
+                for band in range(rows[0] // JUMP_BAND_ROWS, rows[1] // JUMP_BAND_ROWS + 1):
+                    bands.setdefault(band, []).append(jump)
+        return bands
+
+    def _tiles_for(self, size):
+        """The tile surfaces at one tile size, made on first use."""
+        tiles = self._tile_surfaces.get(size)
+        if tiles is None:
+            tiles = []
+            for color in TILE_COLORS:
+                tile = pygame.Surface((size, size))
+                tile.fill(TILE_BORDER)
+                tile.fill(color, (1, 1, size - 2, size - 2))
+                tiles.append(tile)
+            tiles = self._tile_surfaces[size] = tuple(tiles)
+        return tiles
+
+    def _pattern_for(self, size):
+        """
+        Checkerboard of tiles covering the view with a tile to spare each way, plus
+        one column to shift the colours by, so all visible tiles are one blit.
+        Only the current tile size is kept.
+        """
+        if self._pattern is None or self._pattern[0] != size:
+            across = self.view.w // size + 3
+            down = self.view.h // size + 2
+            light, dark, _ = self._tiles_for(size)
+            pattern = pygame.Surface((across * size, down * size))
+            pattern.blits([((light, dark)[(i + j) & 1], (i * size, j * size))
+                           for i in range(across) for j in range(down)], doreturn=False)
+            self._pattern = size, pattern
+        return self._pattern[1]
+
+    def _digits_for(self, size):
+        """The digits 0-9 in a font that fits the tile size, or None for tiles too small to number."""
+        if size not in self._digits:
+            digits = None
+            if size >= DETAIL_MIN_TILE:
+                font = pygame.font.Font(None, max(14, size // 3))
+                digits = tuple(font.render(str(digit), True, BLACK) for digit in range(10))
+            self._digits[size] = digits
+        return self._digits[size]
+
+    def _render_view(self):
+        """Redraws the view surface: the tiles, numbers, snakes and ladders in view, and nothing else."""
+        surface = self._view_surface
+        surface.fill(VIEW_BACKGROUND)
+        size = self.camera.tile_size
+        ox, oy = self.camera.offset()
+        view_w, view_h = self.view.size
+
+        # Visible columns, and visible rows counted from the top
+        first_col = max(ox // size, 0)
+        last_col = min((ox + view_w - 1) // size, self.columns - 1)
+        first_row = max(oy // size, 0)
+        last_row = min((oy + view_h - 1) // size, self.rows - 1)
+
+        if first_col > last_col or first_row > last_row:
+            return
+        # Tile (row, col) is light or dark by (row + col) parity, as in the pattern
+        shift = (first_row + first_col) & 1
+        surface.blit(self._pattern_for(size), (first_col * size - ox, first_row * size - oy),
+                     (shift * size, 0, (last_col - first_col + 1) * size, (last_row - first_row + 1) * size))
+        if first_row == 0:
+            # The top row ends at the final tile: clear the unused tiles, mark the goal
+            goal_col = (self.final_tile - 1) % self.columns
+            if goal_col < last_col:
+                surface.fill(VIEW_BACKGROUND, ((goal_col + 1) * size - ox, -oy, (last_col - goal_col) * size, size))
+            if goal_col >= first_col:
+                surface.blit(self._tiles_for(size)[2], (goal_col * size - ox, -oy))
+
+        digits = self._digits_for(size)
+        if digits is not None:
+            blits = []
+            for screen_row in range(first_row, last_row + 1):
+                first_tile = (self.rows - 1 - screen_row) * self.columns + 1
+                y = screen_row * size - oy + 2
+                for col in range(first_col, min(last_col, self.final_tile - first_tile) + 1):
+                    x = col * size - ox + 3
+                    for digit in str(first_tile + col):
+                        glyph = digits[ord(digit) - 48]
+                        blits.append((glyph, (x, y)))
+                        x += glyph.get_width()
+            surface.blits(blits, doreturn=False)
+
+        # Snakes and ladders crossing the visible bands of rows; only the part of
+        # each line inside the view (plus a tile for the line widths) is drawn
+        scale = self.camera.scale
+        bounds = surface.get_rect().inflate(2 * size, 2 * size)
+        seen = set()
+        for band in range(first_row // JUMP_BAND_ROWS, last_row // JUMP_BAND_ROWS + 1):
+            for jump in self._jump_bands.get(band, ()):
+                if jump in seen:
+                    continue
+                seen.add(jump)
+                x1, y1, x2, y2, color = jump
+                x1, y1, x2, y2 = x1 * scale - ox, y1 * scale - oy, x2 * scale - ox, y2 * scale - oy
+                visible = bounds.clipline(x1, y1, x2, y2)
+                if visible:
+                    self._draw_jump(surface, x1, y1, x2, y2, visible, color, size)
+
+    def _draw_jump(self, surface, x1, y1, x2, y2, visible, color, size):
+        length = math.hypot(x2 - x1, y2 - y1) or 1
+        if color == LADDER_COLOR:
+            # Two rails and a rung every third of a tile
+            (ax, ay), (bx, by) = visible
+            nx, ny = (y1 - y2) / length * size * 0.15, (x2 - x1) / length * size * 0.15
+            width = max(1, size // 20)
+            pygame.draw.line(surface, color, (ax + nx, ay + ny), (bx + nx, by + ny), width)
+            pygame.draw.line(surface, color, (ax - nx, ay - ny), (bx - nx, by - ny), width)
+            if size < DETAIL_MIN_TILE:
+                return
+            # Rungs stay at the same places along the whole ladder while it scrolls
+            rungs = int(length / max(size / 3, 4))
+            spacing = length / max(rungs, 1)
+            first = math.hypot(ax - x1, ay - y1) / spacing
+            last = math.hypot(bx - x1, by - y1) / spacing
+            for i in range(max(1, math.ceil(min(first, last))), min(rungs - 1, int(max(first, last))) + 1):
+                t = i / rungs
+                x, y = x1 + (x2 - x1) * t, y1 + (y2 - y1) * t
+                pygame.draw.line(surface, color, (x + nx, y + ny), (x - nx, y - ny), width)
+        else:
+            # Body from the head (start) down to the tail, head drawn as a dot
+            pygame.draw.line(surface, color, (x1, y1), (x2, y2), max(2, size // 8))
+            pygame.draw.circle(surface, color, (x1, y1), max(3, size // 6))
@@ -0,0 +1,123 @@
+# File: camera.py
+# Camera over a board that does not fit the screen: which part of the board
+# world (pixels at zoom 1) the board view shows, at which zoom, and how it eases
+# after the piece it follows. The zoom steps are rounded to a whole number of
+# pixels per tile, so tiles, numbers and pieces always line up without seams.
+import math
+import time
+
+import pygame
+
+from constants import ZOOM_LEVELS, CAMERA_EASE_MS
+
+
+class Camera:
+    """
+    Maps world points to the screen inside view. x, y is the world point at the
+    view's top-left corner; follow() and update() glide it towards a target,
+    scroll() and zoom_by() move it by hand (which stops the following).
+    """
+
+    # A frame that arrives later than this does not jump the camera all the way
+    MAX_CATCH_UP_MS = 250
+
+    def __init__(self, view, world_size, tile_pixels, zoom_levels=ZOOM_LEVELS):
+        self.view = pygame.Rect(view)
+        self.world_w, self.world_h = world_size
+        self.tile_pixels = tile_pixels
+        self.zoom_levels = zoom_levels
+        self.zoom_index = zoom_levels.index(1.0) if 1.0 in zoom_levels else 0
+        self.following = True
+        self._target = None
+        self._last_time = None
+        self._set_scale()
+        self._move_to(*self._clamped(0.0, 0.0))
+
+    def _set_scale(self):
+        self.tile_size = max(4, round(self.tile_pixels * self.zoom_levels[self.zoom_index]))
+        self.scale = self.tile_size / self.tile_pixels
+
+    def _move_to(self, x, y):
+        """Sets x, y and the integer offsets every to_screen call uses."""
+        self.x, self.y = x, y
+        self._offset = round(x * self.scale), round(y * self.scale)
+        self._left = self.view.x - self._offset[0]
+        self._top = self.view.y - self._offset[1]
+
+    # --- Mapping ---
+    def offset(self):
+        """Screen pixels from the world origin to the view's top-left corner, as integers."""
+        return self._offset
+
+    def key(self):
+        """Changes exactly when the view shows something else (for redraws)."""
+        return self._offset + (self.tile_size,)
+
+    def to_screen(self, point):
+        return self._left + round(point[0] * self.scale), self._top + round(point[1] * self.scale)
+
+    def to_world(self, point):
+        return ((point[0] - self.view.x) / self.scale + self.x,
+                (point[1] - self.view.y) / self.scale + self.y)
+
+    def _clamped(self, x, y):
+        """x, y moved so the view stays on the world; a world smaller than the view is centered."""
+        result = []
+        for value, size, span in ((x, self.world_w, self.view.w), (y, self.world_h, self.view.h)):
+            span /= self.scale
+            if size <= span:
+                result.append((size - span) / 2)
+            else:
+                result.append(min(max(value, 0.0), size - span))
+        return result
+
+    # --- Moving by hand ---
+    def scroll(self, dx, dy):
+        """Moves the view by dx, dy screen pixels and stops following."""
+        self.following = False
+        self._move_to(*self._clamped(self.x + dx / self.scale, self.y + dy / self.scale))
+
+    def zoom_by(self, steps, anchor=None):
+        """Zooms steps levels in (negative: out), keeping the world point under anchor in place."""
+        index = min(max(self.zoom_index + steps, 0), len(self.zoom_levels) - 1)
+        if index == self.zoom_index:
+            return False
+        anchor = anchor if anchor is not None and self.view.collidepoint(anchor) else self.view.center
+        world_x, world_y = self.to_world(anchor)
+        self.zoom_index = index
+        self._set_scale()
+        self._move_to(*self._clamped(world_x - (anchor[0] - self.view.x) / self.scale,
+                                     world_y - (anchor[1] - self.view.y) / self.scale))
+        return True
+
+    # --- Following ---
+    def follow(self, point):
+        """Sets the world point the camera glides to while following."""
+        self._target = point
+
+    def _goal(self):
+        return self._clamped(self._target[0] - self.view.w / 2 / self.scale,
+                             self._target[1] - self.view.h / 2 / self.scale)
+
+    def settled(self):
+        """Whether the camera is not gliding anywhere."""
+        return not self.following or self._target is None or [self.x, self.y] == self._goal()
+
+    def update(self):
+        """Glides towards the followed point by the time since the last update."""
+        if self.settled():
+            self._last_time = None
+            return
+        now = time.perf_counter()
+        # Idle until now: start from one frame's worth of movement
+        elapsed = 1000 / 60 if self._last_time is None else min((now - self._last_time) * 1000, self.MAX_CATCH_UP_MS)
+        self._last_time = now
+        fraction = 1 - math.exp(-elapsed / CAMERA_EASE_MS)
+        goal = self._goal()
+        position = [self.x, self.y]
+        for i in range(2):
+            position[i] += (goal[i] - position[i]) * fraction
+            # Snap the last half pixel, so the camera comes to rest
+            if abs(goal[i] - position[i]) * self.scale < 0.5:
+                position[i] = goal[i]
+        self._move_to(*position)
@@ -1,52 +1,77 @@
+import math
+from collections import OrderedDict
+from functools import lru_cache
+
 import pygame
-from constants import CHESS_SIZE, CHESS_COUNT
-from pathlib import Path
-import sys
+from constants import CHESS_COUNT
+from assets import load_atlas
+from core import player_color
+
+# Scaled pieces kept for stacks and compact panel rows; past this the oldest go
+MAX_SCALED_PIECES = 1024
+
+
+@lru_cache(maxsize=256)
+def fan_offsets(count, tile_size, piece_size):
+    """
+    Piece size and offsets from the tile center for count pieces resting on one
+    tile: a grid that fits the tile, so no piece covers another. One piece keeps
+    its full size in the middle.
+    """
+    if count <= 1:
+        return piece_size, ((0, 0),)
+    across = math.ceil(math.sqrt(count))
+    down = -(-count // across)
+    cell = tile_size / across
+    size = max(4, min(piece_size, int(cell)))
+    return size, tuple((round((i % across - (across - 1) / 2) * cell), round((i // across - (down - 1) / 2) * cell))
+                       for i in range(count))
+
 
 class ChessManager:
-    def __init__(self):
-        self.chess_pieces = self._load_chess_pieces()
-    
-    def _load_chess_pieces(self):
-        pieces = []
-      
-        try:
-            current_dir = Path(__file__).parent.resolve()
-            project_root = current_dir.parent
-            ASSETS_DIR = project_root / "assets"
-            
-            for i in range(1, CHESS_COUNT + 1):
-               
-                filename = f"chess{i}.png"
-                image_path = ASSETS_DIR / filename
-                
-                piece_surface = pygame.image.load(str(image_path)).convert_alpha()
-                
-                piece_surface = pygame.transform.smoothscale(piece_surface, CHESS_SIZE)
-                pieces.append(piece_surface)
-            
-            print("Successfully loaded four chess piece images。")
-            return pieces
-        
-        except (FileNotFoundError, pygame.error, NameError) as e:
-        
-            colors = [(255, 0, 0), (0, 0, 255), (0, 255, 0), (255, 255, 0)]
-            for color in colors:
-                piece = pygame.Surface(CHESS_SIZE, pygame.SRCALPHA)
-                pygame.draw.circle(piece, color, 
-                                 (CHESS_SIZE[0]//2, CHESS_SIZE[1]//2), 
-                                 CHESS_SIZE[0]//2 - 5)
-                pieces.append(piece)
-            return pieces
-
-    def get_chess_piece(self, player_id):
-        
-        if 0 <= player_id < len(self.chess_pieces):
-            return self.chess_pieces[player_id]
-        return self.chess_pieces[0]
+    def __init__(self, atlas=None):
+        # All pieces live in one atlas surface; drawing blits their sub-rects
+        self.atlas = atlas if atlas is not None else load_atlas()
+        self.piece_names = [f"chess{i}" for i in range(1, CHESS_COUNT + 1)]
+        self.chess_pieces = [self.atlas.subsurface(name) for name in self.piece_names]
+        # Players past the CHESS_COUNT images get a tinted copy of one of them
+        self._tinted = {}
+        self._scaled = OrderedDict()
+
+    def _tinted_piece(self, player_id):
+        piece = self._tinted.get(player_id)
+        if piece is None:
+            # Grey version of the image, multiplied by the player's colour
+            piece = pygame.transform.grayscale(self.chess_pieces[player_id % CHESS_COUNT])
+            piece.fill(player_color(player_id), special_flags=pygame.BLEND_RGB_MULT)
+            self._tinted[player_id] = piece
+        return piece
+
+    def get_chess_piece(self, player_id, size=None):
+        """The piece of a player, scaled to size x size pixels when given."""
+        if player_id < 0:
+            player_id = 0
+        if player_id < len(self.chess_pieces):
+            piece = self.chess_pieces[player_id]
+        else:
+            piece = self._tinted_piece(player_id)
+        if size is None or size == piece.get_width():
+            return piece
+
+        key = (player_id, size)
+        scaled = self._scaled.get(key)
+        if scaled is None:
+            scaled = self._scaled[key] = pygame.transform.smoothscale(piece, (size, size))
+            if len(self._scaled) > MAX_SCALED_PIECES:
+                self._scaled.popitem(last=False)
+        else:
+            self._scaled.move_to_end(key)
+        return scaled
     
     def draw_chess_piece(self, screen, player_id, position):
         
-        chess_piece = self.get_chess_piece(player_id)
-        rect = chess_piece.get_rect(center=position)
-        screen.blit(chess_piece, rect)
\ No newline at end of file
+        if not 0 <= player_id < len(self.piece_names):
+            piece = self.get_chess_piece(player_id)
+            screen.blit(piece, piece.get_rect(center=position))
+            return
+        self.atlas.draw(screen, self.piece_names[player_id], position)
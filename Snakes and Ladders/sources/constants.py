@@ -1,19 +1,56 @@
-import pygame
-
-
-
 SCREEN_WIDTH = 800
 SCREEN_HEIGHT = 700
 FPS = 60 
+# How long the main loop may sleep waiting for input when nothing is animating
+IDLE_TIMEOUT_MS = 500
 
 BOARD_POS = (100, 50) 
 BOARD_SIZE = (600, 600)
 TILE_COUNT = 10
+# Boards other than the classic picture are drawn tile by tile in a scrolling view
+# (see board.py and camera.py): tile size at zoom 1, the zoom steps and how fast
+# the camera catches up with the piece it follows
+TILE_PIXELS = 60
+ZOOM_LEVELS = (0.25, 0.5, 0.75, 1.0, 1.5, 2.0)
+CAMERA_EASE_MS = 100
+# Exact win chances are only worked out up to this board size (the solve grows steeply with the tiles)
+WIN_ODDS_MAX_TILES = 200
+# Board layout file (.json or .toml, see core/layout.py); None plays the classic board
+LAYOUT_FILE = None
+# House rules, e.g. "bounce,extra-six,three-sixes,start-six" (see core/variants.py); "" plays the standard rules
+RULES = ""
+# Choice-of-dice variant (main.py --choose-dice): two dice per roll, the player moves by
+# either; bots play the best choice from dice_policy.py and the hint (H) shows it to people
+CHOOSE_DICE = False
+SHOW_HINTS = True
 
 
 CHESS_SIZE = (40, 40) 
 CHESS_COUNT = 4 
+# Players at the table (main.py --players); seats past CHESS_COUNT get tinted pieces.
+# Player counts are one byte in replay and journal headers.
+NUM_PLAYERS = 4
+MAX_PLAYERS = 255
+
+DICE_SIZE = (80, 80)
+# Seed of the counter-based dice; None picks a new one every launch
+DICE_SEED = None
+# File that every dice roll is recorded to (see replay.py); None records nothing
+REPLAY_PATH = None
+# Crash-safe save of the local game (see journal.py), kept in the saves folder; None turns it off
+JOURNAL_PATH = "journal.slj"
 
+# Pause between two bot turns (main.py --speed sets it from turns per second)
+BOT_TURN_DELAY_MS = 500
+# How long a table of only bots shows the end screen before the next game
+BOT_RESTART_DELAY_MS = 2000
+
+# Piece animation: fixed simulation step, ticks per tile stepped and snake/ladder speed
+ANIMATION_TIMESTEP_MS = 1000 / 120
+STEP_TICKS = 12
+JUMP_PIXELS_PER_TICK = 6
+# Longest slide or climb, in ticks, however far the snake or ladder reaches on a huge board
+JUMP_MAX_TICKS = 180
 
 WHITE = (255, 255, 255)
 BLACK = (0, 0, 0)
@@ -21,3 +58,12 @@ GREEN = (0, 200, 0)
 RED = (200, 0, 0)
 
 INFO_PANEL_WIDTH = 120 
+# Info panel rows: the classic rows for up to four players, compact ones that
+# scroll (mouse wheel over the panel) for bigger tables
+PANEL_ROW_HEIGHT = 120
+COMPACT_ROW_HEIGHT = 36
+COMPACT_ICON_SIZE = 24
+
+
+# Redraw only the changed screen regions instead of the whole frame
+DIRTY_RECT_RENDERING = True
@@ -0,0 +1,9 @@
+# Headless core of the game: rules, players and turn logic.
+# Nothing in this package imports pygame, so tools that only need the rules
+# (simulators, solvers, servers) start without loading SDL.
+from .rules import SNAKES, LADDERS, FINAL_TILE, apply_snakes_ladders, apply_roll, advance
+from .layout import BoardLayout, BoardError, CLASSIC, generate_board, load_board, parse_board, save_board
+from .variants import RuleSet, RuleError, MoveTable, STANDARD, FINISH_EXACT, FINISH_BOUNCE, move_table, parse_rules
+from .player import Player, player_color
+from .state import GameState
+from .turns import TurnResult, take_turn
@@ -0,0 +1,212 @@
+# File: core/layout.py
+# Board layouts loaded from JSON or TOML files, with their jumps resolved into a
+# sparse table: memory grows with the number of snakes and ladders, not with the
+# number of tiles, so event boards with tens of thousands of tiles stay small.
+#
+# File format (the TOML version uses the same keys):
+#   {
+#     "name": "Classic",
+#     "size": 100,                        number of tiles; the last one is the goal
+#     "snakes":  [[34, 1], [25, 5]],      [head, tail] pairs
+#     "ladders": [[3, 57], [6, 27]]       [foot, top] pairs
+#   }
+import json
+import random
+from pathlib import Path
+
+from .rules import SNAKES, LADDERS, FINAL_TILE
+
+
+# Jump type of each code stored per tile in the compiled layout
+MOVE_TYPES = (None, 'ladder', 'snake')
+
+
+class BoardError(ValueError):
+    """Raised when a board file is unreadable or describes an impossible board."""
+
+
+class BoardLayout:
+    """
+    A validated board: its size, snakes and ladders, and the resolved jump table.
+    jumps maps every snake head and ladder foot to the tile a player ends on after
+    landing there, with chains (a ladder top on a snake head, ...) already followed,
+    so a move is one dict lookup; tiles without a jump are not stored.
+    """
+
+    def __init__(self, snakes, ladders, final_tile=FINAL_TILE, name="Custom"):
+        self.name = name
+        self.final_tile = final_tile
+        self.snakes = dict(snakes)
+        self.ladders = dict(ladders)
+        self._validate()
+        self.jumps, self._move_codes = self._compile()
+        # What apply_snakes_ladders returns for each jump start
+        self._results = {start: (end, MOVE_TYPES[self._move_codes[start]]) for start, end in self.jumps.items()}
+        self._key = (self.final_tile, tuple(sorted(self.snakes.items())), tuple(sorted(self.ladders.items())))
+        self._hash = hash(self._key)
+
+    def _validate(self):
+        if not isinstance(self.final_tile, int) or self.final_tile < 2:
+            raise BoardError(f"board size must be an integer of at least 2, got {self.final_tile!r}")
+        for kind, pairs in (("snake", self.snakes), ("ladder", self.ladders)):
+            for start, end in pairs.items():
+                if not isinstance(start, int) or not isinstance(end, int):
+                    raise BoardError(f"{kind} {start}->{end}: tiles must be integers")
+                # Nothing can start on the goal; tile 0 is off the board
+                if not 1 <= start < self.final_tile or not 1 <= end <= self.final_tile:
+                    raise BoardError(f"{kind} {start}->{end} is outside tiles 1..{self.final_tile}")
+                if kind == "snake" and end >= start:
+                    raise BoardError(f"snake {start}->{end} must go down")
+                if kind == "ladder" and end <= start:
+                    raise BoardError(f"ladder {start}->{end} must go up")
+        overlap = self.snakes.keys() & self.ladders.keys()
+        if overlap:
+            raise BoardError(f"tiles {sorted(overlap)} start both a snake and a ladder")
+
+    def _compile(self):
+        """Follows every chain of jumps to its end; a chain that loops is an error."""
+        starts = {**self.snakes, **self.ladders}
+        jumps = {}
+        codes = {}
+        for start in starts:
+            seen = [start]
+            tile = starts[start]
+            while tile in starts:
+                if tile in seen:
+                    loop = " -> ".join(str(t) for t in seen[seen.index(tile):] + [tile])
+                    raise BoardError(f"jumps form a loop: {loop}")
+                seen.append(tile)
+                tile = starts[tile]
+            jumps[start] = tile
+            # A chain counts as a ladder if it ends up higher than where it started
+            codes[start] = 1 if tile > start else 2
+        return jumps, codes
+
+    def jump(self, pos):
+        """Returns (end tile, jump code) for landing on pos; code 0 means no jump."""
+        end = self.jumps.get(pos)
+        if end is None:
+            return pos, 0
+        return end, self._move_codes[pos]
+
+    def apply_snakes_ladders(self, pos):
+        """Returns the final position and the jump type after hitting a snake or ladder."""
+        result = self._results.get(pos)
+        if result is None:
+            return pos, None
+        return result
+
+    def to_dict(self):
+        return {
+            "name": self.name,
+            "size": self.final_tile,
+            "snakes": [[start, end] for start, end in sorted(self.snakes.items())],
+            "ladders": [[start, end] for start, end in sorted(self.ladders.items())],
+        }
+
+    def key(self):
+        """Hashable description of the board, independent of its name (built once)."""
+        return self._key
+
+    def __eq__(self, other):
+        return isinstance(other, BoardLayout) and self.key() == other.key()
+
+    def __hash__(self):
+        return self._hash
+
+    def __repr__(self):
+        return (f"BoardLayout({self.name!r}, {self.final_tile} tiles, "
+                f"{len(self.snakes)} snakes, {len(self.ladders)} ladders)")
+
+
+def _pairs(data, kind, source):
+    pairs = {}
+    entries = data.get(kind + "s", [])
+    if not isinstance(entries, (list, tuple)):
+        raise BoardError(f"{source}: {kind}s must be a list of [start, end] pairs, got {entries!r}")
+    for pair in entries:
+        if not isinstance(pair, (list, tuple)) or len(pair) != 2:
+            raise BoardError(f"{source}: every {kind} must be a [start, end] pair, got {pair!r}")
+        start, end = pair
+        # Checked before the tile is used as a key (a list start would not even hash)
+        if any(isinstance(tile, bool) or not isinstance(tile, int) for tile in pair):
+            raise BoardError(f"{source}: {kind} {pair!r} must be two whole tile numbers")
+        if start in pairs:
+            raise BoardError(f"{source}: two {kind}s start on tile {start}")
+        pairs[start] = end
+    return pairs
+
+
+def parse_board(data, source="board"):
+    """Builds a BoardLayout from the dict read out of a board file."""
+    if not isinstance(data, dict):
+        raise BoardError(f"{source}: expected a table with size, snakes and ladders")
+    snakes = _pairs(data, "snake", source)
+    ladders = _pairs(data, "ladder", source)
+    try:
+        return BoardLayout(snakes, ladders, data.get("size", FINAL_TILE),
+                           str(data.get("name", Path(source).stem)))
+    except BoardError as e:
+        raise BoardError(f"{source}: {e}") from None
+
+
+def load_board(path):
+    """Loads a .json or .toml board file and returns the validated BoardLayout."""
+    path = Path(path)
+    if path.suffix == ".toml":
+        try:
+            import tomllib
+        except ImportError:
+            raise BoardError(f"{path}: TOML boards need Python 3.11 or newer") from None
+        decode = tomllib.loads
+    else:
+        decode = json.loads
+    try:
+        data = decode(path.read_text(encoding="utf-8"))
+    except OSError as e:
+        raise BoardError(f"cannot read board file {path}: {e}") from None
+    except ValueError as e:
+        # json.JSONDecodeError and tomllib.TOMLDecodeError are both ValueErrors
+        raise BoardError(f"{path} is not a valid board file: {e}") from None
+    return parse_board(data, str(path))
+
+
+def generate_board(final_tile, snakes, ladders, seed=0, max_length=None, name=None):
+    """
+    Builds a random valid board with the given numbers of snakes and ladders, each
+    at most max_length tiles long (a tenth of the board by default), for event boards.
+    """
+    rng = random.Random(seed)
+    max_length = max_length or max(final_tile // 10, 6)
+    used = set()
+    pairs = {"snake": {}, "ladder": {}}
+    for kind, count in (("snake", snakes), ("ladder", ladders)):
+        attempts = 0
+        while len(pairs[kind]) < count:
+            attempts += 1
+            if attempts > 100 * count + 1000:
+                raise BoardError(f"cannot fit {count} {kind}s on {final_tile} tiles")
+            start = rng.randint(2, final_tile - 1)
+            length = rng.randint(2, max_length)
+            end = start - length if kind == "snake" else start + length
+            # Ends never start another jump, so there are no chains or loops
+            if start in used or end in used or not 1 <= end < final_tile:
+                continue
+            used.update((start, end))
+            pairs[kind][start] = end
+    return BoardLayout(pairs["snake"], pairs["ladder"], final_tile, name or f"Event {final_tile}")
+
+
+def save_board(layout, path):
+    """Writes a layout as JSON, in the format load_board reads, one pair per line."""
+    data = layout.to_dict()
+    lines = ["{", f'  "name": {json.dumps(data["name"])},', f'  "size": {data["size"]},']
+    for kind in ("snakes", "ladders"):
+        pairs = ",\n".join(f"    {json.dumps(pair)}" for pair in data[kind])
+        lines.append(f'  "{kind}": [\n{pairs}\n  ]' + ("," if kind == "snakes" else ""))
+    lines.append("}")
+    Path(path).write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+
+# The board the game has always shipped with (also in boards/classic.json)
+CLASSIC = BoardLayout(SNAKES, LADDERS, FINAL_TILE, name="Classic")
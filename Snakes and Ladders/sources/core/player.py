@@ -0,0 +1,41 @@
+# 文件: core/player.py
+# 不导入 pygame：规则来自 core.rules，Board 只是可选的 apply_snakes_ladders 提供者
+import colorsys
+
+from .rules import apply_roll
+
+
+# 黄金角色相：第 5 位起的玩家颜色各不相同，且相邻编号颜色差别大
+_GOLDEN_HUE = 0.618033988749895
+
+
+def player_color(index):
+    """第 index 位玩家的颜色：前四位是 Player.COLORS，之后按黄金角生成（大桌游戏的棋子着色也用它）"""
+    if index < len(Player.COLORS):
+        return Player.COLORS[index]
+    r, g, b = colorsys.hsv_to_rgb((index * _GOLDEN_HUE) % 1.0, 0.75, 1.0)
+    return int(r * 255), int(g * 255), int(b * 255)
+
+
+class Player:
+    # 统一 Player 颜色，用于 Player.draw 中的临时绘制，但最终使用 ChessManager
+    COLORS = [(255, 0, 0), (0, 0, 255), (0, 255, 0), (255, 255, 0)]
+    
+    # 修复初始化参数，使其与 Game.py 中的 Player(id, name) 兼容
+    def __init__(self, id, name):
+        self.name = name
+        self.color = player_color(id)
+        self.position = 0 # 0 表示起点（off-board）
+        self.id = id # 0..3 用于 ChessManager 区分棋子
+    
+    # --- 核心移动逻辑：实现 Game.py 中调用的 move 方法 ---
+    def move(self, steps, board=None):
+        """
+        根据骰子点数移动玩家，处理所有游戏规则。
+        返回 (跳跃类型, 是否胜利)
+        board 可省略，此时直接使用 core.rules 中的蛇与梯子表
+        """
+        # 规则在 core.rules.apply_roll 中（GameState 的回合逻辑也用它）：
+        # 1. 超过 100 不移动  2. 恰好到 100 胜利  3. 应用蛇与梯子（梯子也可直接到 100）
+        self.position, move_type, is_winner = apply_roll(self.position, steps, board)
+        return move_type, is_winner # 返回跳跃类型和胜利状态
\ No newline at end of file
@@ -0,0 +1,55 @@
+# File: core/rules.py
+# Pure game rules shared by the pygame board and the headless tools.
+# Nothing in here imports pygame, so simulators can use it without a display.
+
+
+# --- Snakes and Ladders Mapping (start -> end) ---
+# Note: These values define the game's movement rules.
+SNAKES = {34:1,25:5,87:57,47:19,91:61,99:69}
+LADDERS ={3:57,6:27,20:70,63:95,68:98,36:95}
+
+# The tile a player has to land on exactly to win
+FINAL_TILE = 100
+
+
+def apply_snakes_ladders(pos, snakes=SNAKES, ladders=LADDERS):
+    """Returns the final position and the jump type after hitting a snake or ladder."""
+    if pos in ladders:
+        return ladders[pos], 'ladder'
+    if pos in snakes:
+        return snakes[pos], 'snake'
+    # If no rule applies, the position stays the same, and the type is None
+    return pos, None
+
+
+def advance(position, steps, jumps, final_tile=FINAL_TILE):
+    """
+    Table-driven Player.move: overshooting the final tile leaves the player where they are.
+    jumps is a sparse {start: end} table such as BoardLayout.jumps; other tiles map to themselves.
+    """
+    target = position + steps
+    if target > final_tile:
+        return position
+    return jumps.get(target, target)
+
+
+def apply_roll(position, steps, board=None):
+    """
+    Moves a player standing on position by steps. Returns (new_position, move_type, won).
+    Overshooting the final tile leaves the player where they are; board can be any
+    object with final_tile and apply_snakes_ladders (a BoardLayout or the pygame Board),
+    otherwise SNAKES/LADDERS are used.
+    """
+    final_tile = FINAL_TILE if board is None else board.final_tile
+    new_pos = position + steps
+    if new_pos > final_tile:
+        return position, None, False
+    if new_pos == final_tile:
+        return new_pos, None, True
+
+    if board is None:
+        final_pos, move_type = apply_snakes_ladders(new_pos)
+    else:
+        final_pos, move_type = board.apply_snakes_ladders(new_pos)
+    # A ladder can also end on the final tile
+    return final_pos, move_type, final_pos == final_tile
@@ -0,0 +1,108 @@
+# File: core/state.py
+# Compact state of one game, for servers and simulators that keep very many games alive.
+from array import array
+
+
+class GameState:
+    """
+    Positions, current player, winner, turn count and six streak of one game,
+    all stored in a single int array laid out as
+    [current, winner, turns, streak, pos 0, pos 1, ...].
+    winner is -1 in the array while nobody has won (None through the property).
+    streak counts the sixes the current player rolled this turn (see core/variants.py).
+    Snapshots are the raw bytes of that array, so taking or restoring one is a
+    single buffer copy.
+    """
+
+    __slots__ = ("data", "num_players")
+
+    CURRENT = 0
+    WINNER = 1
+    TURNS = 2
+    STREAK = 3
+    POSITIONS = 4
+
+    def __init__(self, num_players=4):
+        self.num_players = num_players
+        self.data = array("i", [0, -1, 0, 0] + [0] * num_players)
+
+    def reset(self):
+        data = self.data
+        data[self.CURRENT] = 0
+        data[self.WINNER] = -1
+        data[self.TURNS] = 0
+        data[self.STREAK] = 0
+        for i in range(self.POSITIONS, len(data)):
+            data[i] = 0
+
+    # --- Fields ---
+    @property
+    def current_player(self):
+        return self.data[self.CURRENT]
+
+    @current_player.setter
+    def current_player(self, seat):
+        self.data[self.CURRENT] = seat
+
+    @property
+    def winner(self):
+        seat = self.data[self.WINNER]
+        return None if seat < 0 else seat
+
+    @winner.setter
+    def winner(self, seat):
+        self.data[self.WINNER] = -1 if seat is None else seat
+
+    @property
+    def turn_count(self):
+        return self.data[self.TURNS]
+
+    @turn_count.setter
+    def turn_count(self, turns):
+        self.data[self.TURNS] = turns
+
+    @property
+    def streak(self):
+        return self.data[self.STREAK]
+
+    @streak.setter
+    def streak(self, sixes):
+        self.data[self.STREAK] = sixes
+
+    @property
+    def positions(self):
+        """All positions as a tuple, in seat order."""
+        return tuple(self.data[self.POSITIONS:])
+
+    @positions.setter
+    def positions(self, values):
+        self.data[self.POSITIONS:] = array("i", values)
+
+    def position(self, seat):
+        return self.data[self.POSITIONS + seat]
+
+    def set_position(self, seat, tile):
+        self.data[self.POSITIONS + seat] = tile
+
+    # --- Snapshot / restore ---
+    def snapshot(self):
+        """Returns the whole state as bytes."""
+        return self.data.tobytes()
+
+    def restore(self, snapshot):
+        """Copies a snapshot of a game with the same player count back into this state."""
+        memoryview(self.data).cast("B")[:] = snapshot
+
+    @classmethod
+    def from_snapshot(cls, snapshot):
+        state = cls.__new__(cls)
+        state.data = array("i")
+        state.data.frombytes(snapshot)
+        state.num_players = len(state.data) - cls.POSITIONS
+        return state
+
+    def copy(self):
+        state = GameState.__new__(GameState)
+        state.data = array("i", self.data)
+        state.num_players = self.num_players
+        return state
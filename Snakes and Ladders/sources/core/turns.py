@@ -0,0 +1,70 @@
+# File: core/turns.py
+# Turn logic that used to live in Game.handle_move, without any drawing code.
+# Every rule variant is already folded into the MoveTable, so a roll is a few lookups.
+from .variants import MOVE_KINDS, move_table
+
+
+# Status message per move kind (see core/variants.py)
+MESSAGES = (
+    "{name} rolled {steps}, moves to {new}.",
+    "{name} climbs a ladder to {new}!",
+    "{name} slides down a snake to {new}!",
+    "{name} overshoots. Stays at {old}.",
+    "{name} bounces back to {new}.",
+    "{name} needs a 6 to start.",
+    "{name} rolled a third 6 and loses the turn.",
+)
+
+
+class TurnResult:
+    """
+    What one dice roll did: the status message, jump type, winner seat and next player.
+    landed is the tile reached before any snake or ladder (0 if the piece did not move).
+    """
+
+    def __init__(self, message, move_type, winner, next_player, landed=0):
+        self.message = message
+        self.move_type = move_type
+        self.winner = winner
+        self.next_player = next_player
+        self.landed = landed
+
+
+def take_turn(state, steps, names, moves=None):
+    """
+    Plays one roll for state.current_player on a GameState and returns a TurnResult.
+    moves is a core.MoveTable (the classic board with standard rules if omitted).
+    The turn passes to the next player unless this roll won the game or earned
+    another roll.
+    """
+    if moves is None:
+        moves = move_table()
+    seat = state.current_player
+    name = names[seat]
+    old_pos = state.position(seat)
+
+    rolled = state.streak * 6 + steps - 1
+    index = (moves.blocked[rolled] * moves.tiles + old_pos) * 6 + steps - 1
+    new_pos = moves.landing[index]
+    kind = moves.kinds[index]
+    streak = moves.streak[rolled]
+    state.set_position(seat, new_pos)
+    state.turn_count += 1
+
+    # Message update logic
+    winner = None
+    if new_pos == moves.final_tile:
+        message = f"{name} WINS!"
+        winner = seat
+        state.winner = seat
+        streak = 0
+    else:
+        message = MESSAGES[kind].format(name=name, steps=steps, old=old_pos, new=new_pos)
+        if streak:
+            message += " Roll again!"
+    state.streak = streak
+
+    # Switch to the next player only if the game is still running and no extra roll was earned
+    if winner is None and not streak:
+        state.current_player = (seat + 1) % state.num_players
+    return TurnResult(message, MOVE_KINDS[kind], winner, state.current_player, moves.targets[index])
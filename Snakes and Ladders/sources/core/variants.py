@@ -0,0 +1,169 @@
+# File: core/variants.py
+# House-rule variants, compiled per board into flat move tables.
+#
+# A RuleSet only describes the variant; MoveTable turns it and a BoardLayout into
+# lookups, so playing a roll is the same few index operations for every variant:
+#   rolled = streak * 6 + roll - 1
+#   index  = (blocked[rolled] * tiles + position) * 6 + roll - 1
+#   landing[index], kinds[index]     where the piece ends and why
+#   streak[rolled]                   sixes rolled so far this turn (0: the turn passes)
+# blocked[rolled] is 1 only for a forfeited roll, whose row leaves every piece in place.
+from array import array
+from functools import lru_cache
+
+from .layout import CLASSIC
+
+
+FINISH_EXACT = "exact"      # a roll past the final tile is not played
+FINISH_BOUNCE = "bounce"    # the extra steps are walked back from the final tile
+
+# Kind codes stored per (position, roll); 1 and 2 are the layout's own jump codes
+MOVE, LADDER, SNAKE, OVERSHOOT, BOUNCE, WAIT, FORFEIT = range(7)
+MOVE_KINDS = (None, 'ladder', 'snake', 'overshoot', 'bounce', 'wait', 'forfeit')
+
+# Names used by parse_rules and the --rules options, in flag bit order
+RULE_NAMES = ("bounce", "extra-six", "three-sixes", "start-six")
+
+
+class RuleError(ValueError):
+    """Raised for an unknown or contradictory rule variant."""
+
+
+class RuleSet:
+    """
+    One combination of house rules:
+      finish               FINISH_EXACT (overshoot stays put) or FINISH_BOUNCE
+      extra_turn_on_six    a 6 lets the same player roll again
+      three_sixes_forfeit  the third 6 in a row is not played and the turn passes
+      start_on_six         a player needs a 6 to leave the start
+    """
+
+    def __init__(self, finish=FINISH_EXACT, extra_turn_on_six=False, three_sixes_forfeit=False,
+                 start_on_six=False):
+        if finish not in (FINISH_EXACT, FINISH_BOUNCE):
+            raise RuleError(f"finish must be {FINISH_EXACT!r} or {FINISH_BOUNCE!r}, got {finish!r}")
+        if three_sixes_forfeit and not extra_turn_on_six:
+            raise RuleError("three-sixes needs extra-six: without extra turns nobody rolls three 6s")
+        self.finish = finish
+        self.extra_turn_on_six = bool(extra_turn_on_six)
+        self.three_sixes_forfeit = bool(three_sixes_forfeit)
+        self.start_on_six = bool(start_on_six)
+
+    def flags(self):
+        """The rules as a bit field (bit order of RULE_NAMES), for file headers."""
+        bits = (self.finish == FINISH_BOUNCE, self.extra_turn_on_six, self.three_sixes_forfeit,
+                self.start_on_six)
+        return sum(1 << i for i, bit in enumerate(bits) if bit)
+
+    @classmethod
+    def from_flags(cls, flags):
+        if flags >> len(RULE_NAMES):
+            raise RuleError(f"unknown rule flags {flags:#x}")
+        return cls(FINISH_BOUNCE if flags & 1 else FINISH_EXACT, flags & 2, flags & 4, flags & 8)
+
+    def names(self):
+        return [name for i, name in enumerate(RULE_NAMES) if self.flags() >> i & 1]
+
+    def __eq__(self, other):
+        return isinstance(other, RuleSet) and self.flags() == other.flags()
+
+    def __hash__(self):
+        return self.flags()
+
+    def __repr__(self):
+        return f"RuleSet({', '.join(self.names()) or 'standard'})"
+
+
+STANDARD = RuleSet()
+
+
+def parse_rules(text):
+    """Builds a RuleSet from a comma-separated list of RULE_NAMES ('' or 'standard': no variants)."""
+    flags = 0
+    for name in text.replace(" ", "").split(","):
+        if name in ("", "standard"):
+            continue
+        if name not in RULE_NAMES:
+            raise RuleError(f"unknown rule {name!r}; choose from {', '.join(RULE_NAMES)}")
+        flags |= 1 << RULE_NAMES.index(name)
+    return RuleSet.from_flags(flags)
+
+
+class MoveTable:
+    """
+    A board and a rule set compiled into flat tables (see the top of this file).
+    targets[index] is the tile the roll landed on before any snake or ladder,
+    or 0 when the piece did not land anywhere (overshoot, waiting, forfeit).
+    """
+
+    def __init__(self, layout=CLASSIC, rules=STANDARD):
+        self.layout = layout
+        self.rules = rules
+        self.final_tile = final_tile = layout.final_tile
+        self.tiles = tiles = final_tile + 1
+
+        landing = array('i', bytes(4 * 2 * tiles * 6))
+        targets = array('i', bytes(4 * 2 * tiles * 6))
+        kinds = bytearray(2 * tiles * 6)
+        for pos in range(tiles):
+            for roll in range(1, 7):
+                index = pos * 6 + roll - 1
+                landing[index], targets[index], kinds[index] = self._roll(pos, roll)
+                # Second block: the forfeited roll leaves the piece where it is
+                index += tiles * 6
+                landing[index], kinds[index] = pos, FORFEIT
+        self.landing = landing
+        self.targets = targets
+        self.kinds = bytes(kinds)
+
+        # Per (sixes so far this turn, roll): next streak and whether the roll is forfeited
+        streak = bytearray(3 * 6)
+        blocked = bytearray(3 * 6)
+        if rules.extra_turn_on_six:
+            longest = 2 if rules.three_sixes_forfeit else 1
+            for sixes in range(3):
+                rolled = sixes * 6 + 5
+                if rules.three_sixes_forfeit and sixes == 2:
+                    blocked[rolled] = 1
+                else:
+                    streak[rolled] = min(sixes + 1, longest)
+        self.streak = bytes(streak)
+        self.blocked = bytes(blocked)
+        # Number of streak values a player can be in (1 when there are no extra turns)
+        self.streak_states = max(streak) + 1
+
+    def _roll(self, pos, roll):
+        """(landing, target, kind) for one roll of the normal block."""
+        final_tile = self.final_tile
+        if pos == final_tile:
+            return pos, 0, OVERSHOOT
+        if self.rules.start_on_six and pos == 0 and roll != 6:
+            return pos, 0, WAIT
+        target = pos + roll
+        kind = MOVE
+        if target > final_tile:
+            if self.rules.finish == FINISH_EXACT:
+                return pos, 0, OVERSHOOT
+            # Reflect off the final tile (more than once on a tiny board)
+            target %= 2 * final_tile
+            if target > final_tile:
+                target = 2 * final_tile - target
+            kind = BOUNCE
+        # The layout's jump codes are LADDER and SNAKE, 0 for no jump
+        end, code = self.layout.jump(target)
+        return end, target, code or kind
+
+    def move(self, position, roll, streak=0):
+        """Returns (landing, target, kind, next streak) of one roll; see the module comment."""
+        rolled = streak * 6 + roll - 1
+        index = (self.blocked[rolled] * self.tiles + position) * 6 + roll - 1
+        return self.landing[index], self.targets[index], self.kinds[index], self.streak[rolled]
+
+    def __repr__(self):
+        return f"MoveTable({self.layout!r}, {self.rules!r})"
+
+
+@lru_cache(maxsize=32)
+def move_table(layout=CLASSIC, rules=STANDARD):
+    """Returns the compiled MoveTable for a board and rule set, building it once per pair."""
+    return MoveTable(layout, rules)
@@ -1,43 +1,103 @@
 # 文件: dice.py
 import random
 import pygame
-from constants import SCREEN_WIDTH, SCREEN_HEIGHT
+from constants import SCREEN_WIDTH, SCREEN_HEIGHT, DICE_SIZE
+from text_cache import render_text
 #Random: Used to generate random dice points (1 to 6)
 #Pygame: A necessary Pygame library 
 #Constants: Import the width and height of the screen to calculate the position of the dice
 
 
 class Dice:
-    def __init__(self):
+    def __init__(self, atlas=None, rng=None, pair=False):
         self.value = 1
-        self.size = 80
+        self.size = DICE_SIZE[0]
         self.rect = pygame.Rect(SCREEN_WIDTH - self.size - 20, 
                                 SCREEN_HEIGHT - self.size - 20, 
                                 self.size, self.size)
         # Defined the position and clickable area of the dice
 
+        self.pair = pair
+        self.second_value = 1
+        self.second_rect = self.rect.move(0, -self.size - 20)
+        # Choice-of-dice variant: a second die above the first, and the player moves by one of them
+
+        self.atlas = atlas
+        top = self.second_rect.top if pair else self.rect.top
+        self.icon_center = (self.rect.centerx, top - self.size // 2 - 10)
+        self.area = self.rect.union(self.second_rect if pair else self.rect)
+        self.area.union_ip(pygame.Rect(0, 0, self.size, self.size).move(self.icon_center[0] - self.size // 2,
+                                                                        self.icon_center[1] - self.size // 2))
+        # Everything draw() paints: the dice and the picture above them
+        # Dice picture from the sprite atlas, shown above the dice as a hint to click it
+
 
 
         self.font = pygame.font.Font(None, 48)
         # Initialize font to display the number of points within the dice rectangle
 
+        self.rng = rng
+        self.game_id = 0
+        self.turn_index = 0
+        # Optional counter-based source (dice_rng.CounterDice): roll k of game g is then
+        # reproducible from the seed. Without it the global random module is used
+
 
 
     def roll(self):
-        self.value = random.randint(1, 6)
+        if self.rng is None:
+            self.value = random.randint(1, 6)
+        else:
+            self.value = self.rng.roll(self.game_id, self.turn_index)
+            self.turn_index += 1
         return self.value
     # Generate a random number: Generate a random integer between 1 and 6. 
     # Assign this random number to the instance property 'self. value'. there self value is 1 before
 
 
 
+    def roll_pair(self):
+        first = self.roll()
+        self.second_value = self.roll()
+        self.value = first
+        return first, self.second_value
+    # Rolls both dice of the choice-of-dice variant (two rolls of the sequence) and returns (lower die, upper die)
+
+
+
+    def value_at(self, pos):
+        if self.rect.collidepoint(pos):
+            return self.value
+        if self.pair and self.second_rect.collidepoint(pos):
+            return self.second_value
+        return None
+    # The value of the die under a click, or None
+
+
+
+    def new_game(self):
+        self.game_id += 1
+        self.turn_index = 0
+    # The next game of the session gets its own sequence of rolls
+
+
+
     def draw(self, screen):
         
-        pygame.draw.rect(screen, (255, 255, 255), self.rect, border_radius=10)
-        pygame.draw.rect(screen, (0, 0, 0), self.rect, 2, border_radius=10)
-        #Draw the appearance of dice 
+        self.draw_die(screen, self.rect, self.value)
+        if self.pair:
+            self.draw_die(screen, self.second_rect, self.second_value)
 
+        if self.atlas is not None and "dice" in self.atlas.regions:
+            self.atlas.draw(screen, "dice", self.icon_center)
+
+
+
+    def draw_die(self, screen, rect, value):
+        pygame.draw.rect(screen, (255, 255, 255), rect, border_radius=10)
+        pygame.draw.rect(screen, (0, 0, 0), rect, 2, border_radius=10)
+        #Draw the appearance of dice 
 
-        txt = self.font.render(str(self.value), True, (0, 0, 0))
-        txt_r = txt.get_rect(center=self.rect.center)
+        txt = render_text(self.font, str(value), (0, 0, 0))
+        txt_r = txt.get_rect(center=rect.center)
         screen.blit(txt, txt_r)
\ No newline at end of file
@@ -0,0 +1,156 @@
+# File: dice_policy.py
+# Best play for the choice-of-dice variant: each turn two dice are rolled and the
+# player moves by the one they pick.
+#
+# The states are (sixes this turn, tile), and the moves come from the rule variant's
+# MoveTable (core/variants.py), so every variant is covered. Value iteration finds
+# the fewest expected turns to finish from every state:
+#   Q[state, roll]  = (1 if the roll ends the turn) + V[state after the roll]
+#   V[state]        = mean over the 36 rolled pairs (a, b) of min(Q[state, a], Q[state, b])
+# The die reaching the smaller Q is stored per (state, a, b), so the bot and the hint
+# read the best choice with one index. Tables are computed once per board and rule
+# set and kept in the cache folder, so a later launch only loads them.
+import hashlib
+import os
+from functools import lru_cache
+from pathlib import Path
+
+import numpy as np
+
+from core import CLASSIC, STANDARD, move_table
+
+
+CACHE_DIR = Path(__file__).resolve().parent.parent / "cache"
+# Bump when the tables or the file layout change so old files are rebuilt
+POLICY_VERSION = 1
+
+TOLERANCE = 1e-9
+MAX_ITERATIONS = 1_000_000
+
+# Chance that the k-th smallest of six values is the smaller of two fair dice
+MIN_OF_TWO = np.arange(11, 0, -2) / 36
+
+
+def _roll_outcomes(moves):
+    """
+    Returns (next, cost) arrays of shape (streak states * tiles, 6): the state
+    after each roll from each state, and 1 where the roll ends the turn (the
+    turn passes, or the piece reached the final tile) or 0 where it goes on.
+    """
+    tiles = moves.tiles
+    landing = np.frombuffer(moves.landing, dtype=np.intc)
+    positions = np.arange(tiles)
+    next_state = np.zeros((moves.streak_states, tiles, 6), dtype=np.intp)
+    cost = np.zeros((moves.streak_states, tiles, 6))
+    for streak in range(moves.streak_states):
+        for roll in range(1, 7):
+            rolled = streak * 6 + roll - 1
+            landed = landing[(moves.blocked[rolled] * tiles + positions) * 6 + roll - 1]
+            goes_on = moves.streak[rolled]
+            next_state[streak, :, roll - 1] = goes_on * tiles + landed
+            cost[streak, :, roll - 1] = (goes_on == 0) | (landed == moves.final_tile)
+    return next_state.reshape(-1, 6), cost.reshape(-1, 6)
+
+
+def value_iteration(moves, tolerance=TOLERANCE, max_iterations=MAX_ITERATIONS):
+    """
+    Returns (values, q, iterations) for a MoveTable: values[state] is the expected
+    number of turns left from a state under the best choices and q[state, roll - 1]
+    the same after moving by that roll. States are streak * tiles + tile.
+    """
+    tiles = moves.tiles
+    next_state, cost = _roll_outcomes(moves)
+    finished = np.arange(moves.streak_states) * tiles + moves.final_tile
+    # Start from the distance to go at 4.47 tiles a turn (the mean of the higher of two dice)
+    values = np.tile((moves.final_tile - np.arange(tiles)) / (161 / 36), moves.streak_states)
+    values[finished] = 0.0
+    for iteration in range(1, max_iterations + 1):
+        q = cost + values[next_state]
+        best = np.sort(q, axis=1) @ MIN_OF_TWO
+        best[finished] = 0.0
+        change = np.abs(best - values).max()
+        values = best
+        if change < tolerance:
+            break
+    else:
+        raise RuntimeError(f"value iteration did not converge in {max_iterations} iterations")
+    return values, cost + values[next_state], iteration
+
+
+def _choices(q):
+    """The roll to play per (state, first die, second die); the higher die on a tie."""
+    first = np.arange(6)[:, None]
+    second = np.arange(6)[None, :]
+    prefer_first = q[:, :, None] < q[:, None, :]
+    prefer_first |= (q[:, :, None] == q[:, None, :]) & (first >= second)
+    return np.where(prefer_first, first + 1, second + 1).astype(np.uint8)
+
+
+def _cache_path(layout, rules):
+    digest = hashlib.sha1(f"v{POLICY_VERSION} {TOLERANCE!r} {rules.flags()} {layout.key()!r}".encode())
+    return CACHE_DIR / f"policy-{digest.hexdigest()}.npz"
+
+
+class DicePolicy:
+    """
+    The best die to play and the expected turns left, for one board and rule set.
+    Every query is a lookup; use load_policy() to get a cached instance.
+    """
+
+    def __init__(self, layout=CLASSIC, rules=STANDARD):
+        self.layout = layout
+        self.rules = rules
+        self.moves = moves = move_table(layout, rules)
+        self.tiles = moves.tiles
+        self.from_cache = self._load()
+        if not self.from_cache:
+            self.values, self.q, self.iterations = value_iteration(moves)
+            self._save()
+        self.choices = _choices(self.q).tobytes()
+        self.expected_turns = float(self.values[0])
+
+    # --- Disk cache ---
+    def _load(self):
+        try:
+            with np.load(_cache_path(self.layout, self.rules)) as data:
+                values, q = data["values"], data["q"]
+        except (OSError, ValueError, KeyError):
+            return False
+        size = self.moves.streak_states * self.tiles
+        if values.shape != (size,) or q.shape != (size, 6):
+            return False
+        self.values, self.q, self.iterations = values, q, 0
+        return True
+
+    def _save(self):
+        """Stores the tables; a read-only install just solves again next launch."""
+        path = _cache_path(self.layout, self.rules)
+        tmp_path = path.with_suffix(".tmp")
+        try:
+            CACHE_DIR.mkdir(exist_ok=True)
+            with open(tmp_path, "wb") as f:
+                np.savez(f, values=self.values, q=self.q)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"Could not write policy cache: {e}")
+
+    # --- Queries ---
+    def best_roll(self, position, first, second, streak=0):
+        """The die to move by when first and second were rolled on a tile, streak sixes into the turn."""
+        return self.choices[((streak * self.tiles + position) * 6 + first - 1) * 6 + second - 1]
+
+    def turns_left(self, position, streak=0, roll=None):
+        """Expected turns to finish from a tile with best play; after moving by roll if one is given."""
+        state = streak * self.tiles + position
+        if roll is None:
+            return float(self.values[state])
+        return float(self.q[state, roll - 1])
+
+    def __repr__(self):
+        return f"DicePolicy({self.layout!r}, {self.rules!r}, expected_turns={self.expected_turns:.3f})"
+
+
+@lru_cache(maxsize=8)
+def load_policy(layout=CLASSIC, rules=STANDARD):
+    """Returns the DicePolicy of a board and rule set, solving (or loading) it once per pair."""
+    return DicePolicy(layout, rules)
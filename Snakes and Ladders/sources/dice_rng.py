@@ -0,0 +1,73 @@
+# File: dice_rng.py
+# Counter-based dice: roll k of game g is a pure function of (seed, g, k),
+# so any single roll can be computed directly and whole blocks can be generated
+# at once with NumPy, without replaying the rolls that came before.
+import random
+
+import numpy as np
+
+
+MASK64 = (1 << 64) - 1
+
+# SplitMix64 constants
+GOLDEN_GAMMA = 0x9E3779B97F4A7C15
+MIX_1 = 0xBF58476D1CE4E5B9
+MIX_2 = 0x94D049BB133111EB
+
+
+def _mix(z):
+    """SplitMix64 step on a Python int."""
+    z = (z + GOLDEN_GAMMA) & MASK64
+    z = ((z ^ (z >> 30)) * MIX_1) & MASK64
+    z = ((z ^ (z >> 27)) * MIX_2) & MASK64
+    return z ^ (z >> 31)
+
+
+def _mix_array(z):
+    """The same SplitMix64 step on a uint64 array (arithmetic wraps mod 2**64)."""
+    # The wraparound is wanted; NumPy only warns about it for 0-d inputs
+    with np.errstate(over="ignore"):
+        z = z + np.uint64(GOLDEN_GAMMA)
+        z ^= z >> np.uint64(30)
+        z *= np.uint64(MIX_1)
+        z ^= z >> np.uint64(27)
+        z *= np.uint64(MIX_2)
+        z ^= z >> np.uint64(31)
+    return z
+
+
+class CounterDice:
+    """Six-sided dice keyed on (seed, game_id, turn_index)."""
+
+    def __init__(self, seed=None):
+        # Without a seed, pick one and keep it so the session can be reproduced
+        self.seed = random.getrandbits(64) if seed is None else seed & MASK64
+        self._seed_hash = _mix(self.seed)
+        # Hash of the last game asked for, since single rolls usually come from one game
+        self._game = None
+        self._game_hash = 0
+
+    def roll(self, game_id, turn_index):
+        """Returns roll number turn_index (from 0) of game game_id, 1 to 6."""
+        if game_id != self._game:
+            self._game = game_id
+            self._game_hash = _mix(self._seed_hash ^ (game_id & MASK64))
+        h = _mix(self._game_hash ^ (turn_index & MASK64))
+        # Top 32 bits scaled to 0..5
+        return 1 + (((h >> 32) * 6) >> 32)
+
+    def rolls(self, game_ids, turn_indices):
+        """
+        Bulk version of roll(). game_ids and turn_indices are broadcast together,
+        e.g. many games at one turn, or one game over many turns.
+        """
+        games = np.asarray(game_ids, dtype=np.uint64)
+        turns = np.asarray(turn_indices, dtype=np.uint64)
+        h = _mix_array(_mix_array(np.uint64(self._seed_hash) ^ games) ^ turns)
+        return (1 + (((h >> np.uint64(32)) * np.uint64(6)) >> np.uint64(32))).astype(np.int16)
+
+    def block(self, game_ids, first_turn, count):
+        """Returns a (len(game_ids), count) array with turns first_turn .. first_turn+count-1."""
+        games = np.asarray(game_ids, dtype=np.uint64)[:, None]
+        turns = np.arange(first_turn, first_turn + count, dtype=np.uint64)[None, :]
+        return self.rolls(games, turns)
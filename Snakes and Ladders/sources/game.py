@@ -2,10 +2,18 @@ import pygame
 import sys
 # Absolute import (Ensure these files exist in your project structure)
 from board import Board
-from player import Player
+from core import GameState, take_turn, CLASSIC, load_board, move_table
 from dice import Dice
 from chess import ChessManager
-from constants import SCREEN_WIDTH, SCREEN_HEIGHT, WHITE, BLACK, INFO_PANEL_WIDTH
+from win_probability import WinProbability
+from renderer import DirtyRectRenderer
+from scheduler import FrameScheduler
+from text_cache import render_text
+from assets import load_atlas
+from dice_rng import CounterDice
+from replay import ReplayWriter
+from constants import SCREEN_WIDTH, SCREEN_HEIGHT, WHITE, BLACK, INFO_PANEL_WIDTH, DIRTY_RECT_RENDERING, DICE_SEED, REPLAY_PATH, LAYOUT_FILE
+from constants import WIN_ODDS_MAX_TILES
 
 
 class Button:
@@ -19,7 +27,7 @@ class Button:
     def draw(self, screen):
         # Draws a rounded rectangle and centers the text inside
         pygame.draw.rect(screen, self.color, self.rect, border_radius=8)
-        txt = self.font.render(self.text, True, BLACK)
+        txt = render_text(self.font, self.text, BLACK)
         txt_r = txt.get_rect(center=self.rect.center)
         screen.blit(txt, txt_r)
 
@@ -33,7 +41,7 @@ NEW_BOARD_X = 120
 
 
 class Game:
-    def __init__(self):
+    def __init__(self, replay_path=REPLAY_PATH, layout=None):
         pygame.init()
         
         # Setting up fonts
@@ -45,18 +53,31 @@ class Game:
         pygame.display.set_caption("Snakes and Ladders")
         
         # Game state variables
-        self.current_player = 0
         self.game_state = 'running'  # Can be 'running' or 'end'
-        self.winner = None
         
-        # Create 4 players named Player 1–4
-        self.players = [Player(i, f"Player {i+1}") for i in range(4)]
+        # 4 players named Player 1–4; positions, turn and winner live in one GameState
+        self.names = [f"Player {i+1}" for i in range(4)]
+        self.state = GameState(len(self.names))
    
         # Create game components
-        self.board = Board()
-        self.dice = Dice()
-        self.chess_manager = ChessManager()
+        # Board layout (size, snakes, ladders and the compiled jump table)
+        if layout is None:
+            layout = load_board(LAYOUT_FILE) if LAYOUT_FILE else CLASSIC
+        self.layout = layout
+        self.board = Board(layout)
+        self.moves = move_table(layout) # Standard rules compiled with the board
+        self.atlas = load_atlas()  # One sprite sheet for the chess pieces and the dice
+        self.dice = Dice(self.atlas, CounterDice(DICE_SEED))
+        self.chess_manager = ChessManager(self.atlas)
         
+        # Exact win chances shown in the info panel, recomputed once per dice click;
+        # none on huge event boards, where the exact solve grows steeply with the size
+        self.win_odds = WinProbability(layout) if layout.final_tile <= WIN_ODDS_MAX_TILES else None
+        self.update_win_chances()
+
+        # Optional binary record of every roll of the session (see replay.py)
+        self.replay = ReplayWriter(replay_path, len(self.names), layout) if replay_path else None
+
         # Display message on top of the board
         self.message = "Click the dice to start the round!" 
 
@@ -66,18 +87,36 @@ class Game:
         self.quit_button = Button((SCREEN_WIDTH // 2 + 20, SCREEN_HEIGHT // 2 + 50, 100, 50), 
                                   "EXIT", self.font, (255, 0, 0))
 
+        # Dirty-rectangle rendering: static layers are composited once and only
+        # the regions that changed are pushed to the display
+        self.renderer = DirtyRectRenderer(self.screen) if DIRTY_RECT_RENDERING else None
+        self.message_rect = pygame.Rect(NEW_BOARD_X, 10, SCREEN_WIDTH - NEW_BOARD_X, self.font.get_linesize())
+        # The board image covers the right edge of the panel
+        board_rect = pygame.Rect(self.board.x, self.board.y, self.board.w, self.board.h)
+        self.panel_board_overlap = board_rect.clip((0, 0, INFO_PANEL_WIDTH, SCREEN_HEIGHT))
+
+        # One persistent frame clock; the loop sleeps while nothing is animating
+        self.scheduler = FrameScheduler()
+
     def reset_game(self):
         # Fully reset all players and game state
-        self.players = [Player(i, f"Player {i+1}") for i in range(4)]
-        self.current_player = 0
+        self.state.reset()
         self.game_state = 'running'
-        self.winner = None
         self.message = "Game reset. Click the dice!"
         self.dice.value = 1
+        self.dice.new_game()
+        self.update_win_chances()
+
+    def update_win_chances(self):
+        # Memoized on (positions, current player), so repeated states cost a dict lookup
+        if self.win_odds is None:
+            self.win_chances = [None] * len(self.names)
+            return
+        self.win_chances = self.win_odds.evaluate(self.state.positions, self.state.current_player)
 
     def draw_text(self, screen, text, color, pos, font):
         # Helper to draw text on the screen
-        text_surface = font.render(text, True, color)
+        text_surface = render_text(font, text, color)
         screen.blit(text_surface, pos)
 
 
@@ -85,10 +124,11 @@ class Game:
         # Draws the left info panel showing player info
         panel_rect = pygame.Rect(0, 0, INFO_PANEL_WIDTH, SCREEN_HEIGHT)
         pygame.draw.rect(screen, BLACK, panel_rect)
-        
-
+        self.draw_player_rows(screen)
 
-        for i, player in enumerate(self.players):
+    def draw_player_rows(self, screen):
+        # Draws one info row (icon, name, position, win chance) per player
+        for i, name in enumerate(self.names):
             y_start = 50 + i * 120
             icon_pos = (INFO_PANEL_WIDTH // 2, y_start) 
             # Draws the player's little chess icon
@@ -100,26 +140,90 @@ class Game:
 
 
             # Highlight current player
-            is_current = (i == self.current_player)
+            is_current = (i == self.state.current_player)
             name_color = (255, 255, 0) if is_current else WHITE
             
 
 
             # Player name and position
-            self.draw_text(screen, player.name[:8], name_color, (5, y_start + 25), self.font)
-            self.draw_text(screen, f"Pos: {player.position}", WHITE, (5, y_start + 45), self.font)
+            self.draw_text(screen, name[:8], name_color, (5, y_start + 25), self.font)
+            self.draw_text(screen, f"Pos: {self.state.position(i)}", WHITE, (5, y_start + 45), self.font)
+            chance = self.win_chances[i]
+            self.draw_text(screen, "Win: --" if chance is None else f"Win: {chance:.0%}", WHITE, (5, y_start + 62), self.font)
             
 
             # Green border box around current player's info
             if is_current:
-                 pygame.draw.rect(screen, (0, 255, 0), (0, y_start - 30, INFO_PANEL_WIDTH, 100), 2)
+                 pygame.draw.rect(screen, (0, 255, 0), (0, y_start - 30, INFO_PANEL_WIDTH, 110), 2)
 
 
 
 
 
+    def draw_end(self, screen):
+        # Winner screen with the play again + exit buttons
+        screen.fill(BLACK)
+        win_msg = f" {self.names[self.state.winner]} WINS! "
+        
+        self.draw_text(screen, win_msg, (255, 255, 0), 
+                       (SCREEN_WIDTH // 2 - len(win_msg) * 10, SCREEN_HEIGHT // 2 - 50), 
+                       self.large_font)
+        
+        self.restart_button.draw(screen)
+        self.quit_button.draw(screen)
+
+    def draw_pieces(self, screen):
+        # Draw all player pieces on their current tiles
+        for i, position in enumerate(self.state.positions):
+            pos = self.board.get_tile_center(position)
+            self.chess_manager.draw_chess_piece(screen, i, pos)
+
+    def draw_static_layers(self, surface):
+        # Layers that never change while running, composited once by the renderer
+        surface.fill(WHITE)
+        pygame.draw.rect(surface, BLACK, (0, 0, INFO_PANEL_WIDTH, SCREEN_HEIGHT))
+        self.board.draw(surface)
+
+    def draw_dynamic_layers(self, screen):
+        # Layers repainted inside each dirty region
+        self.draw_player_rows(screen)
+        # Put the board back over the rows, as the full redraw does
+        screen.blit(self.renderer.background, self.panel_board_overlap, self.panel_board_overlap)
+
+        self.draw_pieces(screen)
+        self.draw_text(screen, self.message, BLACK, (NEW_BOARD_X, 10), self.font)
+        self.dice.draw(screen)
+
+    def dirty_items(self):
+        # Screen regions of the running screen and the state they show
+        items = {
+            'dice': (self.dice.rect, self.dice.value),
+            'message': (self.message_rect, self.message),
+        }
+        for i, position in enumerate(self.state.positions):
+            row_rect = pygame.Rect(0, 50 + i * 120 - 30, INFO_PANEL_WIDTH, 120)
+            row_state = (self.names[i], position, i == self.state.current_player, self.win_chances[i])
+            items['row', i] = (row_rect, row_state)
+
+            pos = self.board.get_tile_center(position)
+            items['piece', i] = (self.chess_manager.get_chess_piece(i).get_rect(center=pos), None)
+        return items
+
+    def draw_dirty(self):
+        # Dirty-rectangle drawing for both running and end states
+        if self.game_state == 'running':
+            self.renderer.set_scene('running', self.draw_static_layers)
+            self.renderer.render(self.dirty_items(), self.draw_dynamic_layers)
+        else:
+            self.renderer.set_scene(('end', self.state.winner), self.draw_end)
+            self.renderer.render({}, lambda screen: None)
+
     def draw(self):
         # Handles all drawing for both running and end states
+        if self.renderer is not None:
+            self.draw_dirty()
+            return
+
         if self.game_state == 'running':
             self.screen.fill(WHITE)
             
@@ -129,9 +233,7 @@ class Game:
             self.board.draw(self.screen) 
             
             # Draw all player pieces on their current tiles
-            for i, player in enumerate(self.players):
-                pos = self.board.get_tile_center(player.position)
-                self.chess_manager.draw_chess_piece(self.screen, i, pos)
+            self.draw_pieces(self.screen)
             
 
             # Display message + dice
@@ -141,19 +243,7 @@ class Game:
         elif self.game_state == 'end':
 
             # Show winner screen
-            self.screen.fill(BLACK)
-
-
-            win_msg = f" {self.winner.name} WINS! "
-            
-            self.draw_text(self.screen, win_msg, (255, 255, 0), 
-                           (SCREEN_WIDTH // 2 - len(win_msg) * 10, SCREEN_HEIGHT // 2 - 50), 
-                           self.large_font)
-            
-
-            # Show play again + exit buttons
-            self.restart_button.draw(self.screen)
-            self.quit_button.draw(self.screen)
+            self.draw_end(self.screen)
             
 
         # Update the display each frame
@@ -163,43 +253,27 @@ class Game:
     def handle_move(self, steps):
 
 
-        # Moves the current player according to dice roll
-        player = self.players[self.current_player]
-        old_pos = player.position
-        
-
-        # Player handles movement logic (and detects ladder/snake/win)
-        move_type, is_winner = player.move(steps, self.board)
-        new_pos = player.position
-        
+        if self.replay is not None:
+            self.replay.record(steps)
 
-
-        # Build an on-screen message depending on what happened
-        if is_winner:
-             self.message = f" {player.name} WINS!"
-             self.winner = player
+        # Moves the current player according to dice roll (rules live in core.take_turn)
+        result = take_turn(self.state, steps, self.names, self.moves)
+        self.message = result.message
+        if result.winner is not None:
              self.game_state = 'end' 
-        elif old_pos + steps > 100:
-             self.message = f"{player.name} overshoots. Stays at {old_pos}."
-        elif move_type == 'ladder':
-             self.message = f" {player.name} climbs a ladder to {new_pos}!"
-        elif move_type == 'snake':
-             self.message = f" {player.name} slides down a snake to {new_pos}!"
-        else:
-             self.message = f"{player.name} rolled {steps}, moves to {new_pos}."
-
-
-        # Only switch turns if game hasn’t ended
-        if self.game_state == 'running':
-             self.current_player = (self.current_player + 1) % len(self.players)
+        self.update_win_chances()
     
 
 
+    def is_animating(self):
+        # Nothing on screen changes without input yet, so the loop can sleep
+        return False
+
     def run(self):
         # Main game loop – keeps running until quit
         running = True
         while running:
-            for event in pygame.event.get():
+            for event in self.scheduler.next_events(self.is_animating()):
                 if event.type == pygame.QUIT:
                     running = False
                 
@@ -221,10 +295,11 @@ class Game:
 
             # Draw current frame
             self.draw()
-            pygame.time.Clock().tick(60)
         
 
         # Quit everything cleanly
+        if self.replay is not None:
+            self.replay.close()
         pygame.quit()
         sys.exit()
 
@@ -0,0 +1,176 @@
+# File: game_stats.py
+# Constant-memory statistics over any number of games.
+#
+# Nothing here grows with the number of games: the game lengths go into a fixed
+# histogram (one exact bin per length below EXACT_TURNS, then 16 log-spaced bins
+# per power of two), wins are one counter per seat and hits one counter per tile.
+# Every summary is a sum of counters, so two GameStats built from different games
+# merge exactly, whichever worker or machine produced them.
+import numpy as np
+
+from core import CLASSIC
+
+
+EXACT_TURNS = 1024
+SUB_BINS = 16                       # log bins per power of two above EXACT_TURNS
+_FIRST_EXPONENT = EXACT_TURNS.bit_length() - 1
+HISTOGRAM_BINS = EXACT_TURNS + (64 - _FIRST_EXPONENT) * SUB_BINS
+
+
+def turn_bin(turns):
+    """Histogram bin of one game length."""
+    if turns < EXACT_TURNS:
+        return turns
+    exponent = turns.bit_length() - 1
+    sub = (turns >> (exponent - 4)) & (SUB_BINS - 1)
+    return EXACT_TURNS + (exponent - _FIRST_EXPONENT) * SUB_BINS + sub
+
+
+def turn_bins(turns):
+    """turn_bin over a NumPy array of game lengths."""
+    turns = np.asarray(turns, dtype=np.int64)
+    bins = turns.copy()
+    long = turns >= EXACT_TURNS
+    if long.any():
+        exponent = np.frexp(turns[long].astype(np.float64))[1].astype(np.int64) - 1
+        # Rounding to float can carry a value just below a power of two up to it
+        exponent -= (turns[long] >> exponent) == 0
+        sub = (turns[long] >> (exponent - 4)) & (SUB_BINS - 1)
+        bins[long] = EXACT_TURNS + (exponent - _FIRST_EXPONENT) * SUB_BINS + sub
+    return bins
+
+
+def bin_range(index):
+    """The (lowest, highest) game length counted in a histogram bin."""
+    if index < EXACT_TURNS:
+        return index, index
+    exponent, sub = divmod(index - EXACT_TURNS, SUB_BINS)
+    exponent += _FIRST_EXPONENT
+    width = 1 << (exponent - 4)
+    low = (1 << exponent) + sub * width
+    return low, low + width - 1
+
+
+class GameStats:
+    """
+    Mergeable fixed-size summary of finished games: game length histogram (and
+    from it streaming quantiles), exact mean and standard deviation, wins per seat,
+    landings per tile and the number of games cut off unfinished.
+    Feed it whole batches (add_result), or one game at a time from the pygame
+    game (record_landing per move, record_game at the win).
+    """
+
+    def __init__(self, num_players=4, layout=CLASSIC):
+        self.num_players = num_players
+        self.layout = layout
+        self.num_games = 0
+        self.unfinished = 0
+        self.histogram = np.zeros(HISTOGRAM_BINS, dtype=np.int64)
+        self.win_counts = np.zeros(num_players, dtype=np.int64)
+        self.hits = np.zeros(layout.final_tile + 1, dtype=np.int64)  # landings per tile
+        # Exact sums (Python ints never overflow) for the mean and the variance
+        self.turn_sum = 0
+        self.turn_square_sum = 0
+        self.min_turns = None
+        self.max_turns = None
+
+    # --- Feeding ---
+    def record_landing(self, tile):
+        """Counts one landing (the tile reached before any snake or ladder; 0 = none)."""
+        if tile:
+            self.hits[tile] += 1
+
+    def record_game(self, turns, winner):
+        """Counts one game; winner is the winning seat, or None / -1 if it was cut off."""
+        self.num_games += 1
+        if winner is None or winner < 0:
+            self.unfinished += 1
+            return
+        self.win_counts[winner] += 1
+        self.histogram[turn_bin(turns)] += 1
+        self.turn_sum += turns
+        self.turn_square_sum += turns * turns
+        self.min_turns = turns if self.min_turns is None else min(self.min_turns, turns)
+        self.max_turns = turns if self.max_turns is None else max(self.max_turns, turns)
+
+    def add_result(self, result):
+        """Adds a simulator.SimulationResult (simulated with count_hits for the hit counts)."""
+        self.add_games(result.turns, result.winners, result.hits)
+
+    def add_games(self, turns, winners, hits=None):
+        """Adds a batch given as arrays of game lengths and winning seats (-1: unfinished)."""
+        finished = winners >= 0
+        turns = np.asarray(turns, dtype=np.int64)[finished]
+        self.num_games += len(winners)
+        self.unfinished += int(np.count_nonzero(~finished))
+        self.win_counts += np.bincount(winners[finished], minlength=self.num_players)
+        self.histogram += np.bincount(turn_bins(turns), minlength=HISTOGRAM_BINS)
+        if len(turns):
+            self.turn_sum += int(turns.sum())
+            self.turn_square_sum += int((turns * turns).sum())
+            low, high = int(turns.min()), int(turns.max())
+            self.min_turns = low if self.min_turns is None else min(self.min_turns, low)
+            self.max_turns = high if self.max_turns is None else max(self.max_turns, high)
+        if hits is not None:
+            self.hits += hits
+
+    # --- Merging ---
+    def merge(self, other):
+        """Adds another GameStats of the same board and player count into this one."""
+        if other.num_players != self.num_players or other.layout != self.layout:
+            raise ValueError("only stats of the same board and player count can be merged")
+        self.num_games += other.num_games
+        self.unfinished += other.unfinished
+        self.histogram += other.histogram
+        self.win_counts += other.win_counts
+        self.hits += other.hits
+        self.turn_sum += other.turn_sum
+        self.turn_square_sum += other.turn_square_sum
+        for name, pick in (("min_turns", min), ("max_turns", max)):
+            mine, theirs = getattr(self, name), getattr(other, name)
+            setattr(self, name, theirs if mine is None else mine if theirs is None else pick(mine, theirs))
+        return self
+
+    # --- Summaries ---
+    @property
+    def finished(self):
+        return self.num_games - self.unfinished
+
+    def mean_turns(self):
+        return self.turn_sum / max(self.finished, 1)
+
+    def std_turns(self):
+        count = max(self.finished, 1)
+        return max(self.turn_square_sum / count - (self.turn_sum / count) ** 2, 0.0) ** 0.5
+
+    def quantile(self, q):
+        """
+        The q-quantile (0..1) of the game length: exact below EXACT_TURNS turns,
+        otherwise within 1/SUB_BINS of the true value. None before any finished game.
+        """
+        if not self.finished:
+            return None
+        rank = min(int(q * self.finished), self.finished - 1)
+        index = int(np.searchsorted(np.cumsum(self.histogram), rank, side="right"))
+        low, high = bin_range(index)
+        # Never report past the extremes actually seen
+        return min(max((low + high) // 2, self.min_turns), self.max_turns)
+
+    def win_rates(self):
+        return self.win_counts / max(self.finished, 1)
+
+    def snake_hits(self):
+        return {tile: int(self.hits[tile]) for tile in self.layout.snakes}
+
+    def ladder_hits(self):
+        return {tile: int(self.hits[tile]) for tile in self.layout.ladders}
+
+    def summary(self):
+        """A few printable lines."""
+        lines = [f"{self.num_games} games ({self.unfinished} unfinished), "
+                 f"rolls per game: mean {self.mean_turns():.3f}, std {self.std_turns():.3f}, "
+                 + ", ".join(f"p{int(q * 100)} {self.quantile(q)}" for q in (0.5, 0.9, 0.99))]
+        lines += [f"  seat {seat + 1}: {rate:.4%} wins" for seat, rate in enumerate(self.win_rates())]
+        lines.append(f"  snake hits:  {self.snake_hits()}")
+        lines.append(f"  ladder hits: {self.ladder_hits()}")
+        return lines
@@ -0,0 +1,183 @@
+# File: journal.py
+# Crash-safe save game: an append-only journal of turns with periodic snapshots.
+#
+# Layout of the file (little endian, fixed size):
+#   header   magic "SLJN", version, player count, final tile, ring size R, board checksum,
+#            rule flags (RuleSet.flags)
+#   slots    two snapshot slots: sequence number, GameState.snapshot() bytes, CRC32
+#   ring     R entries of (sequence number, code, check); entry n lives at n % R
+#              code 1-6: a dice roll played, code 0: a new game was started
+#
+# Every handle_move writes one 8-byte entry with os.pwrite, which is in the
+# kernel's hands as soon as the call returns, so a crash of the game process
+# loses nothing. A background thread fsyncs the file at most every
+# SYNC_INTERVAL_MS, so a click never waits for the disk. Every R / 2 entries
+# the state is written to the older snapshot slot; the ring always holds the
+# entries after either slot, so recovery reads one snapshot and replays at
+# most R entries, however long the session was.
+import os
+import struct
+import threading
+import zlib
+from pathlib import Path
+
+from core import CLASSIC, STANDARD, GameState, take_turn, move_table
+
+
+MAGIC = b"SLJN"
+VERSION = 2
+HEADER = struct.Struct("<4sHBHHIB")
+SLOT_HEADER = struct.Struct("<I")
+ENTRY = struct.Struct("<IBxH")
+
+NEW_GAME = 0
+DEFAULT_RING_SIZE = 1024
+SYNC_INTERVAL_MS = 200
+
+SAVE_DIR = Path(__file__).resolve().parent.parent / "saves"
+
+
+def _board_checksum(layout):
+    return zlib.crc32(repr(layout.key()).encode())
+
+
+def _entry_check(seq, code):
+    return zlib.crc32(ENTRY.pack(seq, code, 0)) & 0xFFFF
+
+
+class GameJournal:
+    """
+    Records the turns of a local game so it can be resumed after a crash.
+    Opening an existing journal for the same board, rules and player count recovers
+    its last state (see resumable); anything else starts a new file.
+    """
+
+    def __init__(self, path, num_players=4, layout=CLASSIC, rules=STANDARD, ring_size=DEFAULT_RING_SIZE,
+                 sync_interval_ms=SYNC_INTERVAL_MS):
+        if ring_size <= 0 or ring_size % 2:
+            raise ValueError("ring_size must be a positive even number")
+        self.path = SAVE_DIR / path  # Relative paths are kept in the saves folder
+        self.num_players = num_players
+        self.moves = move_table(layout, rules)
+        self.ring_size = ring_size
+        self.header = HEADER.pack(MAGIC, VERSION, num_players, layout.final_tile, ring_size,
+                                  _board_checksum(layout), rules.flags())
+        self.snapshot_size = len(GameState(num_players).snapshot())
+        self.slot_size = SLOT_HEADER.size + self.snapshot_size + 4
+        self.ring_start = HEADER.size + 2 * self.slot_size
+
+        # The recovered game, a GameState, or None if there was nothing to recover
+        self.recovered = None
+        self.seq = 0
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        if not self._recover():
+            self._create()
+
+        # Batched fsync, off the main thread
+        self._dirty = False
+        self._closed = threading.Event()
+        self._sync_interval = sync_interval_ms / 1000
+        self._syncer = threading.Thread(target=self._sync_loop, daemon=True)
+        self._syncer.start()
+
+    # --- Recovery ---
+    def _create(self):
+        """Starts a fresh file whose only content is the snapshot of a new game."""
+        os.ftruncate(self.fd, 0)
+        os.ftruncate(self.fd, self.ring_start + self.ring_size * ENTRY.size)
+        os.pwrite(self.fd, self.header, 0)
+        self.seq = 0
+        self._write_slot(0, GameState(self.num_players).snapshot())
+        os.fsync(self.fd)
+
+    def _read_slot(self, data, index):
+        start = HEADER.size + index * self.slot_size
+        seq, = SLOT_HEADER.unpack_from(data, start)
+        body = data[start:start + SLOT_HEADER.size + self.snapshot_size]
+        crc, = struct.unpack_from("<I", data, start + len(body))
+        if zlib.crc32(body) != crc:
+            return None
+        return seq, body[SLOT_HEADER.size:]
+
+    def _recover(self):
+        """Reads the newest valid snapshot and replays the entries after it."""
+        size = self.ring_start + self.ring_size * ENTRY.size
+        data = os.pread(self.fd, size, 0)
+        if len(data) != size or data[:HEADER.size] != self.header:
+            return False
+        slots = [slot for slot in (self._read_slot(data, 0), self._read_slot(data, 1)) if slot]
+        if not slots:
+            return False
+        seq, snapshot = max(slots)
+
+        state = GameState.from_snapshot(snapshot)
+        names = [""] * self.num_players
+        while True:
+            # Stop at the first entry that is missing, stale or torn
+            next_seq = seq + 1
+            entry_seq, code, check = ENTRY.unpack_from(data, self.ring_start + (next_seq % self.ring_size) * ENTRY.size)
+            if entry_seq != next_seq or check != _entry_check(entry_seq, code) or code > 6:
+                break
+            if code == NEW_GAME:
+                state.reset()
+            elif state.winner is None:
+                take_turn(state, code, names, self.moves)
+            seq = next_seq
+
+        self.seq = seq
+        self.recovered = state
+        return True
+
+    def resumable(self):
+        """The recovered game if it was started and not yet won, else None."""
+        state = self.recovered
+        if state is None or state.winner is not None or state.turn_count == 0:
+            return None
+        return state
+
+    # --- Recording ---
+    def _write_slot(self, index, snapshot):
+        body = SLOT_HEADER.pack(self.seq) + snapshot
+        os.pwrite(self.fd, body + struct.pack("<I", zlib.crc32(body)),
+                  HEADER.size + index * self.slot_size)
+
+    def _append(self, code, state):
+        self.seq += 1
+        seq = self.seq
+        os.pwrite(self.fd, ENTRY.pack(seq, code, _entry_check(seq, code)),
+                  self.ring_start + (seq % self.ring_size) * ENTRY.size)
+        # Compaction: the slot not written last gets the state after this entry
+        half = self.ring_size // 2
+        if seq % half == 0:
+            self._write_slot((seq // half) % 2, state.snapshot())
+        self._dirty = True
+
+    def record(self, roll, state):
+        """Records a roll that was just played; state is the game after it."""
+        self._append(roll, state)
+
+    def new_game(self, state):
+        """Records that a new game started; state is the reset game."""
+        self._append(NEW_GAME, state)
+
+    # --- Durability ---
+    def _sync_loop(self):
+        while not self._closed.wait(self._sync_interval):
+            if self._dirty:
+                self._dirty = False
+                os.fsync(self.fd)
+
+    def close(self):
+        if self._closed.is_set():
+            return
+        self._closed.set()
+        self._syncer.join()
+        os.fsync(self.fd)
+        os.close(self.fd)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,76 @@
+# File: loadgen.py
+# Load generator for server.py: every simulated client owns one room and rolls
+# as soon as the previous roll's broadcast arrives. Reports rolls per second and
+# the roll-to-broadcast latency.
+#
+#   python server.py &
+#   python loadgen.py --rooms 2000 --duration 10
+import argparse
+import asyncio
+import json
+import time
+
+from server import DEFAULT_PORT
+
+
+async def run_client(host, port, room, deadline, latencies, counters):
+    reader, writer = await asyncio.open_connection(host, port)
+    writer.write((json.dumps({"op": "join", "room": room}) + "\n").encode())
+    await reader.readline()
+
+    roll_id = 0
+    while time.perf_counter() < deadline:
+        roll_id += 1
+        sent = time.perf_counter()
+        writer.write((json.dumps({"op": "roll", "id": roll_id}) + "\n").encode())
+
+        # Wait for the broadcast produced by this roll
+        while True:
+            state = json.loads(await reader.readline())
+            if state.get("event") == "state" and state.get("id") == roll_id:
+                break
+        latencies.append(time.perf_counter() - sent)
+        counters["rolls"] += 1
+
+        if state["winner"] is not None:
+            counters["games"] += 1
+            writer.write(b'{"op": "reset"}\n')
+            await reader.readline()
+
+    writer.close()
+    await writer.wait_closed()
+
+
+async def run(host, port, rooms, duration):
+    latencies = []
+    counters = {"rolls": 0, "games": 0}
+    start = time.perf_counter()
+    deadline = start + duration
+    await asyncio.gather(*(run_client(host, port, f"load-{i}", deadline, latencies, counters)
+                           for i in range(rooms)))
+    return time.perf_counter() - start, latencies, counters
+
+
+def percentile(sorted_values, fraction):
+    return sorted_values[min(len(sorted_values) - 1, int(len(sorted_values) * fraction))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load generator for the room server.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--rooms", type=int, default=1000, help="concurrent rooms (one client each)")
+    parser.add_argument("--duration", type=float, default=10.0, help="seconds to run")
+    args = parser.parse_args()
+
+    elapsed, latencies, counters = asyncio.run(run(args.host, args.port, args.rooms, args.duration))
+    latencies.sort()
+    print(f"{args.rooms} rooms, {elapsed:.1f}s: {counters['rolls'] / elapsed:,.0f} rolls/s, "
+          f"{counters['games']} games finished")
+    if latencies:
+        print(f"roll-to-broadcast latency ms: p50 {percentile(latencies, 0.5) * 1000:.2f}  "
+              f"p95 {percentile(latencies, 0.95) * 1000:.2f}  p99 {percentile(latencies, 0.99) * 1000:.2f}")
+
+
+if __name__ == "__main__":
+    main()
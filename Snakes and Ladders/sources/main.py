@@ -1,12 +1,39 @@
 import pygame  # Imported Pygame library
 import sys
+import time
+import argparse
 
 # Import all core modules in the project
 from board import Board
-from player import Player
+from core import GameState, take_turn, CLASSIC, BoardError, load_board, move_table, parse_rules, RuleError, RuleSet
 from dice import Dice
-from chess import ChessManager
-from constants import SCREEN_WIDTH, SCREEN_HEIGHT, BLACK, WHITE, INFO_PANEL_WIDTH
+from chess import ChessManager, fan_offsets
+from win_probability import WinProbability
+from dice_policy import load_policy
+from renderer import DirtyRectRenderer
+from scheduler import FrameScheduler
+from text_cache import render_text
+from assets import load_atlas
+from animation import board_paths, PieceAnimator
+from dice_rng import CounterDice
+from replay import ReplayWriter
+from journal import GameJournal
+from game_stats import GameStats
+from net_client import RoomClient, NETWORK_EVENT
+from profiler import FrameProfiler, run_with_cprofile
+from constants import SCREEN_WIDTH, SCREEN_HEIGHT, BLACK, WHITE, INFO_PANEL_WIDTH, DIRTY_RECT_RENDERING, DICE_SEED, REPLAY_PATH, LAYOUT_FILE
+from constants import JOURNAL_PATH, RULES, WIN_ODDS_MAX_TILES, NUM_PLAYERS, MAX_PLAYERS, CHESS_SIZE, CHOOSE_DICE, SHOW_HINTS
+from constants import PANEL_ROW_HEIGHT, COMPACT_ROW_HEIGHT, COMPACT_ICON_SIZE
+from constants import BOT_TURN_DELAY_MS, BOT_RESTART_DELAY_MS
+
+# Hotkey that turns the frame profiler overlay on and off
+PROFILER_KEY = pygame.K_F3
+# Camera keys on scrolling boards: arrows scroll, +/- zoom, F follows the current player again
+SCROLL_KEYS = {pygame.K_LEFT: (-1, 0), pygame.K_RIGHT: (1, 0), pygame.K_UP: (0, -1), pygame.K_DOWN: (0, 1)}
+ZOOM_KEYS = {pygame.K_EQUALS: 1, pygame.K_PLUS: 1, pygame.K_KP_PLUS: 1, pygame.K_MINUS: -1, pygame.K_KP_MINUS: -1}
+FOLLOW_KEY = pygame.K_f
+# Choice-of-dice variant: turns the hint (the die the policy would play) on and off
+HINT_KEY = pygame.K_h
 
 
 class Button:
@@ -19,7 +46,7 @@ class Button:
 
     def draw(self, screen):
         pygame.draw.rect(screen, self.color, self.rect, border_radius=8)
-        txt = self.font.render(self.text, True, BLACK)
+        txt = render_text(self.font, self.text, BLACK)
         txt_r = txt.get_rect(center=self.rect.center)
         screen.blit(txt, txt_r)
 
@@ -32,8 +59,14 @@ NEW_BOARD_X = INFO_PANEL_WIDTH
 
 
 class Game:
-    def __init__(self):
+    def __init__(self, replay_path=REPLAY_PATH, server=None, layout=None, rules=None, bots=(),
+                 bot_delay_ms=BOT_TURN_DELAY_MS, profile=False, trace_path=None, journal_path=JOURNAL_PATH,
+                 num_players=NUM_PLAYERS, choose_dice=CHOOSE_DICE):
         # Set all basic components and initial states
+        if not 1 <= num_players <= MAX_PLAYERS:
+            raise ValueError(f"num_players must be between 1 and {MAX_PLAYERS}, got {num_players}")
+        if choose_dice and server:
+            raise ValueError("the choice-of-dice variant is for local games; the server rolls one die")
 
         pygame.init() 
         # Initialize Pygame system
@@ -41,6 +74,7 @@ class Game:
         self.font = pygame.font.Font(None, 24) 
         self.large_font = pygame.font.Font(None, 48)
         self.title_font = pygame.font.Font(None, 96) # Font for the menu title
+        self.small_font = pygame.font.Font(None, 20) # Font for the compact info rows
         
         self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT)) 
         # Create the main display window
@@ -48,21 +82,66 @@ class Game:
         pygame.display.set_caption("Snakes and Ladders") 
         
         self.game_state = 'menu'  # Initial game state
-        self.winner = None
         self.message = "Click START GAME to begin!" # Game status message
         
-        self.board = Board()     
-        self.dice = Dice()
-        self.chess_manager = ChessManager()
+        # Board layout (size, snakes, ladders and the compiled jump table)
+        if layout is None:
+            layout = load_board(LAYOUT_FILE) if LAYOUT_FILE else CLASSIC
+        self.layout = layout
+        self.board = Board(layout)     
+        # House rules compiled with the board into the move tables every turn is played from
+        self.rules = parse_rules(RULES) if rules is None else rules
+        self.moves = move_table(layout, self.rules)
+        # Choice-of-dice variant: every roll is a pair and the player moves by one die.
+        # The best die per tile and pair is solved once per board (see dice_policy.py)
+        self.choose_dice = choose_dice
+        self.policy = load_policy(layout, self.rules) if choose_dice else None
+        self.pending_dice = None # The pair a person rolled and has not picked from yet
+        self.show_hints = SHOW_HINTS
+        self.atlas = load_atlas() # One sprite sheet for the chess pieces and the dice
+        self.dice = Dice(self.atlas, CounterDice(DICE_SEED), pair=choose_dice)
+        self.chess_manager = ChessManager(self.atlas)
         # Instantiate core game components
 
-        self.players = [
-            Player(0, "Player 1"),
-            Player(1, "Player 2"), 
-            Player(2, "Player 3"),
-            Player(3, "Player 4")
-        ]
-        self.current_player = 0 # Index of the current player (0 to 3)
+        # Seats (from 0) played by bots: they roll on their own, bot_delay_ms apart
+        self.bot_seats = frozenset(bots)
+        self.bot_delay_ms = bot_delay_ms
+        self.last_turn_ticks = 0
+
+        self.names = [f"Bot {i+1}" if i in self.bot_seats else f"Player {i+1}" for i in range(num_players)]
+        # Positions, current player, winner and turn count in one compact array
+        self.state = GameState(len(self.names))
+
+        # Info panel rows: the classic four, or compact rows that scroll on a big table
+        self.row_height = PANEL_ROW_HEIGHT if len(self.names) <= 4 else COMPACT_ROW_HEIGHT
+        self.panel_scroll = 0
+        # (surface, rect) of every piece this frame, built once per draw (see layout_pieces)
+        self.piece_sprites = []
+
+        # Pieces walk tile by tile and slide/climb along precomputed paths
+        self.animator = PieceAnimator(board_paths(self.board), len(self.names))
+
+        # Running totals over every game played in this session (fixed size, see game_stats.py)
+        self.stats = GameStats(len(self.names), layout)
+
+        # Exact win chances shown in the info panel, recomputed once per dice click
+        self.win_odds = self.make_win_odds()
+        self.update_win_chances()
+
+        # Optional (host, port, room) on server.py; the server then rolls and applies the rules.
+        # Connected after pygame.init so the reader thread can post events
+        self.remote = RoomClient(*server) if server else None
+
+        # Optional binary record of every roll of the session (see replay.py)
+        self.replay = ReplayWriter(replay_path, len(self.names), layout, rules=self.rules) if replay_path else None
+
+        # Journal of every turn of the local game, so a crashed session can be resumed
+        # from the menu (see journal.py). A server room keeps its own state.
+        self.journal = None
+        self.resume_state = None
+        if journal_path and server is None:
+            self.journal = GameJournal(journal_path, len(self.names), layout, self.rules)
+            self.resume_state = self.journal.resumable()
 
         # Button definitions for Menu and End screen
         button_w, button_h = 200, 60
@@ -73,90 +152,414 @@ class Game:
         
         self.quit_menu_button = Button((SCREEN_WIDTH // 2 - button_w // 2, button_y_start + 80, button_w, button_h), 
                                     "QUIT GAME", self.large_font, (200, 0, 0))
+
+        self.resume_button = Button((SCREEN_WIDTH // 2 - button_w // 2, button_y_start - 80, button_w, button_h),
+                                    "RESUME", self.large_font, (255, 200, 0))
         
         self.restart_button = Button((SCREEN_WIDTH // 2 - 120, SCREEN_HEIGHT // 2 + 50, 100, 50), 
                                      "PLAY AGAIN", self.font, (0, 255, 0))
         self.quit_button = Button((SCREEN_WIDTH // 2 + 20, SCREEN_HEIGHT // 2 + 50, 100, 50), 
                                   "EXIT", self.font, (255, 0, 0))
+
+        # Dirty-rectangle rendering: static layers are composited once and only
+        # the regions that changed are pushed to the display
+        self.renderer = DirtyRectRenderer(self.screen) if DIRTY_RECT_RENDERING else None
+        self.message_rect = pygame.Rect(NEW_BOARD_X, 10, SCREEN_WIDTH - NEW_BOARD_X, self.font.get_linesize())
+        # Below the board: the hint line, and both dice with the hint's highlight around them
+        self.hint_rect = pygame.Rect(NEW_BOARD_X + 10, SCREEN_HEIGHT - 38, 560, self.font.get_linesize())
+        self.dice_rect = self.dice.rect.union(self.dice.second_rect).inflate(10, 10) if choose_dice else self.dice.rect
+        self.hint_area = self.hint_rect.union(self.dice_rect)
+        self.panel_rect = pygame.Rect(0, 0, INFO_PANEL_WIDTH, SCREEN_HEIGHT)
+        # The board image covers the right edge of the panel
+        board_rect = self.board.view
+        self.panel_board_overlap = board_rect.clip((0, 0, INFO_PANEL_WIDTH, SCREEN_HEIGHT))
+
+        # One persistent frame clock; the loop sleeps while nothing is animating
+        self.scheduler = FrameScheduler()
+
+        # Frame profiler (F3); trace_path gets a Chrome trace of the session on exit
+        self.profiler = None
+        self.trace_path = trace_path
+        if profile or trace_path:
+            self.toggle_profiler()
     
 
     # Utility method to draw text
     def draw_text(self, screen, text, color, pos, font):
-        text_surface = font.render(text, True, color)
+        text_surface = render_text(font, text, color)
         screen.blit(text_surface, pos)
 
     # Method to draw the left side info panel
     def draw_info_panel(self, screen):
         panel_rect = pygame.Rect(0, 0, INFO_PANEL_WIDTH, SCREEN_HEIGHT)
         pygame.draw.rect(screen, BLACK, panel_rect)
-        
-        
-        for i, player in enumerate(self.players):
-            y_start = 50 + i * 120
+        self.draw_player_rows(screen)
+
+    # Top of a player's info row on screen (rows scroll on a big table)
+    def row_top(self, seat):
+        return 20 + seat * self.row_height - self.panel_scroll
+
+    # Seats whose info rows are at least partly on screen
+    def visible_rows(self):
+        first = max(0, (self.panel_scroll - 20) // self.row_height)
+        last = min(len(self.names) - 1, (self.panel_scroll + SCREEN_HEIGHT - 20) // self.row_height)
+        return range(first, last + 1)
+
+    # Scrolls the info panel by pixels, keeping the rows on screen
+    def scroll_panel(self, pixels):
+        limit = max(0, 30 + len(self.names) * self.row_height - SCREEN_HEIGHT)
+        self.panel_scroll = min(max(self.panel_scroll + pixels, 0), limit)
+
+    # Scrolls the info panel just enough to show the current player's row
+    def show_current_row(self):
+        top = self.row_top(self.state.current_player)
+        if top < 0:
+            self.scroll_panel(top)
+        elif top + self.row_height > SCREEN_HEIGHT:
+            self.scroll_panel(top + self.row_height - SCREEN_HEIGHT)
+
+    # Highlight border of the current player's row. It is filled as four strips:
+    # an outlined draw.rect is drawn wrongly when a moving piece's dirty region clips it
+    def draw_row_highlight(self, screen, box):
+        for edge in ((box.x, box.y, box.w, 2), (box.x, box.bottom - 2, box.w, 2),
+                     (box.x, box.y, 2, box.h), (box.right - 2, box.y, 2, box.h)):
+            screen.fill((0, 255, 0), edge)
+
+    # Method to draw one compact info row: a small icon, the name, then position and win chance
+    def draw_compact_row(self, screen, i):
+        top = self.row_top(i)
+        is_current = (i == self.state.current_player)
+        icon = self.chess_manager.get_chess_piece(i, COMPACT_ICON_SIZE)
+        screen.blit(icon, (5, top + (COMPACT_ROW_HEIGHT - COMPACT_ICON_SIZE) // 2))
+        self.draw_text(screen, self.names[i][:10], (255, 255, 0) if is_current else WHITE, (34, top + 4), self.small_font)
+        chance = self.win_chances[i]
+        self.draw_text(screen, f"{self.state.position(i)}  " + ("--" if chance is None else f"{chance:.0%}"),
+                       WHITE, (34, top + 19), self.small_font)
+        if is_current:
+            self.draw_row_highlight(screen, pygame.Rect(0, top, INFO_PANEL_WIDTH, COMPACT_ROW_HEIGHT))
+
+    # Method to draw one info row (icon, name, position, win chance) per visible player
+    def draw_player_rows(self, screen):
+        clip = screen.get_clip()
+        for i in self.visible_rows():
+            # Only the rows inside the region being repainted
+            if not clip.colliderect(0, self.row_top(i), INFO_PANEL_WIDTH, self.row_height):
+                continue
+            if self.row_height != PANEL_ROW_HEIGHT:
+                self.draw_compact_row(screen, i)
+                continue
+            name = self.names[i]
+            y_start = self.row_top(i) + 30
             icon_pos = (INFO_PANEL_WIDTH // 2, y_start) 
             self.chess_manager.draw_chess_piece(screen, i, icon_pos)
             
-            is_current = (i == self.current_player)
+            is_current = (i == self.state.current_player)
             name_color = (255, 255, 0) if is_current else WHITE
             
-            self.draw_text(screen, player.name[:8], name_color, (5, y_start + 25), self.font)
-            self.draw_text(screen, f"Pos: {player.position}", WHITE, (5, y_start + 45), self.font)
+            self.draw_text(screen, name[:8], name_color, (5, y_start + 25), self.font)
+            self.draw_text(screen, f"Pos: {self.state.position(i)}", WHITE, (5, y_start + 45), self.font)
+            chance = self.win_chances[i]
+            self.draw_text(screen, "Win: --" if chance is None else f"Win: {chance:.0%}", WHITE, (5, y_start + 62), self.font)
             
             if is_current:
                  # Highlight the current player
-                 pygame.draw.rect(screen, (0, 255, 0), (0, y_start - 30, INFO_PANEL_WIDTH, 100), 2)
+                 self.draw_row_highlight(screen, pygame.Rect(0, y_start - 30, INFO_PANEL_WIDTH, 110))
     
     # Method to reset the game state
     def reset_game(self):
-        self.players = [Player(i, f"Player {i+1}") for i in range(4)]
-        self.current_player = 0
+        self.state.reset()
+        self.animator.finish()
         self.game_state = 'running'
-        self.winner = None
         self.message = "Game reset. Click the dice!"
         self.dice.value = 1
+        self.pending_dice = None
+        self.dice.new_game()
+        self.update_win_chances()
+        self.show_current_row()
+        if self.journal is not None:
+            self.journal.new_game(self.state)
+
+    # Method to continue the game recovered from the journal
+    def resume_game(self):
+        self.state.restore(self.resume_state.snapshot())
+        self.resume_state = None
+        if self.replay is not None:
+            # The record goes on from the restored positions, not from the start
+            self.replay.start_from(self.state)
+        self.pending_dice = None
+        self.game_state = 'running'
+        self.message = f"Resumed at turn {self.state.turn_count}. {self.names[self.state.current_player]} to roll."
+        self.update_win_chances()
+        self.show_current_row()
+
+    # Method to build the win chance evaluator; huge event boards show no odds,
+    # since the exact solve grows steeply with the board size, and neither does the
+    # choice of dice, whose moves the single-die chain does not describe
+    def make_win_odds(self):
+        if self.layout.final_tile > WIN_ODDS_MAX_TILES or self.choose_dice:
+            return None
+        return WinProbability(self.layout, self.rules)
+
+    # Method to refresh the win chances after the positions or the turn changed.
+    # The evaluator is memoized, so this is only a dict lookup for repeated states.
+    def update_win_chances(self):
+        if self.win_odds is None:
+            self.win_chances = [None] * len(self.names)
+            return
+        self.win_chances = self.win_odds.evaluate(self.state.positions, self.state.current_player, self.state.streak)
+
+    # Method to roll for the current player. With the choice of dice a bot moves
+    # by the die the policy picks, and a person's pair waits for a click on one
+    def play_roll(self, bot=False):
+        if not self.choose_dice:
+            self.handle_move(self.dice.roll())
+            return
+        first, second = self.dice.roll_pair()
+        if bot:
+            seat = self.state.current_player
+            self.handle_move(self.policy.best_roll(self.state.position(seat), first, second, self.state.streak))
+        else:
+            self.pending_dice = (first, second)
+            self.message = f"{self.names[self.state.current_player]} rolled {first} and {second}. Click a die to move by it."
+
+    # The hint for the pair waiting to be played: (die to play, text), or None
+    # when there is nothing to pick or hints are off. Both are table lookups.
+    def hint(self):
+        if self.pending_dice is None or not self.show_hints:
+            return None
+        first, second = self.pending_dice
+        position = self.state.position(self.state.current_player)
+        streak = self.state.streak
+        roll = self.policy.best_roll(position, first, second, streak)
+        text = f"Hint: move {roll}, about {self.policy.turns_left(position, streak, roll):.1f} turns to go"
+        other = second if roll == first else first
+        if other != roll:
+            text += f" ({other}: {self.policy.turns_left(position, streak, other):.1f})"
+        return roll, text
+
+    # Method to draw the hint: a highlight around the die to play and the expected turns left
+    def draw_hint(self, screen):
+        hint = self.hint()
+        if hint is None:
+            return
+        roll, text = hint
+        die_rect = self.dice.rect if roll == self.dice.value else self.dice.second_rect
+        self.draw_row_highlight(screen, die_rect.inflate(10, 10))
+        self.draw_text(screen, text, BLACK, self.hint_rect.topleft, self.font)
 
     # Method to handle player movement and update game messages
     def handle_move(self, steps):
         
-        player = self.players[self.current_player]
-        old_pos = player.position
+        self.pending_dice = None
+        if self.replay is not None:
+            self.replay.record(steps)
+
+        seat = self.state.current_player
+        old_pos = self.state.position(seat)
+
+        # The rules and messages live in core.take_turn; this only applies the result
+        result = take_turn(self.state, steps, self.names, self.moves)
+        if self.journal is not None:
+            self.journal.record(steps, self.state)
+        self.message = result.message
+        self.stats.record_landing(result.landed)
+        if result.winner is not None:
+            self.stats.record_game(self.state.turn_count, result.winner)
+        # Walk to the tile the roll landed on (no animation for a roll that went nowhere)
+        self.animator.start(seat, old_pos, result.landed, steps)
+        # A new move brings a camera that was scrolled away back to the pieces
+        self.board.camera.following = True
+        if result.winner is not None and not self.animator.busy():
+             self.game_state = 'end' # Change state to end (after the winning move is shown)
+        self.update_win_chances()
+        self.show_current_row()
+        self.last_turn_ticks = pygame.time.get_ticks()
         
-        # player.move returns (move_type, is_winner)
-        move_type, is_winner = player.move(steps, self.board) 
-        new_pos = player.position
         
-        # Message update logic
-        if is_winner:
-             self.message = f" {player.name} WINS!"
-             self.winner = player
-             self.game_state = 'end' # Change state to end
-        elif old_pos + steps > 100:
-             self.message = f"{player.name} overshoots. Stays at {old_pos}."
-        elif move_type == 'ladder':
-             self.message = f"{player.name} climbs a ladder to {new_pos}!"
-        elif move_type == 'snake':
-             self.message = f" {player.name} slides down a snake to {new_pos}!"
-        else:
-             self.message = f"{player.name} rolled {steps}, moves to {new_pos}."
+    # Method to apply a state broadcast from the room server (see server.py)
+    def apply_remote_state(self, message):
+        if message["event"] == "state":
+            if message["rules"] != self.rules.flags():
+                # The room plays other house rules: evaluate the win chances with those
+                self.rules = RuleSet.from_flags(message["rules"])
+                self.moves = move_table(self.layout, self.rules)
+                self.win_odds = self.make_win_odds()
+            # Animate the move when this broadcast is the turn after the one on screen
+            seat = self.state.current_player
+            old_pos = self.state.position(seat)
+            if message["turn"] == self.state.turn_count + 1 and message["roll"]:
+                self.animator.start(seat, old_pos, message["landed"], message["roll"])
+
+            if message["turn"] == 0:
+                self.animator.finish() # The room started a new game
+            self.state.positions = message["positions"]
+            self.state.current_player = message["current"]
+            self.state.winner = message["winner"]
+            self.state.streak = message["streak"]
+            self.state.turn_count = message["turn"]
+            self.message = message["message"]
+            self.dice.value = message["roll"] or 1
+            if message["winner"] is not None:
+                if not self.animator.busy():
+                    self.game_state = 'end'
+            elif self.game_state == 'end':
+                # Somebody in the room started the next game
+                self.game_state = 'running'
+            self.update_win_chances()
+            self.show_current_row()
+        elif message["event"] == "error":
+            self.message = message["message"]
+        elif message["event"] == "closed":
+            self.message = "Disconnected from the server."
+
+    # Method to draw the menu screen
+    def draw_menu(self, screen):
+        screen.fill(BLACK)
+
+        # Draw game title
+        title_text = "SNAKES AND LADDERS"
+        title_surf = render_text(self.title_font, title_text, (255, 255, 0)) 
+        title_rect = title_surf.get_rect(center=(SCREEN_WIDTH // 2, 150))
+        screen.blit(title_surf, title_rect)
         
+        # Draw menu buttons
+        if self.resume_state is not None:
+            self.resume_button.draw(screen)
+        self.start_game_button.draw(screen)
+        self.quit_menu_button.draw(screen)
+
+    # Method to draw the game over screen
+    def draw_end(self, screen):
+        screen.fill(BLACK)
+        win_msg = f"  {self.names[self.state.winner]} win WIN wiiiiinn!"
+        self.draw_text(screen, win_msg, (255, 255, 0), (SCREEN_WIDTH // 2 - len(win_msg) * 10, SCREEN_HEIGHT // 2 - 50), self.large_font)
         
+        # Draw end screen buttons
+        self.restart_button.draw(screen)
+        self.quit_button.draw(screen)
+
+    # Screen point of a player's piece: its tile center, or the point reached
+    # along the move animation, where the camera shows it
+    def piece_screen_pos(self, seat, position):
+        return self.board.to_screen(self.animator.piece_center(seat, position))
+
+    # Where every piece is drawn this frame, as (surface, rect) in seat order.
+    # Resting pieces that share a tile are fanned out in a grid that fits the
+    # tile (smaller when many share it); a moving piece is drawn full size.
+    def layout_pieces(self):
+        stacks = {}
+        active = self.animator.active
+        for seat, position in enumerate(self.state.positions):
+            if not active[seat]:
+                stacks.setdefault(position, []).append(seat)
+        sprites = [None] * len(self.names)
+        tile_size = self.board.camera.tile_size
+        for position, seats in stacks.items():
+            x, y = self.piece_screen_pos(seats[0], position)
+            size, offsets = fan_offsets(len(seats), tile_size, CHESS_SIZE[0])
+            for seat, (dx, dy) in zip(seats, offsets):
+                piece = self.chess_manager.get_chess_piece(seat, size)
+                sprites[seat] = (piece, piece.get_rect(center=(x + dx, y + dy)))
+        for seat, moving in enumerate(active):
+            if moving:
+                piece = self.chess_manager.get_chess_piece(seat)
+                sprites[seat] = (piece, piece.get_rect(center=self.piece_screen_pos(seat, self.state.position(seat))))
+        return sprites
+
+    # Method to draw every player's piece: one batched blit of the pieces that
+    # touch the region being repainted
+    def draw_pieces(self, screen):
+        clip = screen.get_clip()
+        region = clip
+        if self.board.procedural:
+            # Pieces scrolled out of the board view are cut off at its edge
+            region = clip.clip(self.board.view)
+            screen.set_clip(region)
+        sprites = self.piece_sprites
+        touching = region.collidelistall([rect for _, rect in sprites])
+        screen.blits([sprites[i] for i in touching], doreturn=False)
+        if region is not clip:
+            screen.set_clip(clip)
+
+    # Static layers of the running screen, composited once by the renderer
+    def draw_static_layers(self, surface):
+        surface.fill(WHITE)
+        pygame.draw.rect(surface, BLACK, (0, 0, INFO_PANEL_WIDTH, SCREEN_HEIGHT))
+        if not self.board.procedural:
+            self.board.draw(surface) # A scrolling board is a dynamic layer
+
+    # Dynamic layers of the running screen, repainted inside each dirty region.
+    # A frame repaints several small regions, so every layer that lies outside
+    # the region is skipped instead of being drawn and clipped away.
+    def draw_dynamic_layers(self, screen):
+        clip = screen.get_clip()
+        if clip.colliderect(self.panel_rect):
+            self.draw_player_rows(screen)
+        if self.board.procedural:
+            if clip.colliderect(self.board.view):
+                self.board.draw(screen) # Only the visible tiles; redrawn when the camera moves
+        elif clip.colliderect(self.panel_board_overlap):
+            # Put the board back over the rows, as the full redraw does
+            screen.blit(self.renderer.background, self.panel_board_overlap, self.panel_board_overlap)
+
+        if clip.colliderect(self.dice.area):
+            self.dice.draw(screen)
+        if self.choose_dice and clip.colliderect(self.hint_area):
+            self.draw_hint(screen)
+        if clip.colliderect(self.message_rect):
+            self.draw_text(screen, self.message, BLACK, (NEW_BOARD_X, 10), self.font)
+        self.draw_pieces(screen)
+
+    # Screen regions of the running screen and the state they show
+    def dirty_items(self):
+        items = {
+            'dice': (self.dice.rect, self.dice.value),
+            'message': (self.message_rect, self.message),
+        }
+        if self.choose_dice:
+            hint = self.hint()
+            items['dice'] = (self.dice_rect, (self.dice.value, self.dice.second_value, hint))
+            items['hint'] = (self.hint_rect, hint)
+        if self.board.procedural:
+            # The whole view changes when the camera scrolls or zooms
+            items['board'] = (self.board.view, self.board.camera.key())
+        positions = self.state.positions
+        for i in self.visible_rows():
+            row_rect = pygame.Rect(0, self.row_top(i), INFO_PANEL_WIDTH, self.row_height)
+            row_state = (self.names[i], positions[i], i == self.state.current_player, self.win_chances[i])
+            items['row', i] = (row_rect, row_state)
+
+        for i, (piece, rect) in enumerate(self.piece_sprites):
+            if self.board.procedural:
+                rect = rect.clip(self.board.view)
+                if not rect:
+                    continue # Scrolled out of view
+            items['piece', i] = (rect, None)
+        return items
+
+    # Dirty-rectangle drawing for all three game states
+    def draw_dirty(self):
+        if self.game_state == 'running':
+            self.renderer.set_scene('running', self.draw_static_layers)
+            self.renderer.render(self.dirty_items(), self.draw_dynamic_layers)
+        else:
+            # Menu and end screens are fully static once composited
+            draw_static = self.draw_menu if self.game_state == 'menu' else self.draw_end
+            self.renderer.set_scene((self.game_state, self.state.winner), draw_static)
+            self.renderer.render({}, lambda screen: None)
+
     # Main drawing method, handling all three game states
     def draw(self):
-        
+        if self.game_state == 'running':
+            # Shared by dirty_items and every draw_pieces call of this frame
+            self.piece_sprites = self.layout_pieces()
+        if self.renderer is not None:
+            self.draw_dirty()
+            return
+
         if self.game_state == 'menu':
             # --- Menu screen drawing ---
-            self.screen.fill(BLACK)
-
-            # Draw game title
-            title_text = "SNAKES AND LADDERS"
-            title_surf = self.title_font.render(title_text, True, (255, 255, 0)) 
-            title_rect = title_surf.get_rect(center=(SCREEN_WIDTH // 2, 150))
-            self.screen.blit(title_surf, title_rect)
-            
-            # Draw menu buttons
-            self.start_game_button.draw(self.screen)
-            self.quit_menu_button.draw(self.screen)
-        
+            self.draw_menu(self.screen)
 
         elif self.game_state == 'running':
 
@@ -167,73 +570,279 @@ class Game:
             self.draw_info_panel(self.screen) 
             self.board.draw(self.screen)
             self.dice.draw(self.screen)
+            if self.choose_dice:
+                self.draw_hint(self.screen)
             self.draw_text(self.screen, self.message, BLACK, (NEW_BOARD_X, 10), self.font)
-            
-            
-            for i, player in enumerate(self.players):
-            # Iterate through all players
-            
-                pos = self.board.get_tile_center(player.position)
-            # Convert player's logical position (1-100) to pixel coordinates
-
-                self.chess_manager.draw_chess_piece(self.screen, i, pos)
+            self.draw_pieces(self.screen)
 
         elif self.game_state == 'end':
             # --- Game over screen drawing ---
-            self.screen.fill(BLACK)
-            win_msg = f"  {self.winner.name} win WIN wiiiiinn!"
-            self.draw_text(self.screen, win_msg, (255, 255, 0), (SCREEN_WIDTH // 2 - len(win_msg) * 10, SCREEN_HEIGHT // 2 - 50), self.large_font)
-            
-            # Draw end screen buttons
-            self.restart_button.draw(self.screen)
-            self.quit_button.draw(self.screen)
+            self.draw_end(self.screen)
             
         
         pygame.display.flip()
         # Push the rendered frame to the physical display
     
 
+    # Whether the current turn belongs to a bot (never in a server room, where
+    # every roll goes through the server)
+    def bot_to_move(self):
+        return (self.game_state == 'running' and self.remote is None and self.state.winner is None
+                and self.state.current_player in self.bot_seats)
+
+    # Whether something on screen changes without input: a moving piece or a bot
+    # waiting for its turn, so otherwise the main loop can sleep until the next click
+    def is_animating(self):
+        if self.animator.busy() or self.bot_to_move():
+            return True
+        if self.game_state == 'running' and not self.board.camera.settled():
+            return True
+        # A table of only bots starts its next game on its own
+        return self.game_state == 'end' and self.remote is None and len(self.bot_seats) == len(self.names)
+
+    # Plays the bot turns that are due; called once per frame from run()
+    def update_bots(self):
+        now = pygame.time.get_ticks()
+        if self.animator.busy():
+            return
+        if self.bot_to_move():
+            if now - self.last_turn_ticks >= self.bot_delay_ms:
+                self.play_roll(bot=True)
+        elif self.is_animating() and now - self.last_turn_ticks >= BOT_RESTART_DELAY_MS:
+            self.reset_game()
+            self.last_turn_ticks = now
+
+    # Advances the move animations by the elapsed time; the game ends once the
+    # winning move has been shown
+    def update_animations(self):
+        self.animator.update()
+        if self.game_state == 'running' and self.state.winner is not None and not self.animator.busy():
+            self.game_state = 'end'
+
+    # Keeps a scrolling board's camera on the moving piece, or on the current
+    # player's piece between moves; called once per frame from run()
+    def update_camera(self):
+        if not self.board.procedural or self.game_state != 'running':
+            return
+        seat = self.state.current_player
+        for i, active in enumerate(self.animator.active):
+            if active:
+                seat = i
+                break
+        camera = self.board.camera
+        camera.follow(self.animator.piece_center(seat, self.state.position(seat)))
+        camera.update()
+
+    # Handles the mouse wheel, right/middle-button drags and camera keys on a
+    # scrolling board; returns True when the event moved the camera
+    def handle_camera_event(self, event):
+        if not self.board.procedural or self.game_state != 'running':
+            return False
+        camera = self.board.camera
+        if event.type == pygame.MOUSEWHEEL:
+            return camera.zoom_by(event.y, pygame.mouse.get_pos())
+        if event.type == pygame.MOUSEMOTION and (event.buttons[1] or event.buttons[2]):
+            camera.scroll(-event.rel[0], -event.rel[1])
+            return True
+        if event.type == pygame.KEYDOWN:
+            if event.key in SCROLL_KEYS:
+                dx, dy = SCROLL_KEYS[event.key]
+                camera.scroll(dx * camera.tile_size, dy * camera.tile_size)
+                return True
+            if event.key in ZOOM_KEYS:
+                return camera.zoom_by(ZOOM_KEYS[event.key])
+            if event.key == FOLLOW_KEY:
+                camera.following = True
+                return True
+        return False
+
+    # Fast-forward: every turn is played by a bot as fast as the rules allow (no animation).
+    # Only every frame_skip-th turn is drawn (0 = only the end of each game),
+    # so without drawing a whole game takes a few milliseconds (soak testing).
+    # Returns the number of turns played.
+    def autoplay(self, games=1, frame_skip=0):
+        turns = 0
+        self.animator.enabled = False
+        for _ in range(games):
+            self.reset_game()
+            while self.game_state == 'running':
+                self.play_roll(bot=True)
+                turns += 1
+                if frame_skip and turns % frame_skip == 0:
+                    pygame.event.pump() # Keep the window responsive
+                    self.draw()
+            self.draw()
+        self.animator.enabled = True
+        return turns
+
+    # Handles one frame's events; returns False once the player asked to quit
+    def handle_events(self, events):
+        running = True
+        for event in events:
+            if event.type == pygame.QUIT:
+                running = False
+            elif event.type == NETWORK_EVENT:
+                self.apply_remote_state(event.message)
+            elif event.type == pygame.KEYDOWN and event.key == PROFILER_KEY:
+                self.toggle_profiler()
+            elif event.type == pygame.KEYDOWN and event.key == HINT_KEY and self.choose_dice:
+                self.show_hints = not self.show_hints
+            elif event.type == pygame.MOUSEWHEEL and self.game_state == 'running' \
+                    and pygame.mouse.get_pos()[0] < INFO_PANEL_WIDTH:
+                self.scroll_panel(-event.y * self.row_height) # The wheel over the panel scrolls the rows
+            elif self.handle_camera_event(event):
+                pass
+            elif event.type == pygame.MOUSEBUTTONDOWN:
+                
+                if self.game_state == 'menu': # Menu state input handler
+                    if self.resume_state is not None and self.resume_button.is_clicked(event.pos):
+                        self.resume_game()
+                        self.last_turn_ticks = pygame.time.get_ticks()
+                    elif self.start_game_button.is_clicked(event.pos):
+                        self.game_state = 'running'
+                        self.message = "Click the dice to start the round!"
+                        self.last_turn_ticks = pygame.time.get_ticks()
+                        if self.journal is not None:
+                            # The journal may still hold the game that was not resumed
+                            self.resume_state = None
+                            self.journal.new_game(self.state)
+                    elif self.quit_menu_button.is_clicked(event.pos):
+                        running = False
+                
+                elif self.game_state == 'running': # Running state input handler
+                    if self.pending_dice is not None:
+                        steps = self.dice.value_at(event.pos)
+                        if steps is not None:
+                            self.handle_move(steps) # Move by the die that was clicked
+                    elif self.dice.value_at(event.pos) is not None and self.state.winner is None \
+                            and not self.bot_to_move():
+                        
+                        if self.remote is not None:
+                            self.remote.roll() # The server rolls and broadcasts the new state
+                        else:
+                            self.play_roll() # Execute movement (or wait for the pick), update messages and switch player
+                        
+                        
+                elif self.game_state == 'end': # End state input handler
+                    if self.restart_button.is_clicked(event.pos):
+                        if self.remote is not None:
+                            self.remote.reset()
+                        else:
+                            self.reset_game()
+                    elif self.quit_button.is_clicked(event.pos):
+                        running = False
+        return running
+
+    # Turns the frame profiler (and its overlay) on or off. While off, none of
+    # the game's methods are wrapped, so profiling costs nothing.
+    def toggle_profiler(self):
+        if self.profiler is None:
+            self.profiler = FrameProfiler()
+        if self.profiler.installed:
+            self.profiler.uninstall()
+            if self.renderer is not None:
+                self.renderer.invalidate() # Paint over the overlay
+        else:
+            self.profiler.install(self)
+
     # Main game loop
     def run(self):
         running = True
         while running:
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    running = False
-                elif event.type == pygame.MOUSEBUTTONDOWN:
-                    
-                    if self.game_state == 'menu': # Menu state input handler
-                        if self.start_game_button.is_clicked(event.pos):
-                            self.game_state = 'running'
-                            self.message = "Click the dice to start the round!"
-                        elif self.quit_menu_button.is_clicked(event.pos):
-                            running = False
-                    
-                    elif self.game_state == 'running': # Running state input handler
-                        if self.dice.rect.collidepoint(event.pos):
-                            
-                            steps = self.dice.roll()
-                            self.handle_move(steps) # Execute movement and update messages
-                            
-                            # Switch to the next player only if the game is still running
-                            if self.game_state == 'running':
-                                self.current_player = (self.current_player + 1) % len(self.players)
-                            
-                            
-                    elif self.game_state == 'end': # End state input handler
-                        if self.restart_button.is_clicked(event.pos):
-                            self.reset_game()
-                        elif self.quit_button.is_clicked(event.pos):
-                            running = False
-
+            running = self.handle_events(self.scheduler.next_events(self.is_animating()))
             
+            self.update_animations()
+            self.update_camera()
+            self.update_bots()
             self.draw()
-            pygame.time.Clock().tick(60) # Set max frame rate to 60 FPS
+
+            if self.profiler is not None and self.profiler.installed:
+                self.profiler.end_frame()
+                self.profiler.draw_overlay(self.screen)
         
+        if self.trace_path is not None and self.profiler is not None:
+            count = self.profiler.export_trace(self.trace_path)
+            print(f"{count} trace events written to {self.trace_path}")
+        if self.replay is not None:
+            self.replay.close()
+        if self.journal is not None:
+            self.journal.close()
+        if self.remote is not None:
+            self.remote.close()
         pygame.quit()
         sys.exit()
 
 # Script execution entry point
 if __name__ == "__main__":
-    game = Game()
-    game.run()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Snakes and Ladders")
+    parser.add_argument("--connect", metavar="HOST:PORT", help="play in a room on server.py")
+    parser.add_argument("--room", default="lobby", help="room to join with --connect")
+    parser.add_argument("--board", default=LAYOUT_FILE, help="board file (.json or .toml), classic board if omitted")
+    parser.add_argument("--rules", default=RULES,
+                        help="house rules, e.g. bounce,extra-six,three-sixes,start-six (default: standard)")
+    parser.add_argument("--players", type=int, default=NUM_PLAYERS,
+                        help=f"number of players, 1 to {MAX_PLAYERS} (server rooms always seat 4)")
+    parser.add_argument("--choose-dice", action="store_true", default=CHOOSE_DICE,
+                        help="roll two dice and move by either (bots play the best choice, H shows a hint)")
+    parser.add_argument("--bots", default="", metavar="SEATS",
+                        help="seats played by bots, e.g. 2,3,4 or all")
+    parser.add_argument("--speed", type=float, default=1000 / BOT_TURN_DELAY_MS,
+                        help="bot turns per second when watching")
+    parser.add_argument("--autoplay", type=int, default=0, metavar="GAMES",
+                        help="fast-forward GAMES all-bot games, then exit")
+    parser.add_argument("--frame-skip", type=int, default=0, metavar="N",
+                        help="with --autoplay, draw every Nth turn (0: only each game's end)")
+    parser.add_argument("--profile", action="store_true",
+                        help="start with the frame profiler overlay on (F3 toggles it)")
+    parser.add_argument("--trace", metavar="PATH", default=None,
+                        help="profile and write a Chrome trace-event JSON file on exit")
+    parser.add_argument("--cprofile", metavar="PATH", default=None,
+                        help="run the game under cProfile and write the stats to PATH")
+    parser.add_argument("--no-journal", action="store_true",
+                        help="do not save the game for resuming after a crash")
+    args = parser.parse_args()
+
+    if not 1 <= args.players <= MAX_PLAYERS:
+        parser.error(f"--players must be between 1 and {MAX_PLAYERS}")
+    if args.connect and args.players != NUM_PLAYERS:
+        parser.error("--players is for local games; server rooms seat 4")
+    if args.connect and args.choose_dice:
+        parser.error("--choose-dice is for local games; server rooms roll one die")
+    if args.bots == "all" or args.autoplay:
+        bots = range(args.players)
+    else:
+        try:
+            bots = [int(seat) - 1 for seat in args.bots.split(",") if seat]
+        except ValueError:
+            parser.error(f"--bots expects seat numbers like 2,3,4, got {args.bots!r}")
+    if args.speed <= 0:
+        parser.error("--speed must be positive")
+
+    try:
+        layout = load_board(args.board) if args.board else CLASSIC
+        rules = parse_rules(args.rules)
+    except (BoardError, RuleError) as e:
+        parser.error(str(e))
+
+    server = None
+    if args.connect:
+        host, _, port = args.connect.rpartition(":")
+        server = (host or "127.0.0.1", int(port), args.room)
+
+    game = Game(server=server, layout=layout, rules=rules, bots=bots, bot_delay_ms=1000 / args.speed,
+                profile=args.profile, trace_path=args.trace,
+                journal_path=None if args.no_journal or args.autoplay else JOURNAL_PATH, num_players=args.players,
+                choose_dice=args.choose_dice)
+    if args.autoplay:
+        start = time.perf_counter()
+        turns = game.autoplay(args.autoplay, args.frame_skip)
+        elapsed = time.perf_counter() - start
+        print(f"{args.autoplay} games, {turns} turns in {elapsed * 1000:.1f} ms "
+              f"({elapsed * 1000 / args.autoplay:.2f} ms per game)")
+        for line in game.stats.summary():
+            print(line)
+        pygame.quit()
+    elif args.cprofile:
+        run_with_cprofile(game.run, args.cprofile)
+    else:
+        game.run()
\ No newline at end of file
@@ -0,0 +1,162 @@
+# File: markov.py
+# Exact analysis of a single player's game as an absorbing Markov chain.
+# States 0..final tile are board positions (0 = not on the board yet, final tile = finished).
+# One step of the chain is one turn of the player. With extra turns on a 6 a turn
+# can be several rolls, so the per-roll chain over (sixes this turn, position)
+# is collapsed into a per-turn matrix first; both come from the rule variant's
+# MoveTable (core/variants.py), so every variant is analysed by the same code.
+from functools import lru_cache
+
+import numpy as np
+
+from core import CLASSIC, STANDARD, move_table
+
+
+def roll_transitions(moves):
+    """
+    Yields (streak, positions, roll probability, landings, targets, next streaks) for
+    every streak value and roll, with positions = every tile below the final one.
+    """
+    final_tile = moves.final_tile
+    positions = np.arange(final_tile)
+    landing = np.frombuffer(moves.landing, dtype=np.intc)
+    targets = np.frombuffer(moves.targets, dtype=np.intc)
+    for streak in range(moves.streak_states):
+        for roll in range(1, 7):
+            rolled = streak * 6 + roll - 1
+            index = (moves.blocked[rolled] * moves.tiles + positions) * 6 + roll - 1
+            yield streak, positions, 1 / 6, landing[index], targets[index], moves.streak[rolled]
+
+
+def turn_transition(moves):
+    """
+    Returns an array of shape (streak states, final tile, final tile + 1):
+    [s, p, q] is the chance that a turn begun on tile p, s sixes into the turn,
+    ends with the player on tile q (q = final tile: finished during the turn).
+    Row block s = 0 is an ordinary turn.
+    """
+    final_tile = moves.final_tile
+    states = moves.streak_states
+    # Rolls that keep the turn going (continue) and rolls that end it (end)
+    end = np.zeros((states * final_tile, final_tile + 1))
+    cont = np.zeros((states * final_tile, states * final_tile))
+    for streak, positions, chance, landed, _, next_streak in roll_transitions(moves):
+        rows = streak * final_tile + positions
+        goes_on = (next_streak > 0) & (landed < final_tile)
+        np.add.at(end, (rows[~goes_on], landed[~goes_on]), chance)
+        np.add.at(cont, (rows[goes_on], next_streak * final_tile + landed[goes_on]), chance)
+    if states > 1:
+        # Sum over every number of extra rolls: (I - C)^-1 E
+        end = np.linalg.solve(np.eye(states * final_tile) - cont, end)
+    return end.reshape(states, final_tile, final_tile + 1)
+
+
+class MarkovSolution:
+    """Exact results for one board and rule set. Use solve() to get a cached instance."""
+
+    def __init__(self, layout, rules=STANDARD):
+        self.layout = layout
+        self.rules = rules
+        self.final_tile = layout.final_tile
+        self.moves = move_table(layout, rules)
+
+        # Per-turn chain from every (streak, tile); streak 0 is the start of a turn
+        self.turns_from_streak = turn_transition(self.moves)
+
+        # transient block Q (states 0..final tile - 1) and the one-step chance of finishing
+        self.transition = self._build_transition()
+        self.q = self.transition[:self.final_tile, :self.final_tile]
+        self.finish = self.transition[:self.final_tile, self.final_tile]
+
+        # Expected number of turns to finish from every starting tile
+        identity = np.eye(self.final_tile)
+        self.expected_turns_from = np.linalg.solve(identity - self.q, np.ones(self.final_tile))
+        self.expected_turns = float(self.expected_turns_from[0])
+
+        self.hit_probabilities = self._hit_probabilities()
+        self._distribution = np.zeros(0)
+        self._state = None
+        self._finish_table = None
+
+    def _build_transition(self):
+        """Builds the (final tile + 1) square per-turn matrix from the compiled move table."""
+        final_tile = self.final_tile
+        matrix = np.zeros((final_tile + 1, final_tile + 1))
+        matrix[:final_tile] = self.turns_from_streak[0]
+        # The final tile is absorbing
+        matrix[final_tile, final_tile] = 1.0
+        return matrix
+
+    def _hit_probabilities(self):
+        """
+        Chance that a player lands on each snake head or ladder foot at least once.
+        Landing on the tile is made absorbing and the absorption chance is solved for,
+        on the per-roll chain over (sixes this turn, tile).
+        """
+        final_tile = self.final_tile
+        size = self.moves.streak_states * final_tile
+        identity = np.eye(size)
+        result = {}
+        for tile in list(self.layout.snakes) + list(self.layout.ladders):
+            q = np.zeros((size, size))
+            lands_on_tile = np.zeros(size)
+            for streak, positions, chance, landed, targets, next_streak in roll_transitions(self.moves):
+                rows = streak * final_tile + positions
+                hit = targets == tile
+                np.add.at(lands_on_tile, rows[hit], chance)
+                moving = ~hit & (landed < final_tile)
+                np.add.at(q, (rows[moving], next_streak * final_tile + landed[moving]), chance)
+            result[tile] = float(np.linalg.solve(identity - q, lands_on_tile)[0])
+        return result
+
+    def turn_distribution(self, horizon):
+        """
+        Returns an array p where p[k] is the chance of finishing on exactly turn k
+        (k = 0..horizon). Longer horizons continue from where the last call stopped.
+        """
+        done = len(self._distribution) - 1
+        if done < horizon:
+            if done < 0:
+                self._state = np.zeros(self.final_tile)
+                self._state[0] = 1.0
+                self._distribution = np.zeros(1)
+                done = 0
+            extra = np.zeros(horizon - done)
+            for i in range(len(extra)):
+                extra[i] = self._state @ self.finish
+                self._state = self._state @ self.q
+            self._distribution = np.concatenate([self._distribution, extra])
+        return self._distribution[:horizon + 1]
+
+
+    def finish_table(self, tolerance=1e-12, max_horizon=5000):
+        """
+        Returns (finish, survival) arrays of shape (final tile, horizon + 1) for every start tile.
+        finish[s, k] is the chance of finishing on exactly turn k from tile s and
+        survival[s, k] the chance of still being on the board after k turns.
+        The horizon grows until the leftover probability drops below tolerance.
+        """
+        if self._finish_table is None:
+            state = np.eye(self.final_tile)
+            columns = [np.zeros(self.final_tile)]
+            while len(columns) <= max_horizon:
+                columns.append(state @ self.finish)
+                state = state @ self.q
+                if state.sum(axis=1).max() < tolerance:
+                    break
+            finish = np.stack(columns, axis=1)
+            survival = 1.0 - np.cumsum(finish, axis=1)
+            self._finish_table = (finish, np.clip(survival, 0.0, 1.0))
+        return self._finish_table
+
+
+@lru_cache(maxsize=32)
+def _solve_cached(layout, rules):
+    return MarkovSolution(layout, rules)
+
+
+def solve(layout=CLASSIC, rules=STANDARD):
+    """Returns the MarkovSolution for a board and rule set, computing it only once per pair."""
+    # BoardLayout hashes on its size, snakes and ladders and RuleSet on its flags,
+    # so equal configurations share a solution
+    return _solve_cached(layout, rules)
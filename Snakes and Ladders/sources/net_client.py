@@ -0,0 +1,57 @@
+# File: net_client.py
+# Connects the pygame window to a room on server.py.
+import json
+import socket
+import threading
+
+import pygame
+
+
+# Posted for every line the server sends; event.message holds the decoded JSON
+NETWORK_EVENT = pygame.USEREVENT + 1
+
+
+class RoomClient:
+    """
+    Sends the player's actions to the server. A background thread reads the
+    server's broadcasts and posts them as NETWORK_EVENTs, which also wakes the
+    main loop while it sleeps in pygame.event.wait.
+    """
+
+    def __init__(self, host, port, room):
+        self.sock = socket.create_connection((host, port))
+        self.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self.lines = self.sock.makefile("rb")
+        self.room = room
+        self._send({"op": "join", "room": room})
+
+        self.thread = threading.Thread(target=self._read_loop, daemon=True)
+        self.thread.start()
+
+    def _send(self, message):
+        self.sock.sendall((json.dumps(message) + "\n").encode())
+
+    def roll(self):
+        self._send({"op": "roll"})
+
+    def reset(self):
+        self._send({"op": "reset"})
+
+    def close(self):
+        try:
+            self._send({"op": "leave"})
+        except OSError:
+            pass
+        self.sock.close()
+
+    def _read_loop(self):
+        try:
+            for line in self.lines:
+                try:
+                    message = json.loads(line)
+                except ValueError:
+                    continue
+                pygame.event.post(pygame.event.Event(NETWORK_EVENT, message=message))
+        except OSError:
+            pass
+        pygame.event.post(pygame.event.Event(NETWORK_EVENT, message={"event": "closed"}))
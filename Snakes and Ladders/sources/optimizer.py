@@ -0,0 +1,202 @@
+# File: optimizer.py
+# Searches snake and ladder layouts for a target game length with simulated annealing.
+# Every candidate is scored exactly: the single-player chain of markov.py gives the
+# chance of still being on the board after k turns (under any rule variant), and because players never block
+# each other the game (which ends with the first finisher) lasts more than k rounds
+# with chance survival(k) ** players. Independent annealing chains run on every core
+# and the best layouts are written as board files that main.py --board can load.
+#
+#   python optimizer.py --mean 25 --std 12 --players 4 --iterations 5000 --out ../boards
+import argparse
+import math
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+
+from core import CLASSIC, STANDARD, BoardLayout, BoardError, MoveTable, RuleError, load_board, parse_rules, save_board
+from markov import turn_transition
+
+
+class LengthStats:
+    """Game length in rounds (turns of each player) for a board and player count."""
+
+    def __init__(self, mean, std):
+        self.mean = mean
+        self.std = std
+
+    def __repr__(self):
+        return f"LengthStats(mean={self.mean:.3f}, std={self.std:.3f})"
+
+
+def survival_curve(layout, rules=STANDARD, tolerance=1e-9, max_turns=5000):
+    """
+    Returns survival[k], the chance a lone player is still on the board after k turns.
+    Returns None when some start can never finish (the curve does not reach tolerance).
+    """
+    final_tile = layout.final_tile
+    # Candidates are scored once each, so the table is built here instead of cached
+    q = turn_transition(MoveTable(layout, rules))[0, :, :final_tile]
+
+    state = np.zeros(final_tile)
+    state[0] = 1.0
+    survival = [1.0]
+    while survival[-1] > tolerance:
+        if len(survival) > max_turns:
+            return None
+        state = state @ q
+        survival.append(state.sum())
+    return np.array(survival)
+
+
+def length_stats(layout, num_players=4, rules=STANDARD):
+    """Exact mean and standard deviation of the number of rounds, or None for a trap board."""
+    survival = survival_curve(layout, rules)
+    if survival is None:
+        return None
+    # P(rounds > k) = survival(k) ** players; both sums run over k = 0, 1, 2, ...
+    tail = survival ** num_players
+    mean = tail.sum()
+    second = ((2 * np.arange(len(tail)) + 1) * tail).sum()
+    return LengthStats(float(mean), float(math.sqrt(max(second - mean * mean, 0.0))))
+
+
+def score(stats, target_mean, target_std=None):
+    """Squared relative error to the targets; lower is better."""
+    if stats is None:
+        return math.inf
+    error = ((stats.mean - target_mean) / target_mean) ** 2
+    if target_std:
+        error += ((stats.std - target_std) / target_std) ** 2
+    return error
+
+
+def mutate(layout, rng, attempts=50):
+    """Returns a valid neighbour: one snake or ladder end nudged, or one redrawn entirely."""
+    final_tile = layout.final_tile
+    for _ in range(attempts):
+        snakes = dict(layout.snakes)
+        ladders = dict(layout.ladders)
+        kind = snakes if (rng.random() < 0.5 and snakes) or not ladders else ladders
+        if not kind:
+            return layout
+        start = list(kind)[rng.integers(len(kind))]
+        end = kind.pop(start)
+
+        move = rng.integers(3)
+        if move == 0:
+            start += int(rng.integers(-6, 7))
+        elif move == 1:
+            end += int(rng.integers(-6, 7))
+        elif kind is snakes:
+            start = int(rng.integers(2, final_tile))
+            end = int(rng.integers(1, start))
+        else:
+            start = int(rng.integers(1, final_tile - 1))
+            end = int(rng.integers(start + 1, final_tile + 1))
+
+        if start in snakes or start in ladders:
+            continue
+        kind[start] = end
+        try:
+            return BoardLayout(snakes, ladders, final_tile, layout.name)
+        except BoardError:
+            continue
+    return layout
+
+
+def _anneal(job):
+    """One annealing chain; returns (candidates scored, [(score, layout, stats), ...] best first)."""
+    start, target_mean, target_std, num_players, iterations, keep, seed, rules = job
+    rng = np.random.default_rng(seed)
+
+    current = start
+    current_score = score(length_stats(current, num_players, rules), target_mean, target_std)
+    best = {}
+    # Geometric cooling from a temperature that accepts most early moves
+    t_start, t_end = 0.05, 1e-5
+    for i in range(iterations):
+        temperature = t_start * (t_end / t_start) ** (i / max(iterations - 1, 1))
+        candidate = mutate(current, rng)
+        stats = length_stats(candidate, num_players, rules)
+        candidate_score = score(stats, target_mean, target_std)
+        if candidate_score < current_score or \
+                rng.random() < math.exp(-(candidate_score - current_score) / temperature):
+            current, current_score = candidate, candidate_score
+            if math.isfinite(current_score):
+                best[current] = (current_score, current, stats)
+                if len(best) > keep * 4:
+                    best = dict(sorted(best.items(), key=lambda item: item[1][0])[:keep])
+
+    ranked = sorted(best.values(), key=lambda entry: entry[0])[:keep]
+    return iterations, ranked
+
+
+def optimize(target_mean, target_std=None, num_players=4, start=CLASSIC, iterations=2000,
+             chains=None, keep=3, seed=0, workers=None, rules=STANDARD):
+    """
+    Runs chains independent annealing chains of iterations candidates each and
+    returns (candidates scored, [(score, layout, stats), ...]) with the keep best layouts.
+    Each chain seeds from the master seed, so the result is the same for any workers.
+    workers=None uses every core; workers=1 runs in this process.
+    """
+    chains = chains or os.cpu_count() or 1
+    seeds = np.random.SeedSequence(seed).spawn(chains)
+    jobs = [(start, target_mean, target_std, num_players, iterations, keep, seeds[i], rules)
+            for i in range(chains)]
+
+    if workers == 1:
+        results = [_anneal(job) for job in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(_anneal, jobs))
+
+    scored = sum(count for count, _ in results)
+    best = {}
+    for _, ranked in results:
+        for entry in ranked:
+            best.setdefault(entry[1], entry)
+    return scored, sorted(best.values(), key=lambda entry: entry[0])[:keep]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Search board layouts for a target game length.")
+    parser.add_argument("--mean", type=float, required=True, help="target mean game length in rounds")
+    parser.add_argument("--std", type=float, default=None, help="target standard deviation in rounds")
+    parser.add_argument("--players", type=int, default=4)
+    parser.add_argument("--board", default=None, help="starting board file, classic board if omitted")
+    parser.add_argument("--rules", default="", help="rule variants, e.g. bounce,extra-six (see core/variants.py)")
+    parser.add_argument("--iterations", type=int, default=2000, help="candidates per chain")
+    parser.add_argument("--chains", type=int, default=None, help="annealing chains (default: one per core)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--keep", type=int, default=3, help="number of board files to write")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", default=".", help="directory for the board files")
+    args = parser.parse_args()
+
+    try:
+        start = load_board(args.board) if args.board else CLASSIC
+        rules = parse_rules(args.rules)
+    except (BoardError, RuleError) as e:
+        parser.error(str(e))
+
+    print(f"start: {start.name}, {rules}, {length_stats(start, args.players, rules)}")
+    began = time.perf_counter()
+    scored, best = optimize(args.mean, args.std, args.players, start, args.iterations,
+                            args.chains, args.keep, args.seed, args.workers, rules)
+    elapsed = time.perf_counter() - began
+    print(f"{scored} candidates in {elapsed:.1f}s ({scored / elapsed * 60:,.0f} per minute)")
+
+    out = Path(args.out)
+    out.mkdir(parents=True, exist_ok=True)
+    for rank, (error, layout, stats) in enumerate(best, 1):
+        layout.name = f"Optimized {rank} (mean {stats.mean:.1f}, std {stats.std:.1f})"
+        path = out / f"optimized-{rank}.json"
+        save_board(layout, path)
+        print(f"  {path}: {stats}, error {error:.2e}")
+
+
+if __name__ == "__main__":
+    main()
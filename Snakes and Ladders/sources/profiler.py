@@ -0,0 +1,171 @@
+# File: profiler.py
+# Opt-in frame profiler. Nothing in the game calls into this module while it is
+# off: install() replaces the timed methods with wrappers (instance attributes
+# on the game objects, plus pygame.display.flip/update) and uninstall() removes
+# them again, so the game runs its untouched methods when profiling is off.
+#
+# Per frame, every phase's time is summed; the overlay shows rolling p50 / p95 /
+# max of those sums. Every call is also kept as a Chrome trace event, which
+# chrome://tracing or https://ui.perfetto.dev can open after export_trace().
+import cProfile
+import json
+import time
+from collections import deque
+
+import pygame
+
+
+class FrameProfiler:
+    """Times named phases of each frame while installed; see Game.toggle_profiler."""
+
+    def __init__(self, history=240, max_trace_events=200_000):
+        self.history = history
+        self.samples = {}                  # phase -> deque of per-frame ms
+        self._frame = {}                   # phase -> seconds so far this frame
+        self.trace = deque(maxlen=max_trace_events)  # (phase, start, duration) in seconds
+        self.frames = 0
+        self.overlay_lines = []
+        self._origin = time.perf_counter()
+        self._patches = []                 # (owner, attribute, original or None if none was set)
+        self._font = None
+
+    # --- Installing the timers ---
+    def _timed(self, phase, function):
+        frame = self._frame
+        trace = self.trace
+        clock = time.perf_counter
+
+        def timed(*args, **kwargs):
+            start = clock()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                duration = clock() - start
+                frame[phase] = frame.get(phase, 0.0) + duration
+                trace.append((phase, start, duration))
+        return timed
+
+    def wrap(self, owner, attribute, phase):
+        """Times every call of owner.attribute under the given phase name."""
+        original = vars(owner).get(attribute)
+        setattr(owner, attribute, self._timed(phase, getattr(owner, attribute)))
+        self._patches.append((owner, attribute, original))
+
+    def install(self, game):
+        """Wraps the phases of Game.run and Game.draw."""
+        phases = [
+            (game.scheduler, "next_events", "events"),
+            (game, "handle_events", "input"),
+            (game, "handle_move", "handle_move"),
+            (game, "update_animations", "animations"),
+            (game, "update_camera", "camera"),
+            (game, "update_bots", "bots"),
+            (game, "draw", "draw"),
+            (game, "draw_menu", "draw.menu"),
+            (game, "draw_end", "draw.end"),
+            (game, "draw_static_layers", "draw.static"),
+            (game, "draw_dynamic_layers", "draw.dynamic"),
+            (game, "draw_info_panel", "draw.info_panel"),
+            (game, "draw_player_rows", "draw.player_rows"),
+            (game, "draw_pieces", "draw.pieces"),
+            (game, "draw_hint", "draw.hint"),
+            (game, "draw_text", "draw.text"),
+            (game.board, "draw", "draw.board"),
+            (game.dice, "draw", "draw.dice"),
+            (pygame.display, "flip", "display.flip"),
+            (pygame.display, "update", "display.update"),
+        ]
+        for owner, attribute, phase in phases:
+            self.wrap(owner, attribute, phase)
+
+    def uninstall(self):
+        """Puts every wrapped method back; the recorded data is kept."""
+        for owner, attribute, original in reversed(self._patches):
+            if original is None:
+                delattr(owner, attribute)  # The class method shows through again
+            else:
+                setattr(owner, attribute, original)
+        self._patches.clear()
+        self._frame.clear()
+
+    @property
+    def installed(self):
+        return bool(self._patches)
+
+    # --- Per-frame bookkeeping ---
+    def end_frame(self):
+        """Closes the frame: moves this frame's phase totals into the rolling history."""
+        for phase, seconds in self._frame.items():
+            samples = self.samples.get(phase)
+            if samples is None:
+                samples = self.samples[phase] = deque(maxlen=self.history)
+            samples.append(seconds * 1000)
+        self._frame.clear()
+        self.frames += 1
+        # Refreshing the text a few times a second keeps it readable and cheap
+        if self.frames % 15 == 1:
+            self.overlay_lines = self.format_stats()
+
+    def stats(self):
+        """Returns {phase: (p50, p95, max)} in ms over the recent frames."""
+        result = {}
+        for phase, samples in self.samples.items():
+            times = sorted(samples)
+            result[phase] = (times[len(times) // 2],
+                             times[min(len(times) - 1, int(len(times) * 0.95))],
+                             times[-1])
+        return result
+
+    def format_stats(self):
+        """Overlay rows (phase, p50, p95, max), slowest p95 first."""
+        rows = sorted(self.stats().items(), key=lambda item: -item[1][1])
+        return [("phase (ms)", "p50", "p95", "max")] + \
+               [(phase, f"{p50:.2f}", f"{p95:.2f}", f"{worst:.2f}") for phase, (p50, p95, worst) in rows]
+
+    # --- Overlay ---
+    # Right edges of the three number columns
+    COLUMNS = (200, 260, 320)
+
+    def overlay_rect(self):
+        line_height = 16
+        return pygame.Rect(0, 0, 330, line_height * max(len(self.overlay_lines), 1) + 8)
+
+    def draw_overlay(self, screen):
+        """Draws the stats box in the bottom-right corner and pushes just that region."""
+        if self._font is None:
+            self._font = pygame.font.Font(None, 18)
+        rect = self.overlay_rect()
+        rect.bottomright = screen.get_rect().bottomright
+        # Opaque, so redrawing it every frame over the last one leaves no trails
+        box = pygame.Surface(rect.size)
+        box.fill((20, 20, 20))
+        for i, (phase, *numbers) in enumerate(self.overlay_lines):
+            y = 4 + i * 16
+            box.blit(self._font.render(phase, True, (0, 255, 0)), (6, y))
+            for right, number in zip(self.COLUMNS, numbers):
+                text = self._font.render(number, True, (0, 255, 0))
+                box.blit(text, text.get_rect(topright=(right, y)))
+        screen.blit(box, rect)
+        pygame.display.update(rect)
+
+    # --- Export ---
+    def export_trace(self, path):
+        """Writes the recorded calls as Chrome trace-event JSON (complete 'X' events)."""
+        events = [{"name": phase, "cat": phase.split(".")[0], "ph": "X", "pid": 1, "tid": 1,
+                   "ts": (start - self._origin) * 1e6, "dur": duration * 1e6}
+                  for phase, start, duration in self.trace]
+        with open(path, "w") as f:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
+        return len(events)
+
+
+def run_with_cprofile(function, path):
+    """Runs function() under cProfile and writes the stats to path (open with pstats or snakeviz)."""
+    profile = cProfile.Profile()
+    profile.enable()
+    try:
+        return function()
+    finally:
+        profile.disable()
+        profile.dump_stats(path)
+        print(f"cProfile stats written to {path}")
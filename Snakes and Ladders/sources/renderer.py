@@ -0,0 +1,76 @@
+# File: renderer.py
+import pygame
+
+
+class DirtyRectRenderer:
+    """
+    Keeps the static layers (background, panel, board image) on one pre-composited
+    surface and only repaints the screen regions whose content changed.
+    """
+
+    def __init__(self, screen):
+        self.screen = screen
+        self.background = pygame.Surface(screen.get_size()).convert()
+        self.scene = None          # which static layer is currently composited
+        self.items = {}            # key -> (rect, signature) from the last frame
+        self.full_redraw = True
+
+    def set_scene(self, scene, draw_static):
+        """Re-composites the static layers, but only when the scene changes."""
+        if scene != self.scene:
+            draw_static(self.background)
+            self.scene = scene
+            self.invalidate()
+
+    def invalidate(self):
+        """Forces the next render to repaint and flip the whole screen."""
+        self.full_redraw = True
+
+    def render(self, items, draw_dynamic):
+        """
+        items maps a key to (rect, signature). A region is repainted when its rect
+        or signature differs from the last frame; draw_dynamic paints every dynamic
+        layer and is clipped to each dirty region in turn.
+        """
+        if self.full_redraw:
+            self.screen.blit(self.background, (0, 0))
+            draw_dynamic(self.screen)
+            pygame.display.flip()
+            self.items = dict(items)
+            self.full_redraw = False
+            return
+
+        dirty = []
+        for key, (rect, signature) in items.items():
+            previous = self.items.get(key)
+            if previous is None:
+                dirty.append(pygame.Rect(rect))
+            elif previous != (rect, signature):
+                # Clear where the item was and paint where it is now
+                dirty.append(pygame.Rect(previous[0]))
+                dirty.append(pygame.Rect(rect))
+        for key in self.items.keys() - items.keys():
+            dirty.append(pygame.Rect(self.items[key][0]))
+        self.items = dict(items)
+
+        if not dirty:
+            return
+
+        dirty = self._merge(dirty)
+        for rect in dirty:
+            self.screen.set_clip(rect)
+            self.screen.blit(self.background, rect, rect)
+            draw_dynamic(self.screen)
+        self.screen.set_clip(None)
+        pygame.display.update(dirty)
+
+    def _merge(self, rects):
+        """Joins overlapping rects so no region is repainted twice."""
+        merged = []
+        for rect in rects:
+            index = rect.collidelist(merged)
+            while index != -1:
+                rect = rect.union(merged.pop(index))
+                index = rect.collidelist(merged)
+            merged.append(rect)
+        return merged
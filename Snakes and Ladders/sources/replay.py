@@ -0,0 +1,213 @@
+# File: replay.py
+# Compact binary game records.
+#
+# Layout (little endian):
+#   header   magic "SLRP", version, player count, final tile, checkpoint interval K,
+#            turn count, snake and ladder counts, rule flags (version 2, RuleSet.flags),
+#            then the snakes and ladders as (start, end) pairs
+#   blocks   one per K turns, all the same size:
+#              checkpoint: every position (u16) + current player (u8) + six streak (u8),
+#                          i.e. the state *before* the block's first turn
+#              rolls:      K rolls packed two per byte (4 bits each, 0 = unused)
+#
+# Because every block has the same size, turn t is found with plain arithmetic:
+# block t // K, then at most K - 1 rolls are replayed from its checkpoint.
+# A record is a whole session: after a win every player goes back to the start.
+#
+#   python replay.py session.slr --turn 123456
+import argparse
+import mmap
+import struct
+
+from core import CLASSIC, STANDARD, BoardLayout, BoardError, RuleSet, RuleError, move_table
+
+
+MAGIC = b"SLRP"
+VERSION = 2
+HEADER = struct.Struct("<4sHBHIQHHB")
+# Version 1 had no rule flags (standard rules) and a zero pad byte where the streak is now
+HEADER_V1 = struct.Struct("<4sHBHIQHH")
+PAIR = struct.Struct("<HH")
+TURN_COUNT_OFFSET = 4 + 2 + 1 + 2 + 4
+
+DEFAULT_CHECKPOINT_INTERVAL = 256
+
+
+class ReplayError(ValueError):
+    """Raised when a file is not a replay this version can read."""
+
+
+def _play(moves, positions, current, streak, roll):
+    """Plays one recorded roll from the move tables; a win starts the next game of the session."""
+    landing, _, _, streak = moves.move(positions[current], roll, streak)
+    positions[current] = landing
+    if landing == moves.final_tile:
+        return [0] * len(positions), 0, 0
+    if not streak:
+        current = (current + 1) % len(positions)
+    return positions, current, streak
+
+
+class ReplayWriter:
+    """Appends one roll per turn and writes a checkpoint every checkpoint_interval turns."""
+
+    def __init__(self, path, num_players=4, layout=CLASSIC,
+                 checkpoint_interval=DEFAULT_CHECKPOINT_INTERVAL, rules=STANDARD):
+        if checkpoint_interval <= 0 or checkpoint_interval % 2:
+            raise ValueError("checkpoint_interval must be a positive even number")
+        self.num_players = num_players
+        self.interval = checkpoint_interval
+        self.final_tile = layout.final_tile
+        self.moves = move_table(layout, rules)
+        self.checkpoint = struct.Struct(f"<{num_players}HBB")
+
+        self.positions = [0] * num_players
+        self.current_player = 0
+        self.streak = 0
+        self.turn_count = 0
+        self._block = bytearray()
+
+        self.file = open(path, "wb")
+        self.file.write(HEADER.pack(MAGIC, VERSION, num_players, self.final_tile, checkpoint_interval,
+                                    0, len(layout.snakes), len(layout.ladders), rules.flags()))
+        for start, end in list(layout.snakes.items()) + list(layout.ladders.items()):
+            self.file.write(PAIR.pack(start, end))
+
+    def start_from(self, state):
+        """
+        Continues the record from a restored GameState (a game resumed from the journal).
+        The state is written as the checkpoint of the next block, so this has to come
+        before the first roll of the record or on a block boundary.
+        """
+        if self.turn_count % self.interval:
+            raise ValueError("a replay can only take a new state at the start of a block")
+        self.positions = list(state.positions)
+        self.current_player = state.current_player
+        self.streak = state.streak
+
+    def record(self, roll):
+        """Stores one dice roll (1 to 6) and advances the recorded game state."""
+        offset = self.turn_count % self.interval
+        if offset == 0:
+            self._block = bytearray(self.checkpoint.pack(*self.positions, self.current_player, self.streak))
+            self._block.extend(bytes(self.interval // 2))
+        index = self.checkpoint.size + offset // 2
+        self._block[index] |= roll << (4 * (offset % 2))
+        self.turn_count += 1
+
+        # Same tables as Game.handle_move; a win starts the next game of the session
+        self.positions, self.current_player, self.streak = _play(
+            self.moves, self.positions, self.current_player, self.streak, roll)
+
+        if offset == self.interval - 1:
+            self.file.write(self._block)
+            self._block = bytearray()
+
+    def close(self):
+        """Writes the unfinished block and the final turn count."""
+        if self.file.closed:
+            return
+        if self._block:
+            self.file.write(self._block)
+        self.file.seek(TURN_COUNT_OFFSET)
+        self.file.write(struct.pack("<Q", self.turn_count))
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class ReplayReader:
+    """Memory-maps a replay, so any turn is reached in constant time without loading the file."""
+
+    def __init__(self, path):
+        self.file = open(path, "rb")
+        self.data = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(self.data) < HEADER.size:
+            raise ReplayError(f"{path} is too short to be a replay")
+        magic, version = struct.unpack_from("<4sH", self.data, 0)
+        if magic != MAGIC or version not in (1, VERSION):
+            raise ReplayError(f"{path} is not a version 1 or {VERSION} replay")
+        header = HEADER if version == VERSION else HEADER_V1
+        (_, _, self.num_players, self.final_tile, self.interval,
+         self.turn_count, snake_count, ladder_count, *flags) = header.unpack_from(self.data, 0)
+
+        pairs = [PAIR.unpack_from(self.data, header.size + i * PAIR.size)
+                 for i in range(snake_count + ladder_count)]
+        try:
+            self.layout = BoardLayout(pairs[:snake_count], pairs[snake_count:], self.final_tile)
+            self.rules = RuleSet.from_flags(flags[0]) if flags else STANDARD
+        except (BoardError, RuleError) as e:
+            raise ReplayError(f"{path} holds an invalid board or rules: {e}") from None
+        self.moves = move_table(self.layout, self.rules)
+
+        self.checkpoint = struct.Struct(f"<{self.num_players}HBB")
+        self.blocks_start = header.size + len(pairs) * PAIR.size
+        self.block_size = self.checkpoint.size + self.interval // 2
+
+    def __len__(self):
+        return self.turn_count
+
+    def roll(self, turn):
+        """Returns the dice roll of the given turn (from 0)."""
+        if not 0 <= turn < self.turn_count:
+            raise IndexError(turn)
+        block, offset = divmod(turn, self.interval)
+        byte = self.data[self.blocks_start + block * self.block_size
+                         + self.checkpoint.size + offset // 2]
+        return (byte >> (4 * (offset % 2))) & 0x0F
+
+    def state_at(self, turn):
+        """Returns (positions, current_player) before the given turn is played."""
+        if not 0 <= turn <= self.turn_count:
+            raise IndexError(turn)
+        if self.turn_count == 0:
+            return (0,) * self.num_players, 0
+        block, offset = divmod(turn, self.interval)
+        if offset == 0 and turn == self.turn_count:
+            # Just past the last full block: start from the one before it
+            block, offset = block - 1, self.interval
+        start = self.blocks_start + block * self.block_size
+        *positions, current, streak = self.checkpoint.unpack_from(self.data, start)
+
+        for i in range(offset):
+            byte = self.data[start + self.checkpoint.size + i // 2]
+            roll = (byte >> (4 * (i % 2))) & 0x0F
+            positions, current, streak = _play(self.moves, positions, current, streak, roll)
+        return tuple(positions), current
+
+    def iter_rolls(self, start=0):
+        """Streams the rolls from turn start onward, straight from the mapped file."""
+        for turn in range(start, self.turn_count):
+            yield self.roll(turn)
+
+    def close(self):
+        self.data.close()
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Inspect a Snakes and Ladders replay.")
+    parser.add_argument("path")
+    parser.add_argument("--turn", type=int, default=None, help="show the state before this turn")
+    args = parser.parse_args()
+
+    with ReplayReader(args.path) as replay:
+        print(f"{replay.num_players} players, {replay.turn_count} turns, "
+              f"checkpoint every {replay.interval} turns, {replay.rules}")
+        if args.turn is not None:
+            positions, current = replay.state_at(args.turn)
+            print(f"before turn {args.turn}: positions {positions}, Player {current + 1} to roll")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+# File: scheduler.py
+import time
+from collections import deque
+
+import pygame
+from constants import FPS, IDLE_TIMEOUT_MS
+
+
+class FrameScheduler:
+    """
+    Owns the single frame clock of the main loop.
+    While nothing on screen is changing the loop sleeps in pygame.event.wait,
+    and it only ticks at a fixed FPS while something is animating.
+    """
+
+    def __init__(self, fps=FPS, idle_timeout_ms=IDLE_TIMEOUT_MS, history=240):
+        self.clock = pygame.time.Clock()
+        self.fps = fps
+        self.idle_timeout_ms = idle_timeout_ms
+
+        # Time spent handling input and drawing for each recent frame (ms)
+        self.frame_times = deque(maxlen=history)
+        self._frame_start = None
+
+    def next_events(self, animating):
+        """Waits until the next frame is due and returns the events that arrived."""
+        if self._frame_start is not None:
+            self.frame_times.append((time.perf_counter() - self._frame_start) * 1000)
+
+        if animating:
+            self.clock.tick(self.fps)
+            events = pygame.event.get()
+        else:
+            # Block until input arrives (or the timeout passes) instead of spinning
+            event = pygame.event.wait(self.idle_timeout_ms)
+            events = [] if event.type == pygame.NOEVENT else [event]
+            events.extend(pygame.event.get())
+            # Restart the clock so the idle time is not counted as a slow frame
+            self.clock.tick()
+
+        self._frame_start = time.perf_counter()
+        return events
+
+    def frame_stats(self):
+        """Returns (average, 95th percentile, worst) frame time in ms, or None if empty."""
+        if not self.frame_times:
+            return None
+        times = sorted(self.frame_times)
+        p95 = times[min(len(times) - 1, int(len(times) * 0.95))]
+        return sum(times) / len(times), p95, times[-1]
@@ -0,0 +1,226 @@
+# File: server.py
+# Asyncio server hosting many remote 4-player games (rooms) from one process.
+# It runs the same rules as the pygame window (core.take_turn) and never imports pygame.
+#
+# Protocol: one JSON object per line.
+#   client -> server   {"op": "join", "room": "name"}   join (or create) a room
+#                      {"op": "roll", "id": 7}          roll for the player whose turn it is
+#                                                       (a seat held by another member is refused)
+#                      {"op": "reset"}                  start the room's next game
+#                      {"op": "leave"}
+#   server -> client   {"event": "state", ...}          sent to every member after each change
+#                      {"event": "error", "message": "..."}
+# The optional "id" of a roll is echoed in the state it produced, so clients can
+# match a roll to its broadcast and measure the latency.
+# Every member takes the first free seat when it joins ("seat" in its first state,
+# None when the room is full). Only that member may roll for the seat; seats nobody
+# holds can be rolled by any member, so one client can still play a whole room.
+#
+#   python server.py --port 8765 --board ../boards/classic.json --rules extra-six
+import argparse
+import asyncio
+import json
+
+from core import GameState, take_turn, CLASSIC, STANDARD, BoardError, RuleError, load_board, move_table, parse_rules
+from dice_rng import CounterDice
+
+
+DEFAULT_PORT = 8765
+PLAYERS_PER_ROOM = 4
+
+# A member whose socket buffer grows past this is not reading; drop it
+MAX_WRITE_BUFFER = 256 * 1024
+
+
+class Room:
+    """One game: its state, the seat names, and the connections watching it."""
+
+    def __init__(self, name, game_id, dice, layout=CLASSIC, rules=STANDARD):
+        self.name = name
+        self.game_id = game_id
+        self.dice = dice
+        self.layout = layout
+        self.moves = move_table(layout, rules)
+        self.members = set()
+        self.seats = [None] * PLAYERS_PER_ROOM  # The member holding each seat, None if free
+        self.names = [f"Player {i+1}" for i in range(PLAYERS_PER_ROOM)]
+        self.state = GameState(PLAYERS_PER_ROOM)
+        self.reset()
+
+    def reset(self):
+        self.state.reset()
+        self.message = "Click the dice to start the round!"
+        self.last_roll = None
+        self.landed = 0
+
+    def take_seat(self, writer):
+        """Gives a new member the first free seat; returns it, or None when every seat is held."""
+        if None not in self.seats:
+            return None
+        seat = self.seats.index(None)
+        self.seats[seat] = writer
+        return seat
+
+    def free_seat(self, writer):
+        if writer in self.seats:
+            self.seats[self.seats.index(writer)] = None
+
+    def may_roll(self, writer):
+        """Whether writer may roll for the current player: it holds the seat, or nobody does."""
+        holder = self.seats[self.state.current_player]
+        return holder is None or holder is writer
+
+    def roll(self):
+        """Plays one turn for the current player; returns False once the game is over."""
+        if self.state.winner is not None:
+            return False
+        self.last_roll = self.dice.roll(self.game_id, self.state.turn_count)
+        result = take_turn(self.state, self.last_roll, self.names, self.moves)
+        self.message = result.message
+        self.landed = result.landed
+        return True
+
+    def snapshot(self, roll_id=None):
+        state = self.state
+        return {
+            "event": "state",
+            "room": self.name,
+            "positions": list(state.positions),
+            "current": state.current_player,
+            "winner": state.winner,
+            "streak": state.streak,
+            "rules": self.moves.rules.flags(),
+            "roll": self.last_roll,
+            "landed": self.landed,
+            "turn": state.turn_count,
+            "message": self.message,
+            "id": roll_id,
+        }
+
+
+class RoomServer:
+    def __init__(self, seed=None, layout=CLASSIC, rules=STANDARD):
+        self.rooms = {}
+        self.dice = CounterDice(seed)
+        self.layout = layout
+        self.rules = rules
+        self._next_game_id = 0
+
+    def join(self, name, writer):
+        room = self.rooms.get(name)
+        if room is None:
+            # Every room (and every game in it) gets its own dice stream
+            room = Room(name, self._next_game_id, self.dice, self.layout, self.rules)
+            self._next_game_id += 1
+            self.rooms[name] = room
+        room.members.add(writer)
+        room.take_seat(writer)
+        return room
+
+    def leave(self, room, writer):
+        room.members.discard(writer)
+        room.free_seat(writer)
+        # broadcast() may already have emptied the room and a later leave removed it,
+        # or a new room may have been opened under the same name: only drop this one
+        if not room.members and self.rooms.get(room.name) is room:
+            self.rooms.pop(room.name, None)
+
+    def broadcast(self, room, message):
+        # Encode once, then queue the same bytes for every member
+        data = (json.dumps(message) + "\n").encode()
+        for writer in list(room.members):
+            if writer.transport.get_write_buffer_size() > MAX_WRITE_BUFFER:
+                writer.close()
+                room.members.discard(writer)
+                room.free_seat(writer)
+            else:
+                writer.write(data)
+
+    def send(self, writer, message):
+        writer.write((json.dumps(message) + "\n").encode())
+
+    async def handle_client(self, reader, writer):
+        room = None
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except ValueError:
+                    # A line past the stream limit (asyncio.LimitOverrunError): drop the client
+                    self.send(writer, {"event": "error", "message": "request too long"})
+                    break
+                if not line:
+                    break
+                try:
+                    request = json.loads(line)
+                    op = request["op"]
+                except (ValueError, KeyError, TypeError):
+                    self.send(writer, {"event": "error", "message": "bad request"})
+                    continue
+
+                if op == "join":
+                    if room is not None:
+                        self.leave(room, writer)
+                    room = self.join(str(request.get("room", "lobby")), writer)
+                    seat = room.seats.index(writer) if writer in room.seats else None
+                    self.send(writer, {**room.snapshot(), "seat": seat})
+                elif room is None:
+                    self.send(writer, {"event": "error", "message": "join a room first"})
+                elif op == "roll":
+                    if not room.may_roll(writer):
+                        self.send(writer, {"event": "error", "message": "another player holds this seat"})
+                    elif room.roll():
+                        self.broadcast(room, room.snapshot(request.get("id")))
+                    else:
+                        self.send(writer, {"event": "error", "message": "game over, reset to play again"})
+                elif op == "reset":
+                    room.game_id = self._next_game_id
+                    self._next_game_id += 1
+                    room.reset()
+                    self.broadcast(room, room.snapshot())
+                elif op == "leave":
+                    self.leave(room, writer)
+                    room = None
+                else:
+                    self.send(writer, {"event": "error", "message": f"unknown op {op!r}"})
+
+                # Only wait for the socket when this client is falling behind
+                if writer.transport.get_write_buffer_size() > MAX_WRITE_BUFFER // 2:
+                    await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            if room is not None:
+                self.leave(room, writer)
+            writer.close()
+
+
+async def serve(host, port, seed=None, layout=CLASSIC, rules=STANDARD):
+    server = RoomServer(seed, layout, rules)
+    listener = await asyncio.start_server(server.handle_client, host, port)
+    print(f"Serving Snakes and Ladders rooms on {host}:{port}")
+    async with listener:
+        await listener.serve_forever()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Snakes and Ladders room server.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--seed", type=int, default=None, help="dice seed (random if omitted)")
+    parser.add_argument("--board", default=None, help="board file (.json or .toml), classic board if omitted")
+    parser.add_argument("--rules", default="", help="house rules for every room, e.g. bounce,extra-six")
+    args = parser.parse_args()
+    try:
+        layout = load_board(args.board) if args.board else CLASSIC
+        rules = parse_rules(args.rules)
+    except (BoardError, RuleError) as e:
+        parser.error(str(e))
+    try:
+        asyncio.run(serve(args.host, args.port, args.seed, layout, rules))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+# File: simulator.py
+# Headless batch simulator: plays many complete games at once with NumPy arrays.
+# It plays from the same compiled move tables as Game.handle_move (core/variants.py),
+# so every rule variant runs through the same array operations, without pygame.
+import numpy as np
+
+from core import CLASSIC, STANDARD, move_table
+
+
+class SimulationResult:
+    """Per-game outcome of a batch run. Games that hit max_turns have winner -1."""
+
+    def __init__(self, turns, winners, num_players, hits=None):
+        self.turns = turns        # dice rolls needed to finish each game (extra rolls included)
+        self.winners = winners    # seat index (0..num_players-1) of each winner
+        self.num_players = num_players
+        self.hits = hits          # landings per tile over all games (count_hits=True only)
+
+    def __len__(self):
+        return len(self.turns)
+
+    def win_rates(self):
+        """Fraction of finished games won by each seat."""
+        finished = self.winners[self.winners >= 0]
+        counts = np.bincount(finished, minlength=self.num_players)
+        return counts / max(len(finished), 1)
+
+
+def simulate_games(num_games, num_players=4, seed=None, layout=CLASSIC,
+                   max_turns=10000, count_hits=False, dice=None, rules=STANDARD):
+    """
+    Plays num_games full games side by side on layout (a core.BoardLayout) with
+    the house rules in rules (a core.RuleSet) and returns a SimulationResult.
+    Every step rolls one die for the current seat of every unfinished game,
+    so the cost per step is a handful of array operations instead of a Python loop.
+    With count_hits the result also counts how often each tile was landed on,
+    which gives the snake and ladder hit counts.
+    If dice (a dice_rng.CounterDice) is given, roll k of game g comes from
+    dice.rolls(g, k), so every game can be reproduced on its own.
+    """
+    rng = np.random.default_rng(seed)
+    final_tile = layout.final_tile
+    # The compiled tables, viewed as arrays (no per-tile copy in Python)
+    moves = move_table(layout, rules)
+    tiles = moves.tiles
+    # Positions and table indexes stay int16 while the largest index, (tiles + final tile) * 6 + 5,
+    # fits; bigger boards use int32 so the index arithmetic cannot wrap
+    index_type = np.int16 if 2 * tiles * 6 <= np.iinfo(np.int16).max else np.int32
+    landing = np.frombuffer(moves.landing, dtype=np.intc).astype(index_type)
+    targets = np.frombuffer(moves.targets, dtype=np.intc).astype(index_type)
+    streak_table = np.frombuffer(moves.streak, dtype=np.uint8).astype(index_type)
+    blocked_table = np.frombuffer(moves.blocked, dtype=np.uint8).astype(index_type)
+    # Without extra turns every game is at the same seat on every step, which
+    # lets a step read one contiguous row of positions
+    lockstep = moves.streak_states == 1
+
+    turns = np.full(num_games, max_turns, dtype=np.int32)
+    # Seats go up to 254 (see MAX_PLAYERS in constants.py), past the int8 range
+    winners = np.full(num_games, -1, dtype=np.int16)
+
+    # Only the unfinished games are kept in these arrays; game_ids maps them back.
+    # Finished games are masked out and the arrays are compacted once half are done.
+    # positions has one row per seat so each step reads a contiguous slice.
+    game_ids = np.arange(num_games)
+    positions = np.zeros((num_players, num_games), dtype=index_type)
+    seats = np.zeros(num_games, dtype=np.int16)
+    streaks = np.zeros(num_games, dtype=index_type)
+    columns = np.arange(num_games)
+    live = np.ones(num_games, dtype=bool)
+    live_count = num_games
+    hits = np.zeros(final_tile + 1, dtype=np.int64) if count_hits else None
+
+    for step in range(max_turns):
+        if live_count == 0:
+            break
+        if dice is None:
+            rolls = rng.integers(1, 7, size=len(game_ids), dtype=np.int16)
+        else:
+            rolls = dice.rolls(game_ids, step)
+
+        if lockstep:
+            seat = step % num_players
+            current = positions[seat]
+            index = current * 6 + rolls - 1
+            moved = landing[index]
+            positions[seat] = moved
+        else:
+            seat = seats
+            current = positions[seats, columns]
+            rolled = streaks * 6 + rolls - 1
+            index = (blocked_table[rolled] * tiles + current) * 6 + rolls - 1
+            moved = landing[index]
+            positions[seats, columns] = moved
+            streaks = streak_table[rolled]
+            # The same seat rolls again while it has a streak of sixes
+            seats = np.where(streaks > 0, seats, (seats + 1) % num_players)
+
+        if count_hits:
+            # targets is 0 where the roll did not land anywhere; tile 0 is not counted
+            hits += np.bincount(targets[index][live], minlength=final_tile + 1)
+
+        won = (moved == final_tile) & live
+        if won.any():
+            turns[game_ids[won]] = step + 1
+            winners[game_ids[won]] = seat if lockstep else seat[won]
+            live &= ~won
+            live_count -= int(np.count_nonzero(won))
+
+            # Drop the finished games so later steps only touch live ones
+            if live_count * 2 < len(game_ids):
+                game_ids = game_ids[live]
+                positions = positions[:, live]
+                seats = seats[live]
+                streaks = streaks[live]
+                live = live[live]
+                columns = np.arange(len(game_ids))
+
+    if count_hits:
+        hits[0] = 0
+    return SimulationResult(turns, winners, num_players, hits)
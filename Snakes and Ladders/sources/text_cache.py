@@ -0,0 +1,45 @@
+# File: text_cache.py
+# Shared cache for rendered text, so HUD strings that rarely change
+# (names, "Pos: N", button labels, the dice value) are rendered only once.
+from collections import OrderedDict
+
+
+class TextCache:
+    """Bounded LRU of text surfaces keyed on (font, text, color, antialias)."""
+
+    def __init__(self, max_size=256):
+        self.max_size = max_size
+        self._surfaces = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, font, text, color, antialias=True):
+        """Drop-in replacement for font.render(text, antialias, color)."""
+        key = (font, text, tuple(color), antialias)
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            self._surfaces.move_to_end(key)
+            return surface
+
+        self.misses += 1
+        surface = font.render(text, antialias, color)
+        self._surfaces[key] = surface
+        if len(self._surfaces) > self.max_size:
+            self._surfaces.popitem(last=False)
+        return surface
+
+    def clear(self):
+        self._surfaces.clear()
+
+    def stats(self):
+        """Returns (hits, misses, cached surfaces)."""
+        return self.hits, self.misses, len(self._surfaces)
+
+
+# The one cache every draw path shares
+text_cache = TextCache()
+
+
+def render_text(font, text, color, antialias=True):
+    return text_cache.render(font, text, color, antialias)
@@ -0,0 +1,94 @@
+# File: tournament.py
+# Runs very large batches of games across CPU cores.
+# The games are cut into fixed-size shards and every shard gets its own seed from
+# the master seed, so the merged result is the same for any number of workers.
+# Each shard comes back as a fixed-size GameStats (game_stats.py), so memory stays
+# flat however many games are played.
+#
+#   python tournament.py --games 10000000 --workers 8 --seed 1 --board ../boards/classic.json
+import argparse
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+import numpy as np
+
+from constants import MAX_PLAYERS
+from core import CLASSIC, STANDARD, BoardError, RuleError, load_board, parse_rules
+from game_stats import GameStats
+from simulator import simulate_games
+
+
+SHARD_SIZE = 100_000
+
+
+def _run_shard(job):
+    games, num_players, seed, layout, rules = job
+    stats = GameStats(num_players, layout)
+    stats.add_result(simulate_games(games, num_players, seed=seed, layout=layout, count_hits=True, rules=rules))
+    return stats
+
+
+def run_tournament(num_games, num_players=4, seed=0, workers=None, shard_size=SHARD_SIZE,
+                   layout=CLASSIC, rules=STANDARD):
+    """
+    Plays num_games games split into shards of shard_size and returns the merged GameStats.
+    workers=None uses every core; workers=1 runs in this process.
+    """
+    shard_count = max(1, -(-num_games // shard_size))
+    seeds = np.random.SeedSequence(seed).spawn(shard_count)
+    jobs = ((min(shard_size, num_games - i * shard_size), num_players, seeds[i], layout, rules)
+            for i in range(shard_count))
+
+    result = GameStats(num_players, layout)
+    if workers == 1:
+        for job in jobs:
+            result.merge(_run_shard(job))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            # Only a few shards are in flight at a time, so a billion games need no
+            # more memory than a thousand. The stats are sums of counters, so
+            # merging in completion order gives the same totals as shard order.
+            limit = 2 * (workers or os.cpu_count() or 1)
+            pending = set()
+            for job in jobs:
+                pending.add(pool.submit(_run_shard, job))
+                if len(pending) >= limit:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        result.merge(future.result())
+            for future in pending:
+                result.merge(future.result())
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Multi-process Snakes and Ladders tournament.")
+    parser.add_argument("--games", type=int, default=1_000_000)
+    parser.add_argument("--players", type=int, default=4)
+    parser.add_argument("--seed", type=int, default=0, help="master seed")
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--shard-size", type=int, default=SHARD_SIZE)
+    parser.add_argument("--board", default=None, help="board file (.json or .toml), classic board if omitted")
+    parser.add_argument("--rules", default="", help="house rules, e.g. bounce,extra-six,three-sixes,start-six")
+    args = parser.parse_args()
+
+    if not 1 <= args.players <= MAX_PLAYERS:
+        parser.error(f"--players must be between 1 and {MAX_PLAYERS}")
+    try:
+        layout = load_board(args.board) if args.board else CLASSIC
+        rules = parse_rules(args.rules)
+    except (BoardError, RuleError) as e:
+        parser.error(str(e))
+
+    start = time.perf_counter()
+    result = run_tournament(args.games, args.players, args.seed, args.workers, args.shard_size, layout, rules)
+    elapsed = time.perf_counter() - start
+
+    print(f"{result.num_games} games in {elapsed:.2f}s ({result.num_games / elapsed:,.0f} games/s)")
+    for line in result.summary():
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,5 @@
 import pygame
+from text_cache import render_text
 
 class Button:
     def __init__(self, rect, text, font):
@@ -9,7 +10,7 @@ class Button:
 
     def draw(self, screen):
         pygame.draw.rect(screen, self.color, self.rect, border_radius=8)
-        txt = self.font.render(self.text, True, (0,0,0))
+        txt = render_text(self.font, self.text, (0,0,0))
         txt_r = txt.get_rect(center=self.rect.center)
         screen.blit(txt, txt_r)
 
@@ -0,0 +1,106 @@
+# File: win_probability.py
+# Exact chance of winning for every player from the current positions and turn order.
+# Players never block each other, so each one is an independent copy of the
+# single-player chain in markov.py; we only combine their finishing-time tables.
+from collections import OrderedDict
+
+import numpy as np
+
+from markov import solve
+from core import CLASSIC, STANDARD
+
+
+# Up to this many players the pairwise products are cheaper than the running products
+PAIRWISE_MAX_PLAYERS = 8
+
+class WinProbability:
+    """Memoized evaluator keyed on (positions tuple, current player, six streak)."""
+
+    def __init__(self, layout=CLASSIC, rules=STANDARD, cache_size=4096):
+        self.final_tile = layout.final_tile
+        solution = solve(layout, rules)
+        self.finish, self.survival = solution.finish_table()
+        self.turns_from_streak = solution.turns_from_streak
+        # survival shifted by one turn: chance of still playing before turn k
+        self.survival_before = np.hstack([np.ones((self.final_tile, 1)), self.survival[:, :-1]])
+        self.cache_size = cache_size
+        self._cache = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def evaluate(self, positions, current_player, streak=0):
+        """
+        Returns a tuple with each player's chance of winning, in seat order.
+        streak is the number of sixes the current player has rolled this turn.
+        """
+        key = (tuple(positions), current_player, streak)
+        cached = self._cache.get(key)
+        if cached is not None:
+            self.hits += 1
+            self._cache.move_to_end(key)
+            return cached
+
+        self.misses += 1
+        result = self._compute(key[0], current_player, streak)
+        self._cache[key] = result
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return result
+
+    def _turn_tables(self, seat, pos, current_player, streak):
+        """(finish, survival, survival_before) rows of one player."""
+        if seat != current_player or streak == 0:
+            return self.finish[pos], self.survival[pos], self.survival_before[pos]
+        # Part of the current turn is already played: its first turn starts mid-streak
+        first = self.turns_from_streak[streak, pos]
+        finish = np.empty_like(self.finish[pos])
+        finish[0] = 0.0
+        finish[1:] = first[:self.final_tile] @ self.finish[:, :-1]
+        finish[1] += first[self.final_tile]
+        survival = np.clip(1.0 - np.cumsum(finish), 0.0, 1.0)
+        return finish, survival, np.concatenate([[1.0], survival[:-1]])
+
+    def _compute(self, positions, current_player, streak=0):
+        count = len(positions)
+        # Somebody already finished: the game is decided
+        if self.final_tile in positions:
+            return tuple(1.0 if pos == self.final_tile else 0.0 for pos in positions)
+
+        if count > PAIRWISE_MAX_PLAYERS:
+            return self._compute_large(positions, current_player, streak)
+
+        tables = [self._turn_tables(seat, pos, current_player, streak) for seat, pos in enumerate(positions)]
+        chances = []
+        for seat in range(count):
+            # Seat order within a round, starting from the player about to roll
+            order = (seat - current_player) % count
+            # Win on own turn k: everyone rolling earlier in round k has not finished
+            # after k turns, everyone rolling later has not finished after k - 1 turns
+            weight = tables[seat][0].copy()
+            for other in range(count):
+                if other == seat:
+                    continue
+                if (other - current_player) % count < order:
+                    weight *= tables[other][1]
+                else:
+                    weight *= tables[other][2]
+            chances.append(float(weight.sum()))
+        return tuple(chances)
+
+    def _compute_large(self, positions, current_player, streak):
+        """_compute for big tables: running products over the turn order, so 200 players cost 200 rows, not 200 x 200."""
+        count = len(positions)
+        # Seats in order within a round, starting from the player about to roll
+        order = [(current_player + k) % count for k in range(count)]
+        finish, survival, survival_before = (np.array(rows) for rows in zip(
+            *(self._turn_tables(seat, positions[seat], current_player, streak) for seat in order)))
+        # Everyone before a seat in the order must survive k turns, everyone after it k - 1
+        earlier = np.ones_like(survival)
+        earlier[1:] = np.cumprod(survival[:-1], axis=0)
+        later = np.ones_like(survival_before)
+        later[:-1] = np.cumprod(survival_before[::-1], axis=0)[::-1][1:]
+        weights = (finish * earlier * later).sum(axis=1)
+        chances = [0.0] * count
+        for k, seat in enumerate(order):
+            chances[seat] = float(weights[k])
+        return tuple(chances)